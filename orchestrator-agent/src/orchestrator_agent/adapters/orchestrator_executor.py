@@ -3,6 +3,7 @@
 import logging
 import asyncio
 import json
+import re
 from typing import Optional, Dict, Any
 
 import httpx
@@ -34,6 +35,12 @@ from .agent_discovery import agent_registry
 
 logger = get_logger(__name__)
 
+# Word tokenizer for progress-message previews (Korean, English, digits)
+_PREVIEW_WORD_PATTERN = re.compile(r'[가-힣]+|[A-Za-z]+|\d+')
+
+# Port extraction for agent-name fallback
+_AGENT_PORT_PATTERN = re.compile(r':(\d+)')
+
 
 class OrchestratorExecutor(AgentExecutor):
     """
@@ -79,12 +86,10 @@ class OrchestratorExecutor(AgentExecutor):
         Returns:
             Context-aware message
         """
-        import re
-        
         # Split query into words (handle both Korean and English)
         # Korean: split by spaces and particles
         # English: split by spaces
-        words = re.findall(r'[가-힣]+|[A-Za-z]+|\d+', query)
+        words = _PREVIEW_WORD_PATTERN.findall(query)
         
         # Get first 3 words or less
         if len(words) > 3:
@@ -151,9 +156,8 @@ class OrchestratorExecutor(AgentExecutor):
             return agent_info.get("name", "에이전트")
         
         # Fallback if not in registry
-        import re
         if ":" in agent_url:
-            port_match = re.search(r':(\d+)', agent_url)
+            port_match = _AGENT_PORT_PATTERN.search(agent_url)
             if port_match:
                 return f"에이전트-{port_match.group(1)}"
         
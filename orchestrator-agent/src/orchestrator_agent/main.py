@@ -11,6 +11,7 @@ from .common.config import config
 from .common.logging import setup_logging
 from .server.a2a_app import create_app
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 
 
 logger = logging.getLogger(__name__)
@@ -48,8 +49,11 @@ def main(host: str, port: int, log_level: str) -> None:
         logger.info(f"Starting Orchestrator Agent server on {host}:{port}")
         server = create_app(host, port)
         
-        # Build the Starlette app and add CORS middleware
+        # Build the Starlette app and add CORS and compression middleware
         app = server.build()
+        # Starlette leaves text/event-stream uncompressed so SSE frames are
+        # not held back in the compressor; JSON-RPC responses are gzipped.
+        app.add_middleware(GZipMiddleware, minimum_size=1000)
         app.add_middleware(
             CORSMiddleware,
             allow_origins=["*"],  # Allow all origins for testing
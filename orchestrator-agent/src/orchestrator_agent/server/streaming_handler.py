@@ -23,6 +23,10 @@ from a2a.utils.errors import ServerError
 
 logger = logging.getLogger(__name__)
 
+# Window (seconds) within which consecutive status updates are coalesced
+# into a single SSE frame for clients that send "Accept-Batch: 1".
+STATUS_BATCH_WINDOW = 0.02
+
 
 class StreamingRequestHandler(DefaultRequestHandler):
     """Request handler that supports A2A streaming via SSE."""
@@ -65,9 +69,11 @@ class StreamingRequestHandler(DefaultRequestHandler):
         
         # Check if this is a streaming request
         if method == "message/stream":
+            batch_status = request.headers.get("accept-batch") == "1"
+            
             # Return SSE streaming response
             return StreamingResponse(
-                self._stream_response(data),
+                self._stream_response(data, batch_status=batch_status),
                 media_type="text/event-stream",
                 headers={
                     "Cache-Control": "no-cache",
@@ -79,11 +85,15 @@ class StreamingRequestHandler(DefaultRequestHandler):
         # For non-streaming requests, use parent handler
         return await super().handle_request(request)
     
-    async def _stream_response(self, request_data: dict) -> AsyncIterator[str]:
+    async def _stream_response(
+        self, request_data: dict, batch_status: bool = False
+    ) -> AsyncIterator[str]:
         """Generate SSE stream for message/stream request.
         
         Args:
             request_data: JSON-RPC request data
+            batch_status: Coalesce bursts of non-final status updates into
+                a single "status-update-batch" event
             
         Yields:
             SSE formatted strings
@@ -119,14 +129,39 @@ class StreamingRequestHandler(DefaultRequestHandler):
             )
             
             # Stream events as they come
+            pending = None
             try:
                 while True:
                     # Get next event with timeout
                     try:
-                        event = await asyncio.wait_for(
-                            event_queue.dequeue_event(),
-                            timeout=0.1
-                        )
+                        if pending is not None:
+                            event, pending = pending, None
+                        else:
+                            event = await asyncio.wait_for(
+                                event_queue.dequeue_event(),
+                                timeout=0.1
+                            )
+                        
+                        if (
+                            batch_status
+                            and isinstance(event, TaskStatusUpdateEvent)
+                            and not event.final
+                        ):
+                            updates = [event]
+                            pending = await self._collect_status_batch(event_queue, updates)
+                            if len(updates) > 1:
+                                yield self._format_sse_event({
+                                    "jsonrpc": "2.0",
+                                    "id": request_id,
+                                    "result": {
+                                        "kind": "status-update-batch",
+                                        "updates": [
+                                            u.model_dump(mode="json", exclude_none=True)
+                                            for u in updates
+                                        ],
+                                    },
+                                })
+                                continue
                         
                         if event:
                             # Format as SSE data
@@ -182,6 +217,34 @@ class StreamingRequestHandler(DefaultRequestHandler):
             }
             yield self._format_sse_event(error_event)
     
+    async def _collect_status_batch(
+        self, event_queue: EventQueue, updates: list
+    ) -> Optional[object]:
+        """Gather further non-final status updates arriving within the batch window.
+        
+        Args:
+            event_queue: Event queue to read from
+            updates: List of status updates, extended in place
+            
+        Returns:
+            The event that ended the batch, to be sent next, or None
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + STATUS_BATCH_WINDOW
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                event = await asyncio.wait_for(
+                    event_queue.dequeue_event(),
+                    timeout=remaining
+                )
+            except asyncio.TimeoutError:
+                return None
+            if isinstance(event, TaskStatusUpdateEvent) and not event.final:
+                updates.append(event)
+            else:
+                return event
+        return None
+    
     async def _execute_with_streaming(self, context: RequestContext, event_queue: EventQueue):
         """Execute agent with streaming support.
         
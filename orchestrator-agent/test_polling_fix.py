@@ -5,6 +5,7 @@ import httpx
 import json
 import time
 import asyncio
+import sys
 
 async def test_orchestrator():
     print("Orchestrator Agent - Polling Fix Test")
@@ -85,7 +86,9 @@ async def test_orchestrator():
                                 task = poll_result.get("result", {})
                                 status = task.get("status", {}).get("state", "unknown")
                                 
-                                print(f"  Attempt {attempt + 1}: {status}")
+                                # Rewrite a single progress line instead of one line per poll
+                                sys.stdout.write(f"\r  Attempt {attempt + 1}/15: {status}")
+                                sys.stdout.flush()
                                 
                                 if status == "completed":
                                     # Get artifact
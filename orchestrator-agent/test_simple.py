@@ -3,9 +3,13 @@
 
 import httpx
 import json
-import time
+import uuid
 import sys
 
+# Connection pool shared by all requests made through the client
+LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=50, keepalive_expiry=30.0)
+
+
 def test_query(query):
     print(f"\n🔍 Testing: '{query}'")
     print("-" * 50)
@@ -13,10 +17,10 @@ def test_query(query):
     # Create message
     data = {
         "jsonrpc": "2.0",
-        "method": "message/send",
+        "method": "message/stream",
         "params": {
             "message": {
-                "messageId": f"test-{int(time.time())}",
+                "messageId": f"test-{uuid.uuid4().hex}",
                 "role": "user",
                 "parts": [{"text": query}],
                 "contextId": "test-simple"
@@ -26,53 +30,57 @@ def test_query(query):
     }
     
     try:
-        # Send request
-        print("Sending request to orchestrator...")
-        response = httpx.post(
-            "http://localhost:10002/",
-            json=data,
-            headers={"Content-Type": "application/json"},
-            timeout=10.0
-        )
-        
-        print(f"Status: {response.status_code}")
-        
-        if response.status_code == 200:
-            result = response.json()
-            print(f"Response: {json.dumps(result, indent=2, ensure_ascii=False)}")
-            
-            # Get task ID
-            if "result" in result:
-                task_id = result["result"].get("id")
-                print(f"\nTask ID: {task_id}")
-                
-                # Wait a bit
-                print("\nWaiting 2 seconds before polling...")
-                time.sleep(2)
-                
-                # Poll once
-                poll_data = {
-                    "jsonrpc": "2.0",
-                    "method": "tasks/get",
-                    "params": {"id": task_id},
-                    "id": 2
+        transport = httpx.HTTPTransport(retries=0, http2=True, limits=LIMITS)
+        with httpx.Client(timeout=10.0, transport=transport) as client:
+            # Single streaming request; finishes when the server marks the task final
+            print("Sending request to orchestrator...")
+            with client.stream(
+                "POST",
+                "http://localhost:10002/",
+                content=json.dumps(data).encode(),
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "text/event-stream"
                 }
+            ) as response:
+                print(f"Status: {response.status_code}")
+                
+                if response.status_code != 200:
+                    response.read()
+                    print(f"Error: {response.text}")
+                    return
                 
-                print("\nPolling for task status...")
-                poll_response = httpx.post(
-                    "http://localhost:10002/",
-                    json=poll_data,
-                    headers={"Content-Type": "application/json"},
-                    timeout=10.0
-                )
+                artifacts = []
+                buf = bytearray()
+                for chunk in response.iter_bytes():
+                    buf.extend(chunk)
+                    while (nl := buf.find(b"\n")) != -1:
+                        line = bytes(buf[:nl]).rstrip(b"\r")
+                        del buf[:nl + 1]
+                        event_data = line.removeprefix(b"data: ")
+                        if event_data is line or not event_data.strip():
+                            continue
+                        
+                        event = json.loads(event_data)
+                        if "error" in event:
+                            print(f"Error: {json.dumps(event['error'], ensure_ascii=False)}")
+                            return
+                        
+                        result = event.get("result", {})
+                        kind = result.get("kind")
+                        if kind == "task":
+                            print(f"\nTask ID: {result.get('id')}")
+                        elif kind == "artifact-update":
+                            artifacts.append(result.get("artifact", {}))
+                        elif kind == "status-update" and result.get("final"):
+                            final = {
+                                "state": result.get("status", {}).get("state"),
+                                "artifacts": artifacts,
+                            }
+                            print(f"Final task: {json.dumps(final, indent=2, ensure_ascii=False)}")
+                            return
                 
-                if poll_response.status_code == 200:
-                    poll_result = poll_response.json()
-                    print(f"Poll response: {json.dumps(poll_result, indent=2, ensure_ascii=False)}")
-                else:
-                    print(f"Poll failed: {poll_response.status_code} - {poll_response.text}")
-        else:
-            print(f"Error: {response.text}")
+                print("\n⚠️ Stream closed without a final status update")
             
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -83,4 +91,4 @@ if __name__ == "__main__":
     else:
         query = "안녕하세요"
     
-    test_query(query)
\ No newline at end of file
+    test_query(query)
@@ -27,15 +27,15 @@ test_queries = [
 
 phases = ["initializing", "chain_start", "plan_complete", "route_complete", "execute_complete", "aggregate_complete"]
 
-print("Testing simple message generation with first 3 words:\n")
-print("=" * 80)
+lines = ["Testing simple message generation with first 3 words:\n", "=" * 80]
 
 for query in test_queries:
-    print(f"\nQuery: {query}")
-    print("-" * 40)
+    lines.append(f"\nQuery: {query}")
+    lines.append("-" * 40)
     
     # Only show initializing phase for clarity
     message = executor._generate_context_aware_message(query, "initializing")
-    print(f"→ {message}")
+    lines.append(f"→ {message}")
 
-print("\n" + "=" * 80)
\ No newline at end of file
+lines.append("\n" + "=" * 80)
+sys.stdout.write("\n".join(lines) + "\n")
\ No newline at end of file
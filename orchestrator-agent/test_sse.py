@@ -5,8 +5,8 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-import asyncio
 import httpx
+import uvloop
 
 async def test_sse():
     """Test SSE endpoint."""
@@ -15,6 +15,7 @@ async def test_sse():
     # Test with SSE accept header
     headers = {
         "Accept": "text/event-stream",
+        "Accept-Encoding": "gzip, deflate",
         "Content-Type": "application/json"
     }
     
@@ -42,4 +43,4 @@ async def test_sse():
                     print(f"Event: {line}")
 
 if __name__ == "__main__":
-    asyncio.run(test_sse())
\ No newline at end of file
+    uvloop.run(test_sse())
\ No newline at end of file
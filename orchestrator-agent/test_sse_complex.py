@@ -1,12 +1,106 @@
 #!/usr/bin/env python3
 """Test SSE streaming with complex request."""
 
-import asyncio
+import io
 import json
 import httpx
+import uvloop
+import ijson
+import sys
 import time
+import uuid
+from collections import Counter
 from datetime import datetime
 
+
+def _prefix(start_ns: int) -> str:
+    """Build the "[wall-clock] (+elapsed)" prefix for a printed event line."""
+    elapsed = (time.monotonic_ns() - start_ns) / 1e9
+    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    return f"[{timestamp}] (+{elapsed:.2f}s)"
+
+
+def _on_task(result: dict, prefix: str, out: list) -> None:
+    """Report a task-created result."""
+    out.append(f"{prefix} ✅ Task created: {result.get('id')}")
+
+
+def _on_status(result: dict, prefix: str, out: list) -> None:
+    """Report a single status-update result."""
+    status = result.get("status", {})
+    state = status.get("state")
+    message = status.get("message")
+    
+    if isinstance(message, dict) and message.get("parts"):
+        # Extract text from message parts
+        text = message["parts"][0].get("text", "") if message["parts"] else ""
+        out.append(f"{prefix} 📌 [{state}] {text}")
+    else:
+        out.append(f"{prefix} 📌 Status: {state}")
+    
+    if result.get("final"):
+        out.append(f"{prefix} ✅ Stream completed!")
+
+
+def _on_status_batch(result: dict, prefix: str, out: list) -> None:
+    """Report coalesced status updates (sent when Accept-Batch is set)."""
+    for update in result.get("updates", []):
+        _on_status(update, prefix, out)
+
+
+def _on_artifact(result: dict, prefix: str, out: list) -> None:
+    """Report an artifact-update result with a short content preview."""
+    artifact = result.get("artifact", {})
+    name = artifact.get("name", "unnamed")
+    out.append(f"{prefix} 📄 Artifact: {name}")
+    
+    # Show preview of content
+    for part in artifact.get("parts", []):
+        if part.get("kind") == "text":
+            text = part.get("text", "")
+            preview = text[:80] + "..." if len(text) > 80 else text
+            out.append(f"            Preview: {preview}")
+
+
+def _scan_large_artifact(event_data: bytes) -> dict | None:
+    """Pull only the printed fields out of a large frame with a streaming parser.
+    
+    Returns a minimal artifact-update result, or None if the frame is some
+    other kind of event and should be parsed normally.
+    """
+    kind = None
+    artifact = {"name": "unnamed", "parts": []}
+    for prefix, _, value in ijson.parse(io.BytesIO(event_data)):
+        if prefix == "result.kind":
+            kind = value
+        elif prefix == "result.artifact.name":
+            artifact["name"] = value
+        elif prefix == "result.artifact.parts.item.text":
+            # Keep just enough for _on_artifact to build its preview
+            artifact["parts"].append({"kind": "text", "text": value[:81]})
+    if kind != "artifact-update":
+        return None
+    return {"kind": kind, "artifact": artifact}
+
+
+# Frames above this size skip full json.loads when they carry an artifact;
+# for small frames the streaming parser is slower than a plain loads.
+LARGE_EVENT_BYTES = 64 * 1024
+
+# Only this much of a large frame is searched for the artifact key; the
+# result's "artifact" object starts near the top of the frame
+SNIFF_BYTES = 1024
+_ARTIFACT_MARKER = b'"artifact"'
+
+# Event kind -> printer
+HANDLERS = {
+    "task": _on_task,
+    "status-update": _on_status,
+    "status-update-batch": _on_status_batch,
+    "artifact-update": _on_artifact,
+}
+
+
 async def test_complex_sse():
     """Test SSE with a complex multi-agent request."""
     url = "http://localhost:10002/"
@@ -21,7 +115,7 @@ async def test_complex_sse():
                 "parts": [{
                     "text": "다음을 알려줘: 1) USD/KRW 환율 2) EUR/KRW 환율 3) 100달러와 100유로를 원화로 환전하면?"
                 }],
-                "messageId": f"msg-{int(time.time())}",
+                "messageId": f"msg-{uuid.uuid4().hex}",
                 "contextId": "complex-stream-001"
             }
         },
@@ -29,93 +123,89 @@ async def test_complex_sse():
     }
     
     print("🚀 Testing SSE streaming with complex request...")
-    print(f"Request: {json.dumps(data, indent=2, ensure_ascii=False)}")
+    # Serialize once; the same text is displayed and sent as the request body
+    body = json.dumps(data, indent=2, ensure_ascii=False)
+    print(f"Request: {body}")
     print("\n" + "="*50 + "\n")
     
-    start_time = time.time()
-    events_received = []
+    start_ns = time.monotonic_ns()
+    # Tally events as they arrive instead of retaining every parsed event
+    event_count = 0
+    event_types = Counter()
     
     async with httpx.AsyncClient(timeout=60.0) as client:
         async with client.stream(
             "POST", 
             url,
-            json=data,
+            content=body.encode(),
             headers={
                 "Content-Type": "application/json",
-                "Accept": "text/event-stream"
+                "Accept": "text/event-stream",
+                "Accept-Encoding": "gzip, deflate",
+                # Let the server coalesce bursts of status updates into one frame
+                "Accept-Batch": "1"
             }
         ) as response:
             print(f"Response Status: {response.status_code}")
             print(f"Content-Type: {response.headers.get('content-type')}")
             print("\n📊 Real-time Progress:\n")
             
-            async for line in response.aiter_lines():
-                if line.startswith("data: "):
+            # Accumulate raw bytes and split on newlines ourselves; aiter_lines()
+            # re-concatenates decoded text and degrades badly on large artifacts.
+            buf = bytearray()
+            # Output lines for one network chunk, written with a single call
+            out = []
+            async for chunk in response.aiter_bytes():
+                buf.extend(chunk)
+                while (nl := buf.find(b"\n")) != -1:
+                    line = bytes(buf[:nl]).rstrip(b"\r")
+                    del buf[:nl + 1]
+                    # removeprefix() hands back the same object when the prefix is absent
+                    event_data = line.removeprefix(b"data: ")
+                    if event_data is line:
+                        continue
                     try:
-                        event_data = line[6:]
+                        if (
+                            len(event_data) > LARGE_EVENT_BYTES
+                            and event_data.find(_ARTIFACT_MARKER, 0, SNIFF_BYTES) != -1
+                        ):
+                            result = _scan_large_artifact(event_data)
+                            if result is not None:
+                                event_count += 1
+                                event_types[result["kind"]] += 1
+                                _on_artifact(result, _prefix(start_ns), out)
+                                continue
+                        
                         if event_data.strip():
-                            elapsed = time.time() - start_time
-                            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                            
                             event = json.loads(event_data)
-                            events_received.append(event)
+                            event_count += 1
                             
                             if "result" in event:
                                 result = event["result"]
-                                
-                                # Task creation
-                                if result.get("kind") == "task":
-                                    print(f"[{timestamp}] (+{elapsed:.2f}s) ✅ Task created: {result.get('id')}")
-                                
-                                # Status updates
-                                elif result.get("kind") == "status-update":
-                                    status = result.get("status", {})
-                                    state = status.get("state")
-                                    message = status.get("message")
-                                    
-                                    if isinstance(message, dict) and message.get("parts"):
-                                        # Extract text from message parts
-                                        text = message["parts"][0].get("text", "") if message["parts"] else ""
-                                        print(f"[{timestamp}] (+{elapsed:.2f}s) 📌 [{state}] {text}")
-                                    else:
-                                        print(f"[{timestamp}] (+{elapsed:.2f}s) 📌 Status: {state}")
-                                    
-                                    if result.get("final"):
-                                        print(f"[{timestamp}] (+{elapsed:.2f}s) ✅ Stream completed!")
-                                
-                                # Artifact updates
-                                elif result.get("kind") == "artifact-update":
-                                    artifact = result.get("artifact", {})
-                                    name = artifact.get("name", "unnamed")
-                                    print(f"[{timestamp}] (+{elapsed:.2f}s) 📄 Artifact: {name}")
-                                    
-                                    # Show preview of content
-                                    for part in artifact.get("parts", []):
-                                        if part.get("kind") == "text":
-                                            text = part.get("text", "")
-                                            preview = text[:80] + "..." if len(text) > 80 else text
-                                            print(f"            Preview: {preview}")
+                                kind = result.get("kind", "unknown")
+                                event_types[kind] += 1
+                                handler = HANDLERS.get(kind)
+                                if handler:
+                                    handler(result, _prefix(start_ns), out)
                                 
                     except json.JSONDecodeError as e:
-                        print(f"JSON decode error: {e}")
+                        out.append(f"JSON decode error: {e}")
                     except Exception as e:
-                        print(f"Error processing event: {e}")
+                        out.append(f"Error processing event: {e}")
+                
+                if out:
+                    out.append("")
+                    sys.stdout.write("\n".join(out))
+                    sys.stdout.flush()
+                    out.clear()
     
     # Summary
-    total_time = time.time() - start_time
+    total_time = (time.monotonic_ns() - start_ns) / 1e9
     print(f"\n📊 Summary:")
     print(f"  - Total time: {total_time:.2f}s")
-    print(f"  - Events received: {len(events_received)}")
-    
-    # Count event types
-    event_types = {}
-    for event in events_received:
-        if "result" in event:
-            kind = event["result"].get("kind", "unknown")
-            event_types[kind] = event_types.get(kind, 0) + 1
-    
-    print(f"  - Event types: {event_types}")
+    print(f"  - Events received: {event_count}")
+    print(f"  - Event types: {dict(event_types)}")
 
 if __name__ == "__main__":
     print("Testing SSE streaming with complex orchestration...\n")
-    asyncio.run(test_complex_sse())
\ No newline at end of file
+    uvloop.run(test_complex_sse())
\ No newline at end of file
@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 """Test SSE streaming with message/stream endpoint."""
 
-import asyncio
 import json
 import httpx
-import time
+import uvloop
+import uuid
 from typing import AsyncIterator
 
+# Connection pool shared by all requests made through the client
+LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=50, keepalive_expiry=30.0)
+
+
 async def test_sse_stream():
     """Test the message/stream endpoint with SSE."""
     url = "http://localhost:10002/"
@@ -19,7 +23,7 @@ async def test_sse_stream():
             "message": {
                 "role": "user",
                 "parts": [{"text": "현재 환율은 얼마야? USD to KRW"}],
-                "messageId": f"msg-{int(time.time())}",
+                "messageId": f"msg-{uuid.uuid4().hex}",
                 "contextId": "test-stream-001"
             }
         },
@@ -27,63 +31,99 @@ async def test_sse_stream():
     }
     
     print("Sending streaming request...")
-    print(f"Request: {json.dumps(data, indent=2, ensure_ascii=False)}")
+    # Serialize once; the same text is displayed and sent as the request body
+    body = json.dumps(data, indent=2, ensure_ascii=False)
+    print(f"Request: {body}")
     print("\n" + "="*50 + "\n")
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    transport = httpx.AsyncHTTPTransport(retries=0, http2=True, limits=LIMITS)
+    async with httpx.AsyncClient(timeout=30.0, transport=transport) as client:
         async with client.stream(
             "POST", 
             url,
-            json=data,
+            content=body.encode(),
             headers={
                 "Content-Type": "application/json",
-                "Accept": "text/event-stream"
+                "Accept": "text/event-stream",
+                "Accept-Encoding": "gzip, deflate"
             }
         ) as response:
             print(f"Response Status: {response.status_code}")
             print(f"Response Headers: {dict(response.headers)}")
             print("\nSSE Events:\n")
             
-            async for line in response.aiter_lines():
-                if line.startswith("data: "):
-                    try:
-                        # Parse SSE data
-                        event_data = line[6:]  # Remove "data: " prefix
-                        if event_data.strip():
-                            event = json.loads(event_data)
-                            
-                            # Extract result from JSON-RPC response
-                            if "result" in event:
-                                result = event["result"]
-                                
-                                # Check event type
-                                if result.get("kind") == "task":
-                                    print(f"📋 Task Created: {result.get('id')}")
-                                    print(f"   Status: {result.get('status', {}).get('state')}")
-                                    
-                                elif result.get("kind") == "status-update":
-                                    status = result.get("status", {})
-                                    print(f"📊 Status Update: {status.get('state')}")
-                                    if status.get("message"):
-                                        print(f"   Message: {status.get('message')}")
-                                    if result.get("final"):
-                                        print("   ✅ Final update received")
-                                        
-                                elif result.get("kind") == "artifact-update":
-                                    artifact = result.get("artifact", {})
-                                    print(f"📄 Artifact Update: {artifact.get('name', 'unnamed')}")
-                                    for part in artifact.get("parts", []):
-                                        if part.get("kind") == "text":
-                                            print(f"   Content: {part.get('text')[:100]}...")
-                                            
-                                print()
-                    except json.JSONDecodeError as e:
-                        print(f"Error parsing SSE data: {e}")
-                        print(f"Raw data: {line}")
-                elif line.strip():
-                    # Other SSE fields (event, id, retry, etc.)
-                    print(f"SSE Field: {line}")
+            # Accumulate raw bytes and split on newlines ourselves; aiter_lines()
+            # re-concatenates decoded text and degrades badly on large artifacts.
+            buf = bytearray()
+            async for chunk in response.aiter_bytes():
+                buf.extend(chunk)
+                while (nl := buf.find(b"\n")) != -1:
+                    line = bytes(buf[:nl]).rstrip(b"\r")
+                    del buf[:nl + 1]
+                    handle_line(line)
+
+
+def on_task(result: dict) -> None:
+    """Print a task-created result."""
+    print(f"📋 Task Created: {result.get('id')}")
+    print(f"   Status: {result.get('status', {}).get('state')}")
+
+
+def on_status(result: dict) -> None:
+    """Print a status-update result."""
+    status = result.get("status", {})
+    print(f"📊 Status Update: {status.get('state')}")
+    message = status.get("message")
+    if message:
+        # Print only the text parts, not the whole message object
+        for part in message.get("parts", []):
+            if "text" in part:
+                print(f"   Message: {part['text']}")
+    if result.get("final"):
+        print("   ✅ Final update received")
+
+
+def on_artifact(result: dict) -> None:
+    """Print an artifact-update result."""
+    artifact = result.get("artifact", {})
+    print(f"📄 Artifact Update: {artifact.get('name', 'unnamed')}")
+    for part in artifact.get("parts", []):
+        if part.get("kind") == "text":
+            print(f"   Content: {part.get('text')[:100]}...")
+
+
+# Event kind -> printer
+HANDLERS = {
+    "task": on_task,
+    "status-update": on_status,
+    "artifact-update": on_artifact,
+}
+
+
+def handle_line(line: bytes) -> None:
+    """Print a single SSE line received from the stream."""
+    # removeprefix() hands back the same object when the prefix is absent
+    event_data = line.removeprefix(b"data: ")
+    if event_data is not line:
+        try:
+            # Parse SSE data
+            if event_data.strip():
+                event = json.loads(event_data)
+                
+                # Extract result from JSON-RPC response
+                if "result" in event:
+                    result = event["result"]
+                    handler = HANDLERS.get(result.get("kind"))
+                    if handler:
+                        handler(result)
+                    print()
+        except json.JSONDecodeError as e:
+            print(f"Error parsing SSE data: {e}")
+            print(f"Raw data: {line.decode(errors='replace')}")
+    elif line.strip():
+        # Other SSE fields (event, id, retry, etc.)
+        print(f"SSE Field: {line.decode(errors='replace')}")
 
 if __name__ == "__main__":
     print("Testing A2A message/stream endpoint with SSE...\n")
-    asyncio.run(test_sse_stream())
\ No newline at end of file
+    uvloop.run(test_sse_stream())
\ No newline at end of file
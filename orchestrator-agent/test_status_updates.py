@@ -2,19 +2,86 @@
 """Test status updates from orchestrator."""
 
 import httpx
+import uvloop
 import json
 import asyncio
 import time
 
-async def test_with_polling(query: str):
-    """Test orchestrator with task polling to see status updates."""
+# Overall time allowed for a query to reach a final status
+COMPLETION_TIMEOUT = 10.0
+
+async def read_stream(client: httpx.AsyncClient, message: dict, completion: asyncio.Event):
+    """Read the SSE stream, printing updates, and signal completion when it ends."""
+    try:
+        # One streaming request replaces the send + tasks/get polling loop
+        async with client.stream(
+            "POST",
+            "http://localhost:10002",
+            json=message,
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "text/event-stream",
+                "Accept-Encoding": "gzip, deflate"
+            }
+        ) as response:
+            if response.status_code != 200:
+                print(f"❌ HTTP {response.status_code}")
+                return
+            
+            print("\nStreaming status updates...")
+            
+            buf = bytearray()
+            async for chunk in response.aiter_bytes():
+                buf.extend(chunk)
+                while (nl := buf.find(b"\n")) != -1:
+                    line = bytes(buf[:nl]).rstrip(b"\r")
+                    del buf[:nl + 1]
+                    event_data = line.removeprefix(b"data: ")
+                    if event_data is line:
+                        continue
+                    
+                    event = json.loads(event_data)
+                    result = event.get("result", {})
+                    kind = result.get("kind")
+                    
+                    if kind == "task":
+                        print(f"Got task ID: {result.get('id')}")
+                    
+                    elif kind == "status-update":
+                        status_obj = result.get("status", {})
+                        status_message = status_obj.get("message") or {}
+                        for part in status_message.get("parts", []):
+                            if isinstance(part, dict) and "text" in part:
+                                print(f"[{time.strftime('%H:%M:%S')}] STATUS: {part['text']}")
+                        
+                        if result.get("final"):
+                            state = status_obj.get("state")
+                            if state == "completed":
+                                print(f"\n✅ Task completed!")
+                            elif state == "failed":
+                                print(f"\n❌ Task failed")
+                            return
+                    
+                    elif kind == "artifact-update":
+                        artifact = result.get("artifact", {})
+                        if artifact.get("name") == "response.txt":
+                            for part in artifact.get("parts", []):
+                                if "text" in part:
+                                    print(f"\nFinal response:\n{part['text']}")
+            
+            print("\n⚠️ Stream closed without a final status update")
+    finally:
+        completion.set()
+
+async def test_with_stream(query: str):
+    """Test orchestrator over message/stream to see status updates as they happen."""
     print(f"\n🔍 Testing orchestrator with: '{query}'")
     print("-" * 50)
     
     # Create A2A message
     message = {
         "jsonrpc": "2.0",
-        "method": "message/send",
+        "method": "message/stream",
         "params": {
             "message": {
                 "messageId": "test-status-001",
@@ -26,81 +93,24 @@ async def test_with_polling(query: str):
         "id": 1
     }
     
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Send request
-            response = await client.post(
-                "http://localhost:10002",
-                json=message,
-                headers={"Content-Type": "application/json"}
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                task_result = result.get("result", {})
-                task_id = task_result.get("id")
-                
-                if task_id:
-                    print(f"Got task ID: {task_id}")
-                    print("\nPolling for status updates...")
-                    
-                    # Poll frequently to catch status updates
-                    prev_artifacts = []
-                    for i in range(20):
-                        await asyncio.sleep(0.5)
-                        
-                        poll_data = {
-                            "jsonrpc": "2.0",
-                            "method": "tasks/get",
-                            "params": {"id": task_id},
-                            "id": i + 2
-                        }
-                        
-                        poll_response = await client.post(
-                            "http://localhost:10002",
-                            json=poll_data,
-                            headers={"Content-Type": "application/json"}
-                        )
-                        
-                        if poll_response.status_code == 200:
-                            poll_result = poll_response.json()
-                            task = poll_result.get("result", {})
-                            status = task.get("status", {}).get("state")
-                            
-                            # Check for status message updates in task status
-                            status_obj = task.get("status", {})
-                            if isinstance(status_obj, dict) and "message" in status_obj:
-                                message = status_obj.get("message", {})
-                                if message and "parts" in message:
-                                    for part in message.get("parts", []):
-                                        if isinstance(part, dict) and "text" in part:
-                                            status_text = part["text"]
-                                            print(f"[{time.strftime('%H:%M:%S')}] STATUS: {status_text}")
-                            
-                            # Also check artifacts for backwards compatibility
-                            artifacts = task.get("artifacts", [])
-                            
-                            if status == "completed":
-                                print(f"\n✅ Task completed!")
-                                # Get final response
-                                for artifact in artifacts:
-                                    if artifact.get("name") == "response.txt":
-                                        for part in artifact.get("parts", []):
-                                            if "text" in part:
-                                                print(f"\nFinal response:\n{part['text']}")
-                                                return
-                                break
-                            elif status == "failed":
-                                print(f"\n❌ Task failed")
-                                break
-                            
-                            # Show progress
-                            print(".", end="", flush=True)
-                        
-                    print("\n⏰ Timeout waiting for completion")
-                
-    except Exception as e:
-        print(f"❌ Error: {e}")
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        completion = asyncio.Event()
+        reader = asyncio.create_task(read_stream(client, message, completion))
+        
+        # Single wait for the reader to finish; a timeout here is a real failure
+        try:
+            await asyncio.wait_for(completion.wait(), timeout=COMPLETION_TIMEOUT)
+        except asyncio.TimeoutError:
+            print("\n⏰ Timeout waiting for completion")
+        finally:
+            reader.cancel()
+        
+        try:
+            await reader
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"❌ Error: {e}")
 
 async def main():
     """Test orchestrator with status updates."""
@@ -115,8 +125,8 @@ async def main():
     ]
     
     for query in queries:
-        await test_with_polling(query)
+        await test_with_stream(query)
         await asyncio.sleep(1)
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    uvloop.run(main())
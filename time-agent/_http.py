@@ -0,0 +1,40 @@
+"""Shared HTTP client for the manual test scripts."""
+
+import atexit
+from typing import Optional
+
+import httpx
+import orjson
+
+BASE_URL = "http://localhost:10001"
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Legacy-format Tokyo time query, serialized once for every script that sends it
+TOKYO_QUERY = orjson.dumps({
+    "jsonrpc": "2.0",
+    "method": "message",
+    "params": {
+        "messages": [
+            {"role": "user", "content": "What time is it in Tokyo?"}
+        ]
+    },
+    "id": "test-1"
+})
+
+_CLIENT: Optional[httpx.Client] = None
+
+
+def client() -> httpx.Client:
+    """Return the process-wide client, creating it on first use.
+    
+    Requests from every script reuse its keep-alive connections; it is
+    closed when the interpreter exits.
+    
+    Returns:
+        Shared HTTP client for the agent server
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.Client(base_url=BASE_URL, headers=JSON_HEADERS, timeout=30.0)
+        atexit.register(_CLIENT.close)
+    return _CLIENT
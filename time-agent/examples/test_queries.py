@@ -2,13 +2,20 @@
 """Example queries for testing the time agent."""
 
 import httpx
+import uvloop
 import json
-import time
+import uuid
 import asyncio
 
 
-async def send_query(query: str, client: httpx.AsyncClient):
-    """Send a query to the time agent and get the response."""
+# Limit how many queries are in flight against the server at once
+MAX_CONCURRENT_QUERIES = 4
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def build_body(query: str) -> bytes:
+    """Serialize the JSON-RPC request for a query."""
     message = {
         "jsonrpc": "2.0",
         "method": "message",
@@ -17,21 +24,43 @@ async def send_query(query: str, client: httpx.AsyncClient):
                 {"role": "user", "content": query}
             ]
         },
-        "id": f"test-{int(time.time())}"
+        "id": f"test-{uuid.uuid4().hex}"
     }
-    
-    print(f"\n{'='*60}")
-    print(f"Query: {query}")
-    print(f"{'='*60}")
+    return json.dumps(message).encode()
+
+
+async def send_query(
+    query: str,
+    body: bytes,
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+):
+    """Send a query to the time agent and get the response.
+
+    Output is collected and printed in one block so concurrent queries
+    do not interleave their lines.
+    """
+    async with semaphore:
+        lines = await _run_query(query, body, client)
+    print("\n".join(lines))
+
+
+async def _run_query(
+    query: str, body: bytes, client: httpx.AsyncClient
+) -> list[str]:
+    """Run a single query and return the lines to print for it."""
+    lines = [f"\n{'='*60}", f"Query: {query}", f"{'='*60}"]
     
     try:
         # Send message
-        response = await client.post("http://localhost:10001/message", json=message)
+        response = await client.post(
+            "http://localhost:10001/message", content=body, headers=JSON_HEADERS
+        )
         result = response.json()
         
         if "result" in result and "task_id" in result["result"]:
             task_id = result["result"]["task_id"]
-            print(f"Task ID: {task_id}")
+            lines.append(f"Task ID: {task_id}")
             
             # Poll for completion
             for i in range(15):  # 30 seconds max
@@ -43,22 +72,24 @@ async def send_query(query: str, client: httpx.AsyncClient):
                     status = task_data.get("status")
                     
                     if status == "completed":
-                        print(f"Status: {status}")
+                        lines.append(f"Status: {status}")
                         if "artifacts" in task_data:
                             for artifact in task_data["artifacts"]:
                                 if artifact.get("type") == "text":
-                                    print(f"\nResponse: {artifact.get('data')}")
+                                    lines.append(f"\nResponse: {artifact.get('data')}")
                         break
                     elif status == "failed":
-                        print(f"Task failed: {task_data.get('error')}")
+                        lines.append(f"Task failed: {task_data.get('error')}")
                         break
                     else:
-                        print(f"Status: {status}...")
+                        lines.append(f"Status: {status}...")
         else:
-            print(f"Error: {result}")
+            lines.append(f"Error: {result}")
             
     except Exception as e:
-        print(f"Query failed: {e}")
+        lines.append(f"Query failed: {e}")
+
+    return lines
 
 
 async def main():
@@ -73,12 +104,20 @@ async def main():
         "Is it currently daylight saving time in New York?",
     ]
     
+    # Serialize every request up front; the send path only ships bytes
+    bodies = [build_body(query) for query in queries]
+    
     print("Testing Time Agent with example queries...")
     print("Server should be running at http://localhost:10001")
     
     # Test if server is running
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        # One pooled client for all queries so connections are reused
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        ) as client:
             health = await client.get("http://localhost:10001/health")
             if health.status_code != 200:
                 print("Server is not responding. Please start the server first.")
@@ -86,14 +125,18 @@ async def main():
                 
             print("Server is running!")
             
-            # Run queries
-            for query in queries:
-                await send_query(query, client)
-                await asyncio.sleep(1)  # Small delay between queries
+            # Run queries concurrently over the shared client
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+            await asyncio.gather(
+                *(
+                    send_query(query, body, client, semaphore)
+                    for query, body in zip(queries, bodies)
+                )
+            )
                 
     except httpx.ConnectError:
         print("Cannot connect to server. Please run: uv run time-agent")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    uvloop.run(main())
\ No newline at end of file
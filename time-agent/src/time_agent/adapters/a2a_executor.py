@@ -18,11 +18,13 @@ from a2a.utils import new_task, new_agent_text_message
 from a2a.utils.errors import ServerError
 
 # Internal imports - v0.4.0 architecture
+from ..common.config import settings
+from ..common.exceptions import CheckpointError, ConfigurationError
 from ..core.agent import TimeAgent
 from ..protocol import TaskManager, MessageHandler, ProtocolValidator
 from ..protocol.models import TaskStatus
 from ..streaming import EventQueue as StreamEventQueue, StreamConverter
-from ..checkpointing import A2ACheckpointer, StateSynchronizer, MemoryBackend
+from ..checkpointing import A2ACheckpointer, StateSynchronizer, LMDBBackend, MemoryBackend, StorageBackend
 from .langgraph_wrapper import LangGraphWrapper
 from .state_translator import StateTranslator
 
@@ -55,7 +57,7 @@ class TimeAgentExecutor(AgentExecutor):
         self.stream_converter = StreamConverter()
         
         # Checkpointing subsystem
-        self.storage_backend = MemoryBackend()
+        self.storage_backend = self._create_storage_backend()
         self.checkpointer = A2ACheckpointer(self.storage_backend)
         self.state_synchronizer = StateSynchronizer(
             self.task_manager,
@@ -66,6 +68,16 @@ class TimeAgentExecutor(AgentExecutor):
         self.langgraph_wrapper = LangGraphWrapper(self.agent, self.checkpointer)
         self.state_translator = StateTranslator()
         
+    @staticmethod
+    def _create_storage_backend() -> StorageBackend:
+        """Create the checkpoint storage selected by CHECKPOINT_BACKEND."""
+        if settings.checkpoint_backend == "memory":
+            return MemoryBackend()
+        if settings.checkpoint_backend == "lmdb":
+            # Persists checkpoints across restarts
+            return LMDBBackend(settings.checkpoint_path)
+        raise ConfigurationError(f"Unknown checkpoint backend: {settings.checkpoint_backend}")
+    
     async def execute(
         self,
         context: RequestContext,
@@ -113,6 +125,12 @@ class TimeAgentExecutor(AgentExecutor):
             )
             await updater.update_status(TaskState.working)
             
+            # Checkpoint the accepted input; written with the next batch
+            await self.state_synchronizer.sync_task_to_checkpoint(
+                internal_task,
+                {"id": f"{sdk_task.id}-input", "messages": messages}
+            )
+            
             # Process with agent through wrapper
             result = await self.langgraph_wrapper.execute(
                 messages=messages,
@@ -132,12 +150,15 @@ class TimeAgentExecutor(AgentExecutor):
                 # Mark task as complete
                 await updater.complete()
                 
-                # Update internal task
-                await self.task_manager.update_task_status(
-                    sdk_task.id,
-                    TaskStatus.COMPLETED,
-                    output_data=result
-                )
+                # Update internal task and persist its final checkpoint; a
+                # checkpoint failure does not fail the answered task
+                try:
+                    await self.state_synchronizer.mark_checkpoint_on_completion(
+                        sdk_task.id,
+                        result
+                    )
+                except CheckpointError:
+                    logger.exception("Failed to checkpoint completed task %s", sdk_task.id)
             else:
                 # Handle error
                 error_msg = result.get("error", "Unknown error")
@@ -150,7 +171,7 @@ class TimeAgentExecutor(AgentExecutor):
                 raise ServerError(error=InternalError(message=error_msg))
             
         except Exception as e:
-            logger.error(f"Execution error for task {sdk_task.id}: {e}")
+            logger.error("Execution error for task %s: %s", sdk_task.id, e)
             
             # Update task status to failed
             await self.task_manager.update_task_status(
@@ -177,4 +198,4 @@ class TimeAgentExecutor(AgentExecutor):
             task_id,
             TaskStatus.CANCELLED
         )
-        logger.info(f"Cancelled task {task_id}")
\ No newline at end of file
+        logger.info("Cancelled task %s", task_id)
\ No newline at end of file
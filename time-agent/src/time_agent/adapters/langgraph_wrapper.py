@@ -1,6 +1,7 @@
 """LangGraph wrapper for integration with A2A protocol."""
 
 import logging
+from collections import OrderedDict
 from typing import Any, AsyncGenerator, Dict, Optional
 
 from ..core.agent import TimeAgent
@@ -9,6 +10,9 @@ from .state_translator import StateTranslator
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of threads whose translated history is kept
+MESSAGE_CACHE_SIZE = 1024
+
 
 class LangGraphWrapper:
     """Wraps LangGraph agent for A2A protocol integration."""
@@ -27,6 +31,50 @@ class LangGraphWrapper:
         self.agent = agent
         self.checkpointer = checkpointer
         self.state_translator = StateTranslator()
+        # thread_id -> (message keys, translated LangChain messages)
+        self._msg_cache: "OrderedDict[str, tuple[list, list]]" = OrderedDict()
+    
+    def _create_state(
+        self,
+        messages: list[Dict[str, Any]],
+        thread_id: str
+    ) -> Dict[str, Any]:
+        """Create LangGraph state, translating only messages new since the last call.
+        
+        Args:
+            messages: A2A format messages
+            thread_id: Thread/conversation ID
+            
+        Returns:
+            LangGraph state dictionary
+        """
+        keys = [(msg.get("role", ""), msg.get("content", "")) for msg in messages]
+        cached = self._msg_cache.get(thread_id)
+        
+        if cached and keys == cached[0]:
+            # Same history again (e.g. a retry): nothing to translate
+            translated = cached[1]
+            self._msg_cache.move_to_end(thread_id)
+        elif cached and keys[:len(cached[0])] == cached[0]:
+            translated = cached[1] + self.state_translator.a2a_messages_to_langchain(
+                messages[len(cached[0]):]
+            )
+            self._msg_cache.move_to_end(thread_id)
+        else:
+            translated = self.state_translator.a2a_messages_to_langchain(messages)
+        
+        self._msg_cache[thread_id] = (keys, translated)
+        if len(self._msg_cache) > MESSAGE_CACHE_SIZE:
+            self._msg_cache.popitem(last=False)
+        
+        return {
+            # Runs assign message ids in place; hand out copies so cached
+            # messages never carry one run's ids into the next
+            "messages": [msg.model_copy() for msg in translated],
+            "configurable": {
+                "thread_id": thread_id
+            }
+        }
     
     async def execute(
         self,
@@ -46,10 +94,7 @@ class LangGraphWrapper:
         """
         try:
             # Create LangGraph state
-            state = self.state_translator.create_langgraph_state(
-                messages,
-                thread_id
-            )
+            state = self._create_state(messages, thread_id)
             
             # Add checkpointer config if available
             if self.checkpointer and checkpoint_id:
@@ -58,8 +103,11 @@ class LangGraphWrapper:
             # Execute agent
             result = await self.agent.invoke(state)
             
-            # Extract response
-            response = self.state_translator.extract_final_response(result)
+            # Extract response from the messages added by this run only
+            response = self.state_translator.extract_final_response(
+                result,
+                start=len(state["messages"])
+            )
             
             return {
                 "success": True,
@@ -70,7 +118,7 @@ class LangGraphWrapper:
             }
             
         except Exception as e:
-            logger.error(f"Execution error: {e}")
+            logger.error("Execution error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -95,10 +143,7 @@ class LangGraphWrapper:
         """
         try:
             # Create LangGraph state
-            state = self.state_translator.create_langgraph_state(
-                messages,
-                thread_id
-            )
+            state = self._create_state(messages, thread_id)
             
             # Add checkpointer config if available
             if self.checkpointer and checkpoint_id:
@@ -118,7 +163,7 @@ class LangGraphWrapper:
             }
             
         except Exception as e:
-            logger.error(f"Streaming error: {e}")
+            logger.error("Streaming error: %s", e)
             yield {
                 "type": "error",
                 "data": {"error": str(e)}
@@ -143,17 +188,8 @@ class LangGraphWrapper:
         
         try:
             config = {"configurable": {"thread_id": thread_id}}
-            checkpoints = await self.checkpointer.alist(config, limit)
-            
-            return [
-                {
-                    "checkpoint_id": cp[0]["configurable"].get("checkpoint_id"),
-                    "metadata": cp[1].get("metadata", {}),
-                    "timestamp": cp[1].get("ts")
-                }
-                for cp in checkpoints
-            ]
+            return await self.checkpointer.alist_metadata(config, limit)
             
         except Exception as e:
-            logger.error(f"Failed to get checkpoints: {e}")
+            logger.error("Failed to get checkpoints: %s", e)
             return []
\ No newline at end of file
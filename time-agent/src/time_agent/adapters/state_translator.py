@@ -1,13 +1,81 @@
 """State translation between A2A and LangGraph formats."""
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
 logger = logging.getLogger(__name__)
 
 
+def _user_to_a2a(msg: HumanMessage) -> Dict[str, Any]:
+    """Convert a human message to an A2A user message."""
+    return {"role": "user", "content": msg.content}
+
+
+def _assistant_to_a2a(msg: AIMessage) -> Dict[str, Any]:
+    """Convert an AI message to an A2A assistant message."""
+    a2a_msg = {"role": "assistant", "content": msg.content}
+    
+    # Include tool calls if present (non-empty)
+    match msg:
+        case AIMessage(tool_calls=[_, *_] as tool_calls):
+            a2a_msg["tool_calls"] = tool_calls
+    
+    return a2a_msg
+
+
+def _system_to_a2a(msg: SystemMessage) -> Dict[str, Any]:
+    """Convert a system message to an A2A system message."""
+    return {"role": "system", "content": msg.content}
+
+
+def _unknown_to_a2a(msg: Any) -> Dict[str, Any]:
+    """Fallback for message types without a dedicated converter."""
+    return {"role": "unknown", "content": str(msg)}
+
+
+# Message class -> A2A converter. Subclasses (e.g. AIMessageChunk) are
+# resolved through their MRO on first sight and cached here.
+_LC_TO_A2A: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    HumanMessage: _user_to_a2a,
+    AIMessage: _assistant_to_a2a,
+    SystemMessage: _system_to_a2a,
+}
+
+# A2A role -> LangChain message class
+_ROLE_TO_LC: Dict[str, type] = {
+    "user": HumanMessage,
+    "assistant": AIMessage,
+    "system": SystemMessage,
+}
+
+
+def _lc_converter(msg_type: type) -> Callable[[Any], Dict[str, Any]]:
+    """Find the A2A converter for a LangChain message class."""
+    converter = _LC_TO_A2A.get(msg_type)
+    if converter is None:
+        converter = next(
+            (_LC_TO_A2A[base] for base in msg_type.__mro__ if base in _LC_TO_A2A),
+            _unknown_to_a2a
+        )
+        _LC_TO_A2A[msg_type] = converter
+    return converter
+
+
+def _a2a_to_lc(msg: Dict[str, Any]) -> Any:
+    """Convert one A2A message to a LangChain message."""
+    role = msg.get("role", "")
+    message_class = _ROLE_TO_LC.get(role)
+    
+    if message_class is None:
+        # Default to human message
+        logger.warning("Unknown role '%s', defaulting to user", role)
+        message_class = HumanMessage
+    
+    return message_class(content=msg.get("content", ""))
+
+
 class StateTranslator:
     """Translates state between A2A protocol and LangGraph formats."""
     
@@ -21,24 +89,7 @@ class StateTranslator:
         Returns:
             List of LangChain message objects
         """
-        langchain_messages = []
-        
-        for msg in messages:
-            role = msg.get("role", "")
-            content = msg.get("content", "")
-            
-            if role == "user":
-                langchain_messages.append(HumanMessage(content=content))
-            elif role == "assistant":
-                langchain_messages.append(AIMessage(content=content))
-            elif role == "system":
-                langchain_messages.append(SystemMessage(content=content))
-            else:
-                # Default to human message
-                logger.warning(f"Unknown role '{role}', defaulting to user")
-                langchain_messages.append(HumanMessage(content=content))
-        
-        return langchain_messages
+        return [_a2a_to_lc(msg) for msg in messages]
     
     @staticmethod
     def langchain_messages_to_a2a(messages: List[Any]) -> List[Dict[str, Any]]:
@@ -50,38 +101,7 @@ class StateTranslator:
         Returns:
             List of A2A message dictionaries
         """
-        a2a_messages = []
-        
-        for msg in messages:
-            if isinstance(msg, HumanMessage):
-                a2a_messages.append({
-                    "role": "user",
-                    "content": msg.content
-                })
-            elif isinstance(msg, AIMessage):
-                a2a_msg = {
-                    "role": "assistant",
-                    "content": msg.content
-                }
-                
-                # Include tool calls if present
-                if hasattr(msg, "tool_calls") and msg.tool_calls:
-                    a2a_msg["tool_calls"] = msg.tool_calls
-                
-                a2a_messages.append(a2a_msg)
-            elif isinstance(msg, SystemMessage):
-                a2a_messages.append({
-                    "role": "system",
-                    "content": msg.content
-                })
-            else:
-                # Generic handling
-                a2a_messages.append({
-                    "role": "unknown",
-                    "content": str(msg)
-                })
-        
-        return a2a_messages
+        return [_lc_converter(type(msg))(msg) for msg in messages]
     
     @staticmethod
     def create_langgraph_state(
@@ -105,21 +125,23 @@ class StateTranslator:
         }
     
     @staticmethod
-    def extract_final_response(state: Dict[str, Any]) -> str:
+    def extract_final_response(state: Dict[str, Any], start: int = 0) -> str:
         """Extract final response from LangGraph state.
         
         Args:
             state: LangGraph state
+            start: Index of the first message produced by the run; earlier
+                history is not scanned
             
         Returns:
             Final response text
         """
         messages = state.get("messages", [])
         
-        # Find last AI message
-        for msg in reversed(messages):
-            if isinstance(msg, AIMessage):
-                return msg.content
+        # Find last AI message among the run's own messages
+        for i in range(len(messages) - 1, start - 1, -1):
+            if isinstance(messages[i], AIMessage):
+                return messages[i].content
         
         return "No response generated"
     
@@ -1,13 +1,52 @@
 """Stream converter adapter for bridging subsystems."""
 
 import logging
+from contextlib import aclosing
 from typing import Any, AsyncGenerator, Dict, Optional
 
-from ..streaming.event_queue import EventQueue
+from ..streaming.event_queue import EventQueue, TaskEvent
 from ..streaming.stream_converter import StreamConverter as BaseStreamConverter
 
 logger = logging.getLogger(__name__)
 
+# Converted events are queued in batches of up to QUEUE_BATCH_SIZE, or
+# sooner once no new event has arrived for QUEUE_LINGER seconds
+QUEUE_BATCH_SIZE = 32
+QUEUE_LINGER = 0.005
+
+
+def _agent_response(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Transform an AI message event to an A2A agent response."""
+    return {
+        "type": "agent_response",
+        "content": data.get("content", ""),
+        "tool_calls": data.get("tool_calls", [])
+    }
+
+
+def _tool_invocation(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Transform a tool call event to an A2A tool invocation."""
+    return {
+        "type": "tool_invocation",
+        "tools": data
+    }
+
+
+def _task_complete(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Transform a stream end event to an A2A task completion."""
+    return {
+        "type": "task_complete",
+        "final": True
+    }
+
+
+# Event type -> A2A transform; other event types pass through unchanged
+_A2A_TRANSFORMS = {
+    "ai_message": _agent_response,
+    "tool_call": _tool_invocation,
+    "stream_end": _task_complete,
+}
+
 
 class StreamConverterAdapter:
     """Adapter for stream conversion between subsystems."""
@@ -32,24 +71,24 @@ class StreamConverterAdapter:
             agent_stream: Raw agent stream
             task_id: Associated task ID
         """
-        try:
-            async for event in self.base_converter.convert_agent_stream(agent_stream):
-                # Add task ID to event
-                event["task_id"] = task_id
-                
-                # Queue the event
-                await self.event_queue.put(event)
+        batches = self.base_converter.convert_agent_stream_batched(
+            agent_stream, QUEUE_BATCH_SIZE, QUEUE_LINGER
+        )
+        
+        # aclosing cancels the batcher's pending fetch if publishing fails
+        async with aclosing(batches):
+            try:
+                async for batch in batches:
+                    await self.event_queue.put_many(
+                        [TaskEvent(task_id, event.type, event.data) for event in batch.data]
+                    )
+                    
+            except Exception as e:
+                logger.error("Stream conversion error for task %s: %s", task_id, e)
                 
-        except Exception as e:
-            logger.error(f"Stream conversion error for task {task_id}: {e}")
-            
-            # Queue error event
-            error_event = {
-                "type": "error",
-                "task_id": task_id,
-                "data": {"error": str(e)}
-            }
-            await self.event_queue.put(error_event)
+                # Events of the batch that failed to publish are dropped;
+                # only the error event is published
+                await self.event_queue.put(TaskEvent(task_id, "error", {"error": str(e)}))
     
     async def bridge_to_a2a(
         self,
@@ -65,25 +104,8 @@ class StreamConverterAdapter:
         """
         async for event in self.base_converter.convert_agent_stream(agent_stream):
             # Transform to A2A format
-            if event["type"] == "ai_message":
-                yield {
-                    "type": "agent_response",
-                    "content": event["data"].get("content", ""),
-                    "tool_calls": event["data"].get("tool_calls", [])
-                }
-            
-            elif event["type"] == "tool_call":
-                yield {
-                    "type": "tool_invocation",
-                    "tools": event["data"]
-                }
-            
-            elif event["type"] == "stream_end":
-                yield {
-                    "type": "task_complete",
-                    "final": True
-                }
-            
+            transform = _A2A_TRANSFORMS.get(event.type)
+            if transform:
+                yield transform(event.data)
             else:
-                # Pass through other events
-                yield event
\ No newline at end of file
+                yield {"type": event.type, "data": event.data}
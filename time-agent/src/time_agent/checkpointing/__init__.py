@@ -1,12 +1,14 @@
 """Checkpointing subsystem for state persistence."""
 
 from .a2a_checkpointer import A2ACheckpointer
+from .lmdb_backend import LMDBBackend
 from .memory_backend import MemoryBackend
 from .state_synchronizer import StateSynchronizer
 from .storage_backend import StorageBackend
 
 __all__ = [
     "A2ACheckpointer",
+    "LMDBBackend",
     "MemoryBackend",
     "StateSynchronizer",
     "StorageBackend",
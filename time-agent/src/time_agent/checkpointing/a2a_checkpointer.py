@@ -1,16 +1,23 @@
 """Custom LangGraph checkpointer for A2A integration."""
 
-import json
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
 from langgraph.checkpoint.base import BaseCheckpointSaver, Checkpoint
 
+from ..common.exceptions import CheckpointError
 from .storage_backend import StorageBackend
 from .memory_backend import MemoryBackend
 
 logger = logging.getLogger(__name__)
 
+# Separates the serializer type tag from the payload in stored bytes
+_TYPE_SEP = b":"
+
+# Number of checkpoint payloads alist loads per storage call
+LIST_PAGE_SIZE = 10
+
 
 class A2ACheckpointer(BaseCheckpointSaver):
     """LangGraph checkpointer that integrates with A2A protocol."""
@@ -23,10 +30,113 @@ class A2ACheckpointer(BaseCheckpointSaver):
         """
         super().__init__()
         self.storage = storage or MemoryBackend()
+        
+        # Write-back queue of (thread_id, checkpoint_id, payload, metadata); the
+        # writer task is started on first use since there may be no running loop yet
+        self._write_queue: asyncio.Queue[Tuple[str, str, bytes, Dict[str, Any]]] = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
+        # thread_id -> first background write failure of that thread since
+        # the thread was last flushed
+        self._write_errors: Dict[str, CheckpointError] = {}
+    
+    def _encode(self, data: Dict[str, Any]) -> bytes:
+        """Serialize checkpoint data once into the bytes handed to storage."""
+        type_, payload = self.serde.dumps_typed(data)
+        return type_.encode() + _TYPE_SEP + payload
+    
+    def _decode(self, payload: bytes) -> Dict[str, Any]:
+        """Deserialize bytes produced by ``_encode``."""
+        type_, _, data = payload.partition(_TYPE_SEP)
+        return self.serde.loads_typed((type_.decode(), data))
+    
+    def _ensure_writer(self) -> None:
+        """Start the background writer task if it is not running."""
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._drain())
+    
+    async def _drain(self) -> None:
+        """Persist queued checkpoints, coalescing repeated writes of the same key."""
+        while True:
+            thread_id, checkpoint_id, data, metadata = await self._write_queue.get()
+            batch: Dict[Tuple[str, str], Tuple[bytes, Dict[str, Any]]] = {
+                (thread_id, checkpoint_id): (data, metadata)
+            }
+            taken = 1
+            while not self._write_queue.empty():
+                thread_id, checkpoint_id, data, metadata = self._write_queue.get_nowait()
+                # Re-insert so the newest write of a key keeps its save order
+                batch.pop((thread_id, checkpoint_id), None)
+                batch[(thread_id, checkpoint_id)] = (data, metadata)
+                taken += 1
+            
+            try:
+                results = await asyncio.gather(
+                    *(
+                        self.storage.save_checkpoint(t_id, cp_id, cp_data, cp_metadata)
+                        for (t_id, cp_id), (cp_data, cp_metadata) in batch.items()
+                    ),
+                    return_exceptions=True
+                )
+                for (t_id, cp_id), result in zip(batch, results):
+                    if result is not True:
+                        logger.error("Failed to save checkpoint %s for thread %s: %s", cp_id, t_id, result)
+                        self._write_errors.setdefault(t_id, CheckpointError(
+                            f"Failed to save checkpoint {cp_id} for thread {t_id}: {result}"
+                        ))
+            finally:
+                for _ in range(taken):
+                    self._write_queue.task_done()
+    
+    async def _wait_for_writes(self) -> None:
+        """Wait for queued writes to finish without reporting failures."""
+        if self._writer_task is not None:
+            await self._write_queue.join()
+    
+    async def flush(self, thread_id: Optional[str] = None) -> None:
+        """Wait until all queued checkpoint writes have been persisted.
+        
+        Raises CheckpointError if a queued write failed since the last
+        flush, as aput had already returned for it. Each failure is
+        reported once, and only for its own thread.
+        
+        Args:
+            thread_id: Report failures of this thread only; all threads
+                when omitted
+        """
+        await self._wait_for_writes()
+        
+        if thread_id is not None:
+            error = self._write_errors.pop(thread_id, None)
+            if error is not None:
+                raise error
+            return
+        
+        errors, self._write_errors = self._write_errors, {}
+        if len(errors) == 1:
+            raise next(iter(errors.values()))
+        if errors:
+            raise CheckpointError("; ".join(str(error) for error in errors.values()))
+    
+    async def close(self) -> None:
+        """Stop the background writer; queued writes not yet saved are dropped.
+        
+        Call flush() first to persist them.
+        """
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
     
     async def aget(self, config: Dict[str, Any]) -> Optional[Checkpoint]:
         """Get a checkpoint.
         
+        Queued writes are persisted first, and a failed one of this thread
+        is raised as CheckpointError rather than silently returning older
+        state, as is a failure to load the checkpoint.
+        
         Args:
             config: Configuration with thread_id and optional checkpoint_id
             
@@ -39,27 +149,40 @@ class A2ACheckpointer(BaseCheckpointSaver):
         if not thread_id:
             return None
         
+        # Read-your-writes: persist anything still queued first
+        await self.flush(thread_id)
+        
         try:
             data = await self.storage.load_checkpoint(thread_id, checkpoint_id)
-            if data:
-                return Checkpoint(**data)
-            return None
         except Exception as e:
-            logger.error(f"Failed to load checkpoint: {e}")
-            return None
+            raise CheckpointError(f"Failed to load checkpoint for thread {thread_id}: {e}") from e
+        
+        if data:
+            return Checkpoint(**self._decode(data))
+        return None
     
     async def aput(
         self,
         config: Dict[str, Any],
         checkpoint: Checkpoint,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        new_versions: Optional[Dict[str, Any]] = None,
+        *,
+        durable: bool = False
     ) -> Dict[str, Any]:
         """Save a checkpoint.
         
+        By default the write is queued and persisted in the background, so
+        graph execution does not wait on storage; a failure is raised by
+        the next flush or aget. Use ``durable=True`` to write through and
+        wait for the backend; a failed durable write raises CheckpointError.
+        
         Args:
             config: Configuration with thread_id
             checkpoint: Checkpoint to save
             metadata: Optional metadata
+            new_versions: Channel versions written by this step (unused)
+            durable: Persist before returning instead of queueing
             
         Returns:
             Updated configuration
@@ -73,83 +196,137 @@ class A2ACheckpointer(BaseCheckpointSaver):
         checkpoint_id = checkpoint.get("id", f"cp_{checkpoint.get('ts', 'unknown')}")
         
         try:
-            # Prepare checkpoint data
-            checkpoint_data = {
+            metadata = metadata or {}
+            
+            # Serialize once; storage keeps the bytes as-is
+            checkpoint_data = self._encode({
                 **checkpoint,
-                "metadata": metadata or {}
-            }
+                "metadata": metadata
+            })
             
-            # Save checkpoint
-            success = await self.storage.save_checkpoint(
-                thread_id,
-                checkpoint_id,
-                checkpoint_data
-            )
+            if durable:
+                # Keep ordering with any earlier queued writes
+                await self._wait_for_writes()
+                success = await self.storage.save_checkpoint(
+                    thread_id,
+                    checkpoint_id,
+                    checkpoint_data,
+                    metadata
+                )
+            else:
+                self._ensure_writer()
+                self._write_queue.put_nowait(
+                    (thread_id, checkpoint_id, checkpoint_data, metadata)
+                )
+                success = True
             
             if success:
-                logger.info(f"Saved checkpoint {checkpoint_id} for thread {thread_id}")
+                action = "Saved" if durable else "Queued"
+                logger.info("%s checkpoint %s for thread %s", action, checkpoint_id, thread_id)
                 
-                # Return updated config
-                return {
-                    **config,
-                    "configurable": {
-                        **config.get("configurable", {}),
-                        "checkpoint_id": checkpoint_id
-                    }
+                # Return updated config (shallow copy, new configurable only)
+                new_config = dict(config)
+                new_config["configurable"] = {
+                    **config.get("configurable", {}),
+                    "checkpoint_id": checkpoint_id
                 }
+                return new_config
             else:
-                raise RuntimeError("Failed to save checkpoint")
+                raise CheckpointError(
+                    f"Failed to save checkpoint {checkpoint_id} for thread {thread_id}"
+                )
                 
-        except Exception as e:
-            logger.error(f"Failed to save checkpoint: {e}")
+        except CheckpointError:
             raise
+        except Exception as e:
+            raise CheckpointError(
+                f"Failed to save checkpoint {checkpoint_id} for thread {thread_id}: {e}"
+            ) from e
     
     async def alist(
         self,
         config: Dict[str, Any],
         limit: int = 10
-    ) -> list[tuple[Dict[str, Any], Checkpoint]]:
-        """List checkpoints for a thread.
+    ) -> AsyncIterator[tuple[Dict[str, Any], Checkpoint]]:
+        """List checkpoints for a thread, newest first.
+        
+        Payloads are loaded a page at a time, so a caller that stops
+        iterating early does not pay for the rest.
         
         Args:
             config: Configuration with thread_id
             limit: Maximum number to return
             
-        Returns:
-            List of (config, checkpoint) tuples
+        Yields:
+            (config, checkpoint) tuples
         """
         thread_id = config.get("configurable", {}).get("thread_id")
         
         if not thread_id:
-            return []
+            return
         
         try:
+            await self._wait_for_writes()
             checkpoints = await self.storage.list_checkpoints(thread_id, limit)
+            base_configurable = config.get("configurable", {})
             
-            result = []
-            for cp_meta in checkpoints:
-                cp_config = {
-                    **config,
-                    "configurable": {
-                        **config.get("configurable", {}),
-                        "checkpoint_id": cp_meta["id"]
-                    }
-                }
-                
-                # Load full checkpoint data
-                cp_data = await self.storage.load_checkpoint(
+            for start in range(0, len(checkpoints), LIST_PAGE_SIZE):
+                page = checkpoints[start:start + LIST_PAGE_SIZE]
+                datas = await self.storage.batch_load_checkpoint(
                     thread_id,
-                    cp_meta["id"]
+                    [cp_meta["id"] for cp_meta in page]
                 )
                 
-                if cp_data:
-                    result.append((cp_config, Checkpoint(**cp_data)))
-            
-            return result
+                for cp_meta, cp_data in zip(page, datas):
+                    if not cp_data:
+                        continue
+                    
+                    cp_config = dict(config)
+                    cp_config["configurable"] = {
+                        **base_configurable,
+                        "checkpoint_id": cp_meta["id"]
+                    }
+                    yield cp_config, Checkpoint(**self._decode(cp_data))
             
         except Exception as e:
-            logger.error(f"Failed to list checkpoints: {e}")
+            logger.error("Failed to list checkpoints: %s", e)
+    
+    async def alist_metadata(
+        self,
+        config: Dict[str, Any],
+        limit: int = 10
+    ) -> list[Dict[str, Any]]:
+        """List checkpoint metadata for a thread without loading payloads.
+        
+        Raises CheckpointError if the metadata cannot be read.
+        
+        Args:
+            config: Configuration with thread_id
+            limit: Maximum number to return
+            
+        Returns:
+            List of checkpoint_id/metadata/timestamp dicts, newest first
+        """
+        thread_id = config.get("configurable", {}).get("thread_id")
+        
+        if not thread_id:
             return []
+        
+        try:
+            await self._wait_for_writes()
+            checkpoints = await self.storage.list_checkpoints_meta(thread_id, limit)
+            
+            return [
+                {
+                    "checkpoint_id": cp_meta["id"],
+                    "metadata": cp_meta["metadata"],
+                    "timestamp": cp_meta["created_at"]
+                }
+                for cp_meta in checkpoints
+            ]
+            
+        except Exception as e:
+            raise CheckpointError(f"Failed to list checkpoints for thread {thread_id}: {e}") from e
     
     def get(self, config: Dict[str, Any]) -> Optional[Checkpoint]:
         """Sync version of get (not implemented)."""
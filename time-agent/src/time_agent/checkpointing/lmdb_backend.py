@@ -0,0 +1,412 @@
+"""LMDB storage backend for checkpointing."""
+
+import asyncio
+import hashlib
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import lmdb
+import orjson
+import zstandard as zstd
+
+from .storage_backend import StorageBackend
+
+# Payload record tags: stored as-is, zstd-compressed, or offloaded to a
+# compressed blob file next to the environment (the record then holds the
+# file name)
+_RAW = b"r"
+_ZSTD = b"z"
+_BLOB = b"f"
+
+# zstd level for stored payloads
+ZSTD_LEVEL = 3
+
+
+def _prefix(thread_id: str) -> bytes:
+    """Key prefix shared by all records of a thread.
+    
+    The thread ID is length-prefixed so no thread's prefix can be a prefix
+    of another's, whatever characters the IDs contain.
+    """
+    encoded = thread_id.encode()
+    return len(encoded).to_bytes(4, "big") + encoded
+
+
+def _prefix_end(prefix: bytes) -> bytes:
+    """Smallest key sorting after every key that starts with ``prefix``."""
+    stripped = prefix.rstrip(b"\xff")
+    return stripped[:-1] + bytes([stripped[-1] + 1])
+
+
+def _format_ns(timestamp_ns: int) -> str:
+    """Format an epoch timestamp in nanoseconds as a naive UTC ISO string."""
+    return datetime.fromtimestamp(
+        timestamp_ns / 1e9, tz=timezone.utc
+    ).replace(tzinfo=None).isoformat()
+
+
+class LMDBBackend(StorageBackend):
+    """Memory-mapped, on-disk implementation of checkpoint storage.
+    
+    Three named databases are used, all keyed under a per-thread prefix:
+    ``payloads`` (``<thread>checkpoint_id`` -> payload bytes), ``meta``
+    (same key -> JSON record) and ``order`` (``<thread><sequence><id>``
+    -> checkpoint ID), the latter giving save-ordered prefix scans. The
+    sequence is per thread and counts up from the thread's newest order
+    key, so the order does not depend on the wall clock.
+    Payloads above ``compress_threshold`` bytes are zstd-compressed, and
+    those still above ``offload_threshold`` once compressed are written to
+    new files under ``<path>/blobs`` with only the file name kept in LMDB.
+    LMDB calls block, so each operation runs in a worker thread.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        map_size: int = 1 << 30,
+        compress_threshold: int = 1024,
+        offload_threshold: int = 256 * 1024
+    ):
+        """Initialize LMDB backend.
+        
+        Args:
+            path: Directory holding the LMDB environment
+            map_size: Maximum size of the memory map in bytes
+            compress_threshold: Payloads up to this size are stored uncompressed
+            offload_threshold: Compressed payloads above this size go to blob files
+        """
+        self.compress_threshold = compress_threshold
+        self.offload_threshold = offload_threshold
+        self._blob_dir = os.path.join(path, "blobs")
+        os.makedirs(self._blob_dir, exist_ok=True)
+        
+        self._env = lmdb.open(path, map_size=map_size, max_dbs=3)
+        self._payloads = self._env.open_db(b"payloads")
+        self._meta = self._env.open_db(b"meta")
+        self._order = self._env.open_db(b"order")
+    
+    def _iter_order(self, txn: lmdb.Transaction, thread_id: str, newest_first: bool):
+        """Iterate (order key, checkpoint ID) pairs of a thread."""
+        prefix = _prefix(thread_id)
+        cursor = txn.cursor(db=self._order)
+        
+        if newest_first:
+            # Position past the prefix range, then walk backwards into it
+            found = cursor.last() if not cursor.set_range(_prefix_end(prefix)) else cursor.prev()
+            while found and cursor.key().startswith(prefix):
+                yield cursor.key(), cursor.value()
+                found = cursor.prev()
+        else:
+            found = cursor.set_range(prefix)
+            while found and cursor.key().startswith(prefix):
+                yield cursor.key(), cursor.value()
+                found = cursor.next()
+    
+    def _next_order_key(self, txn: lmdb.Transaction, thread_id: str, checkpoint_id: str) -> bytes:
+        """Order key sorting after every existing checkpoint of the thread."""
+        prefix = _prefix(thread_id)
+        newest = next(self._iter_order(txn, thread_id, newest_first=True), None)
+        sequence = 0
+        if newest is not None:
+            sequence = int.from_bytes(newest[0][len(prefix):len(prefix) + 8], "big") + 1
+        return prefix + sequence.to_bytes(8, "big") + checkpoint_id.encode()
+    
+    def _blob_path(self, record: bytes) -> str:
+        """File holding the payload of an offloaded record."""
+        return os.path.join(self._blob_dir, record[1:].decode())
+    
+    def _pack(self, key: bytes, data: bytes) -> bytes:
+        """Build the payload record, offloading large payloads to a blob file.
+        
+        Every offload gets a new file, so a blob referenced by a committed
+        record is never overwritten; the caller removes the new file if its
+        record does not commit.
+        """
+        if len(data) <= self.compress_threshold:
+            return _RAW + data
+        
+        compressed = zstd.compress(data, ZSTD_LEVEL)
+        if len(compressed) <= self.offload_threshold:
+            return _ZSTD + compressed
+        
+        record = _BLOB + f"{hashlib.sha256(key).hexdigest()}-{uuid.uuid4().hex}".encode()
+        with open(self._blob_path(record), "wb") as f:
+            f.write(compressed)
+        return record
+    
+    def _unpack(self, record: Optional[bytes]) -> Optional[bytes]:
+        """Get the payload back from a record built by ``_pack``."""
+        if record is None:
+            return None
+        
+        tag, body = record[:1], record[1:]
+        if tag == _RAW:
+            return body
+        if tag == _ZSTD:
+            return zstd.decompress(body)
+        
+        with open(self._blob_path(record), "rb") as f:
+            return zstd.decompress(f.read())
+    
+    def _delete(self, txn: lmdb.Transaction, key: bytes, meta: Dict[str, Any]) -> Optional[str]:
+        """Remove one checkpoint from all databases.
+        
+        Returns:
+            Blob file to unlink once the transaction has committed, if any
+        """
+        record = txn.get(key, db=self._payloads)
+        txn.delete(key, db=self._payloads)
+        txn.delete(key, db=self._meta)
+        txn.delete(bytes.fromhex(meta["order_key"]), db=self._order)
+        return self._blob_path(record) if record[:1] == _BLOB else None
+    
+    def _unlink(self, blob_paths: List[Optional[str]]) -> None:
+        """Remove blob files of deleted or replaced checkpoints."""
+        for blob_path in blob_paths:
+            if blob_path:
+                try:
+                    os.remove(blob_path)
+                except FileNotFoundError:
+                    pass
+    
+    def _save(
+        self,
+        thread_id: str,
+        checkpoint_id: str,
+        data: bytes,
+        metadata: Optional[Dict[str, Any]]
+    ) -> bool:
+        """Write a checkpoint, replacing any earlier save of the same ID."""
+        key = _prefix(thread_id) + checkpoint_id.encode()
+        created_at = time.time_ns()
+        record = self._pack(key, data)
+        stale_blob = None
+        
+        try:
+            with self._env.begin(write=True) as txn:
+                # Taken in the write transaction, which LMDB runs one at a time
+                order_key = self._next_order_key(txn, thread_id, checkpoint_id)
+                version = 1
+                existing = txn.get(key, db=self._meta)
+                if existing is not None:
+                    # A re-saved checkpoint becomes the newest one
+                    previous = orjson.loads(existing)
+                    version = previous["version"] + 1
+                    txn.delete(bytes.fromhex(previous["order_key"]), db=self._order)
+                    
+                    previous_record = txn.get(key, db=self._payloads)
+                    if previous_record[:1] == _BLOB:
+                        stale_blob = self._blob_path(previous_record)
+                
+                txn.put(key, record, db=self._payloads)
+                # Metadata values without a JSON form are stored as strings
+                txn.put(key, orjson.dumps({
+                    "created_at": created_at,
+                    "version": version,
+                    "metadata": metadata or {},
+                    "order_key": order_key.hex()
+                }, default=str, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z), db=self._meta)
+                txn.put(order_key, checkpoint_id.encode(), db=self._order)
+        except BaseException:
+            # The previous record, and its blob, are still the committed ones
+            if record[:1] == _BLOB:
+                self._unlink([self._blob_path(record)])
+            raise
+        
+        self._unlink([stale_blob])
+        return True
+    
+    def _load(self, thread_id: str, checkpoint_id: Optional[str]) -> Optional[bytes]:
+        """Read one payload, or the latest one of the thread."""
+        with self._env.begin() as txn:
+            if not checkpoint_id:
+                # Latest checkpoint
+                latest = next(self._iter_order(txn, thread_id, newest_first=True), None)
+                if latest is None:
+                    return None
+                checkpoint_id = latest[1].decode()
+            
+            key = _prefix(thread_id) + checkpoint_id.encode()
+            return self._unpack(txn.get(key, db=self._payloads))
+    
+    def _batch_load(self, thread_id: str, checkpoint_ids: List[str]) -> List[Optional[bytes]]:
+        """Read several payloads in one transaction."""
+        prefix = _prefix(thread_id)
+        with self._env.begin() as txn:
+            keys = [prefix + checkpoint_id.encode() for checkpoint_id in checkpoint_ids]
+            return [self._unpack(txn.get(key, db=self._payloads)) for key in keys]
+    
+    def _list(self, thread_id: str, limit: int, with_metadata: bool) -> List[Dict[str, Any]]:
+        """List a thread's checkpoints, newest first."""
+        prefix = _prefix(thread_id)
+        result = []
+        
+        with self._env.begin() as txn:
+            for _, checkpoint_id in self._iter_order(txn, thread_id, newest_first=True):
+                if len(result) >= limit:
+                    break
+                
+                meta = orjson.loads(txn.get(prefix + checkpoint_id, db=self._meta))
+                entry = {
+                    "id": checkpoint_id.decode(),
+                    "created_at": _format_ns(meta["created_at"])
+                }
+                if with_metadata:
+                    entry["metadata"] = meta["metadata"]
+                else:
+                    entry["thread_id"] = thread_id
+                    entry["version"] = meta["version"]
+                result.append(entry)
+        
+        return result
+    
+    def _delete_one(self, thread_id: str, checkpoint_id: str) -> bool:
+        """Delete one checkpoint if it exists."""
+        key = _prefix(thread_id) + checkpoint_id.encode()
+        with self._env.begin(write=True) as txn:
+            existing = txn.get(key, db=self._meta)
+            if existing is None:
+                return False
+            blob_path = self._delete(txn, key, orjson.loads(existing))
+        
+        self._unlink([blob_path])
+        return True
+    
+    def _cleanup(self, thread_id: str, keep_count: int) -> int:
+        """Delete all but the newest keep_count checkpoints of a thread."""
+        prefix = _prefix(thread_id)
+        with self._env.begin(write=True) as txn:
+            # Oldest first; collect before deleting so the cursor stays valid
+            ordered = [cp_id for _, cp_id in self._iter_order(txn, thread_id, newest_first=False)]
+            stale = ordered[:max(len(ordered) - keep_count, 0)]
+            
+            blob_paths = [
+                self._delete(txn, prefix + cp_id, orjson.loads(txn.get(prefix + cp_id, db=self._meta)))
+                for cp_id in stale
+            ]
+        
+        self._unlink(blob_paths)
+        return len(stale)
+    
+    async def save_checkpoint(
+        self,
+        thread_id: str,
+        checkpoint_id: str,
+        data: bytes,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Save a checkpoint to LMDB.
+        
+        Args:
+            thread_id: Thread/conversation ID
+            checkpoint_id: Checkpoint ID
+            data: Serialized checkpoint payload
+            metadata: Checkpoint metadata, kept readable for listings
+        
+        Returns:
+            Success status
+        """
+        return await asyncio.to_thread(self._save, thread_id, checkpoint_id, data, metadata)
+    
+    async def load_checkpoint(
+        self,
+        thread_id: str,
+        checkpoint_id: Optional[str] = None
+    ) -> Optional[bytes]:
+        """Load a checkpoint from LMDB.
+        
+        Args:
+            thread_id: Thread/conversation ID
+            checkpoint_id: Optional specific checkpoint ID
+        
+        Returns:
+            Serialized checkpoint payload or None
+        """
+        return await asyncio.to_thread(self._load, thread_id, checkpoint_id)
+    
+    async def batch_load_checkpoint(
+        self,
+        thread_id: str,
+        checkpoint_ids: List[str]
+    ) -> List[Optional[bytes]]:
+        """Load several checkpoints in one read transaction.
+        
+        Args:
+            thread_id: Thread/conversation ID
+            checkpoint_ids: Checkpoint IDs to load
+        
+        Returns:
+            Serialized payload (or None) for each ID, in the same order
+        """
+        return await asyncio.to_thread(self._batch_load, thread_id, checkpoint_ids)
+    
+    async def list_checkpoints(
+        self,
+        thread_id: str,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """List checkpoints for a thread.
+        
+        Args:
+            thread_id: Thread/conversation ID
+            limit: Maximum number to return
+        
+        Returns:
+            List of checkpoint metadata
+        """
+        return await asyncio.to_thread(self._list, thread_id, limit, False)
+    
+    async def list_checkpoints_meta(
+        self,
+        thread_id: str,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """List checkpoints with their metadata, without payloads.
+        
+        Args:
+            thread_id: Thread/conversation ID
+            limit: Maximum number to return
+        
+        Returns:
+            List of id/created_at/metadata dicts, newest first
+        """
+        return await asyncio.to_thread(self._list, thread_id, limit, True)
+    
+    async def delete_checkpoint(
+        self,
+        thread_id: str,
+        checkpoint_id: str
+    ) -> bool:
+        """Delete a checkpoint.
+        
+        Args:
+            thread_id: Thread/conversation ID
+            checkpoint_id: Checkpoint ID
+        
+        Returns:
+            Success status
+        """
+        return await asyncio.to_thread(self._delete_one, thread_id, checkpoint_id)
+    
+    async def cleanup_old_checkpoints(
+        self,
+        thread_id: str,
+        keep_count: int = 5
+    ) -> int:
+        """Clean up old checkpoints.
+        
+        Args:
+            thread_id: Thread/conversation ID
+            keep_count: Number of recent checkpoints to keep
+        
+        Returns:
+            Number of checkpoints deleted
+        """
+        return await asyncio.to_thread(self._cleanup, thread_id, keep_count)
+    
+    def close(self):
+        """Close the LMDB environment."""
+        self._env.close()
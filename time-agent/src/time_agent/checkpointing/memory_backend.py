@@ -1,58 +1,155 @@
 """In-memory storage backend for checkpointing."""
 
 import asyncio
-from collections import defaultdict
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
+
+import zstandard as zstd
 
 from .storage_backend import StorageBackend
 
+# Number of lock stripes; threads hash onto a stripe so unrelated
+# conversations rarely contend while memory stays bounded.
+LOCK_STRIPES = 64
+
+# zstd level for stored payloads
+ZSTD_LEVEL = 3
+
+# Every this many checkpoints a compression dictionary of at most
+# ZSTD_DICT_SIZE bytes is trained on the thread's recent payloads.
+# Checkpoints repeat the transcript so far, so later payloads largely
+# compress down to references into it.
+ZSTD_DICT_INTERVAL = 8
+ZSTD_DICT_SIZE = 16 * 1024
+
+# Bytes of each payload kept as a training sample
+ZSTD_SAMPLE_SIZE = 16 * 1024
+
+# Compressor and decompressor sharing one trained dictionary
+_DictCodec = Tuple[zstd.ZstdCompressor, zstd.ZstdDecompressor]
+
+
+def _format_ns(timestamp_ns: int) -> str:
+    """Format an epoch timestamp in nanoseconds as a naive UTC ISO string."""
+    return datetime.fromtimestamp(
+        timestamp_ns / 1e9, tz=timezone.utc
+    ).replace(tzinfo=None).isoformat()
+
+
+@dataclass(slots=True)
+class CheckpointRecord:
+    """A stored checkpoint."""
+    
+    id: str
+    thread_id: str
+    # Compressed payload
+    data: bytes
+    # Codec of the dictionary it was compressed with, if any
+    codec: Optional[_DictCodec]
+    # Epoch ns; formatted to ISO only when listed
+    created_at: int
+    metadata: Dict[str, Any]
+    version: int = 1
+
 
 class MemoryBackend(StorageBackend):
     """In-memory implementation of checkpoint storage."""
     
     def __init__(self):
         """Initialize memory backend."""
-        self._storage: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
-        self._lock = asyncio.Lock()
+        # Per-thread checkpoints kept in save order (oldest first), so the
+        # latest is always the last entry and no sorting is needed.
+        self._storage: Dict[str, "OrderedDict[str, CheckpointRecord]"] = defaultdict(OrderedDict)
+        self._locks = [asyncio.Lock() for _ in range(LOCK_STRIPES)]
+        self._compressor = zstd.ZstdCompressor(level=ZSTD_LEVEL)
+        self._decompressor = zstd.ZstdDecompressor()
+        # thread_id -> codec of the thread's current dictionary
+        self._zdicts: Dict[str, _DictCodec] = {}
+        # thread_id -> payload heads saved since the last training
+        self._samples: Dict[str, List[bytes]] = defaultdict(list)
+    
+    def _lock_for(self, thread_id: str) -> asyncio.Lock:
+        """Get the lock stripe guarding a thread's checkpoints.
+        
+        Reads take no lock: they never await, so the event loop already
+        runs them atomically with respect to writers.
+        """
+        return self._locks[hash(thread_id) % LOCK_STRIPES]
+    
+    def _decompress(self, checkpoint: CheckpointRecord) -> bytes:
+        """Get the original payload of a stored checkpoint."""
+        if checkpoint.codec is None:
+            return self._decompressor.decompress(checkpoint.data)
+        return checkpoint.codec[1].decompress(checkpoint.data)
     
     async def save_checkpoint(
         self,
         thread_id: str,
         checkpoint_id: str,
-        data: Dict[str, Any]
+        data: bytes,
+        metadata: Optional[Dict[str, Any]] = None
     ) -> bool:
         """Save a checkpoint to memory.
         
         Args:
             thread_id: Thread/conversation ID
             checkpoint_id: Checkpoint ID
-            data: Checkpoint data
+            data: Serialized checkpoint payload
+            metadata: Checkpoint metadata, kept readable for listings
             
         Returns:
             Success status
         """
-        async with self._lock:
-            checkpoint = {
-                "id": checkpoint_id,
-                "thread_id": thread_id,
-                "data": data,
-                "created_at": datetime.utcnow().isoformat(),
-                "version": 1
-            }
+        async with self._lock_for(thread_id):
+            codec = self._zdicts.get(thread_id)
+            compressor = self._compressor if codec is None else codec[0]
+            checkpoint = CheckpointRecord(
+                id=checkpoint_id,
+                thread_id=thread_id,
+                data=compressor.compress(data),
+                codec=codec,
+                created_at=time.time_ns(),
+                metadata=metadata or {}
+            )
+            
+            thread_checkpoints = self._storage[thread_id]
             
             # Update version if checkpoint exists
-            if checkpoint_id in self._storage[thread_id]:
-                checkpoint["version"] = self._storage[thread_id][checkpoint_id].get("version", 0) + 1
+            if checkpoint_id in thread_checkpoints:
+                checkpoint.version = thread_checkpoints[checkpoint_id].version + 1
             
-            self._storage[thread_id][checkpoint_id] = checkpoint
+            thread_checkpoints[checkpoint_id] = checkpoint
+            # A re-saved checkpoint becomes the newest one
+            thread_checkpoints.move_to_end(checkpoint_id)
+            
+            samples = self._samples[thread_id]
+            samples.append(data[:ZSTD_SAMPLE_SIZE])
+            if len(samples) >= ZSTD_DICT_INTERVAL:
+                self._train_dictionary(thread_id, samples)
+                samples.clear()
             return True
     
+    def _train_dictionary(self, thread_id: str, samples: List[bytes]) -> None:
+        """Replace a thread's dictionary with one trained on its recent payloads."""
+        try:
+            zdict = zstd.train_dictionary(ZSTD_DICT_SIZE, samples)
+        except zstd.ZstdError:
+            # Too little sample data; keep the current dictionary
+            return
+        self._zdicts[thread_id] = (
+            zstd.ZstdCompressor(level=ZSTD_LEVEL, dict_data=zdict),
+            zstd.ZstdDecompressor(dict_data=zdict)
+        )
+    
     async def load_checkpoint(
         self,
         thread_id: str,
         checkpoint_id: Optional[str] = None
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[bytes]:
         """Load a checkpoint from memory.
         
         Args:
@@ -60,27 +157,42 @@ class MemoryBackend(StorageBackend):
             checkpoint_id: Optional specific checkpoint ID
             
         Returns:
-            Checkpoint data or None
+            Serialized checkpoint payload or None
         """
-        async with self._lock:
-            thread_checkpoints = self._storage.get(thread_id, {})
-            
-            if not thread_checkpoints:
-                return None
+        thread_checkpoints = self._storage.get(thread_id, {})
+        
+        if not thread_checkpoints:
+            return None
+        
+        if checkpoint_id:
+            # Load specific checkpoint
+            checkpoint = thread_checkpoints.get(checkpoint_id)
+            return self._decompress(checkpoint) if checkpoint else None
+        else:
+            # Load latest checkpoint
+            latest = next(reversed(thread_checkpoints.values()))
+            return self._decompress(latest)
+    
+    async def batch_load_checkpoint(
+        self,
+        thread_id: str,
+        checkpoint_ids: List[str]
+    ) -> List[Optional[bytes]]:
+        """Load several checkpoints in one call.
+        
+        Args:
+            thread_id: Thread/conversation ID
+            checkpoint_ids: Checkpoint IDs to load
             
-            if checkpoint_id:
-                # Load specific checkpoint
-                checkpoint = thread_checkpoints.get(checkpoint_id)
-                return checkpoint["data"] if checkpoint else None
-            else:
-                # Load latest checkpoint
-                if thread_checkpoints:
-                    latest = max(
-                        thread_checkpoints.values(),
-                        key=lambda x: x["created_at"]
-                    )
-                    return latest["data"]
-                return None
+        Returns:
+            Serialized payload (or None) for each ID, in the same order
+        """
+        thread_checkpoints = self._storage.get(thread_id, {})
+        result = []
+        for checkpoint_id in checkpoint_ids:
+            checkpoint = thread_checkpoints.get(checkpoint_id)
+            result.append(self._decompress(checkpoint) if checkpoint else None)
+        return result
     
     async def list_checkpoints(
         self,
@@ -96,26 +208,46 @@ class MemoryBackend(StorageBackend):
         Returns:
             List of checkpoint metadata
         """
-        async with self._lock:
-            thread_checkpoints = self._storage.get(thread_id, {})
-            
-            # Sort by creation time (newest first)
-            checkpoints = sorted(
-                thread_checkpoints.values(),
-                key=lambda x: x["created_at"],
-                reverse=True
-            )
+        thread_checkpoints = self._storage.get(thread_id, {})
+        
+        # Newest first
+        checkpoints = islice(reversed(thread_checkpoints.values()), limit)
+        
+        # Return metadata only
+        return [
+            {
+                "id": cp.id,
+                "thread_id": cp.thread_id,
+                "created_at": _format_ns(cp.created_at),
+                "version": cp.version
+            }
+            for cp in checkpoints
+        ]
+    
+    async def list_checkpoints_meta(
+        self,
+        thread_id: str,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """List checkpoints with their metadata, without payloads.
+        
+        Args:
+            thread_id: Thread/conversation ID
+            limit: Maximum number to return
             
-            # Return metadata only
-            return [
-                {
-                    "id": cp["id"],
-                    "thread_id": cp["thread_id"],
-                    "created_at": cp["created_at"],
-                    "version": cp["version"]
-                }
-                for cp in checkpoints[:limit]
-            ]
+        Returns:
+            List of id/created_at/metadata dicts, newest first
+        """
+        thread_checkpoints = self._storage.get(thread_id, {})
+        
+        return [
+            {
+                "id": cp.id,
+                "created_at": _format_ns(cp.created_at),
+                "metadata": cp.metadata
+            }
+            for cp in islice(reversed(thread_checkpoints.values()), limit)
+        ]
     
     async def delete_checkpoint(
         self,
@@ -131,13 +263,15 @@ class MemoryBackend(StorageBackend):
         Returns:
             Success status
         """
-        async with self._lock:
+        async with self._lock_for(thread_id):
             if thread_id in self._storage and checkpoint_id in self._storage[thread_id]:
                 del self._storage[thread_id][checkpoint_id]
                 
                 # Clean up empty thread entries
                 if not self._storage[thread_id]:
                     del self._storage[thread_id]
+                    self._zdicts.pop(thread_id, None)
+                    self._samples.pop(thread_id, None)
                 
                 return True
             return False
@@ -156,28 +290,33 @@ class MemoryBackend(StorageBackend):
         Returns:
             Number of checkpoints deleted
         """
-        async with self._lock:
+        async with self._lock_for(thread_id):
             thread_checkpoints = self._storage.get(thread_id, {})
             
             if len(thread_checkpoints) <= keep_count:
                 return 0
             
-            # Sort by creation time
-            sorted_checkpoints = sorted(
-                thread_checkpoints.items(),
-                key=lambda x: x[1]["created_at"],
-                reverse=True
-            )
+            deleted = len(thread_checkpoints) - keep_count
             
-            # Delete old checkpoints
-            deleted = 0
-            for checkpoint_id, _ in sorted_checkpoints[keep_count:]:
-                del self._storage[thread_id][checkpoint_id]
-                deleted += 1
+            # Oldest checkpoints are at the front
+            if keep_count <= 0:
+                del self._storage[thread_id]
+                self._zdicts.pop(thread_id, None)
+                self._samples.pop(thread_id, None)
+            elif deleted > keep_count:
+                # Mostly deleting: rebuild from the kept tail in one go
+                self._storage[thread_id] = OrderedDict(
+                    islice(thread_checkpoints.items(), deleted, None)
+                )
+            else:
+                for _ in range(deleted):
+                    thread_checkpoints.popitem(last=False)
             
             return deleted
     
     async def clear_all(self):
         """Clear all checkpoints (for testing)."""
-        async with self._lock:
-            self._storage.clear()
\ No newline at end of file
+        # Single await-free statement, so no stripe needs to be held
+        self._storage.clear()
+        self._zdicts.clear()
+        self._samples.clear()
\ No newline at end of file
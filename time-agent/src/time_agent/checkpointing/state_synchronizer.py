@@ -1,14 +1,29 @@
 """State synchronization between A2A tasks and LangGraph checkpoints."""
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
+from ..common.exceptions import CheckpointError
 from ..protocol.models import A2ATask, TaskStatus
 from ..protocol.task_manager import TaskManager
 from .a2a_checkpointer import A2ACheckpointer
 
 logger = logging.getLogger(__name__)
 
+# Pending task syncs are flushed once SYNC_BATCH_SIZE tasks are waiting,
+# or at least every SYNC_FLUSH_INTERVAL seconds
+SYNC_BATCH_SIZE = 64
+SYNC_FLUSH_INTERVAL = 1.0
+
+
+def _raise_errors(errors: list) -> None:
+    """Raise the given checkpoint failures, merged into one if there are several."""
+    if len(errors) == 1:
+        raise errors[0]
+    if errors:
+        raise CheckpointError("; ".join(str(error) for error in errors))
+
 
 class StateSynchronizer:
     """Synchronizes state between A2A tasks and LangGraph checkpoints."""
@@ -27,6 +42,80 @@ class StateSynchronizer:
         self.task_manager = task_manager
         self.checkpointer = checkpointer
         self.auto_checkpoint = False  # Can be enabled if needed
+        
+        # task_id -> (config, checkpoint, metadata); only the latest sync of
+        # a task is kept until the next flush
+        self._pending: Dict[str, Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]] = {}
+        self._batch_full = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        # Held while a flush hands syncs to the checkpointer, so a final
+        # checkpoint is written only after those syncs are queued
+        self._flush_lock = asyncio.Lock()
+        # task_id -> first failed sync of that task since it was last flushed
+        self._sync_errors: Dict[str, CheckpointError] = {}
+    
+    def _ensure_flusher(self) -> None:
+        """Start the background flush task if it is not running."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+    
+    async def _flush_loop(self) -> None:
+        """Flush pending syncs when the batch fills or the interval elapses."""
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_full.wait(), SYNC_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            await self._flush_pending()
+    
+    async def _flush_pending(self) -> None:
+        """Hand all pending syncs to the checkpointer."""
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            self._batch_full.clear()
+            if not pending:
+                return
+            
+            results = await asyncio.gather(
+                *(
+                    self.checkpointer.aput(config, checkpoint_data, metadata=metadata)
+                    for config, checkpoint_data, metadata in pending.values()
+                ),
+                return_exceptions=True
+            )
+            for task_id, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    logger.error("Failed to sync task %s to checkpoint: %s", task_id, result)
+                    self._sync_errors.setdefault(task_id, CheckpointError(
+                        f"Failed to sync task {task_id} to checkpoint: {result}"
+                    ))
+    
+    async def flush(self, task_id: Optional[str] = None) -> None:
+        """Persist all pending task syncs.
+        
+        Raises CheckpointError for syncs that failed since they were last
+        reported, including syncs flushed in the background. Each failure
+        is reported once, and only for its own task.
+        
+        Args:
+            task_id: Report failures of this task only; all tasks when
+                omitted
+        """
+        await self._flush_pending()
+        
+        if task_id is not None:
+            error = self._sync_errors.pop(task_id, None)
+            errors = [error] if error is not None else []
+        else:
+            errors = list(self._sync_errors.values())
+            self._sync_errors.clear()
+        
+        try:
+            await self.checkpointer.flush(task_id)
+        except CheckpointError as e:
+            errors.append(e)
+        
+        _raise_errors(errors)
     
     async def sync_task_to_checkpoint(
         self,
@@ -35,42 +124,44 @@ class StateSynchronizer:
     ) -> bool:
         """Sync A2A task state to checkpoint.
         
+        The sync is batched: it is written on the next flush, and a later
+        sync of the same task before then replaces it. Nothing is persisted
+        when this returns; failures to persist are raised by flush().
+        
         Args:
             task: A2A task
             checkpoint_data: Checkpoint data to save
             
         Returns:
-            Success status
+            True once the sync is queued
         """
-        try:
-            # Create config for checkpointer
-            config = {
-                "configurable": {
-                    "thread_id": task.task_id,
-                    "task_metadata": {
-                        "status": task.status.value,
-                        "created_at": task.created_at.isoformat(),
-                        "updated_at": task.updated_at.isoformat()
-                    }
+        # Create config for checkpointer
+        config = {
+            "configurable": {
+                "thread_id": task.task_id,
+                "task_metadata": {
+                    "status": task.status.value,
+                    "created_at": task.created_at,
+                    "updated_at": task.updated_at
                 }
             }
-            
-            # Save checkpoint
-            await self.checkpointer.aput(
-                config,
-                checkpoint_data,
-                metadata={
-                    "task_id": task.task_id,
-                    "task_status": task.status.value
-                }
-            )
-            
-            logger.info(f"Synced task {task.task_id} to checkpoint")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to sync task to checkpoint: {e}")
-            return False
+        }
+        
+        # Queue checkpoint; latest sync of a task wins
+        self._pending[task.task_id] = (
+            config,
+            checkpoint_data,
+            {
+                "task_id": task.task_id,
+                "task_status": task.status.value
+            }
+        )
+        self._ensure_flusher()
+        if len(self._pending) >= SYNC_BATCH_SIZE:
+            self._batch_full.set()
+        
+        logger.info("Queued sync of task %s to checkpoint", task.task_id)
+        return True
     
     async def restore_from_checkpoint(
         self,
@@ -78,36 +169,35 @@ class StateSynchronizer:
     ) -> Optional[Dict[str, Any]]:
         """Restore task state from checkpoint.
         
+        Raises CheckpointError if pending syncs or the checkpoint itself
+        cannot be read back.
+        
         Args:
             task_id: Task ID
             
         Returns:
             Restored state or None
         """
-        try:
-            # Get task
-            task = await self.task_manager.get_task(task_id)
-            if not task:
-                logger.warning(f"Task {task_id} not found")
-                return None
-            
-            # Load checkpoint
-            config = {
-                "configurable": {
-                    "thread_id": task_id
-                }
-            }
-            
-            checkpoint = await self.checkpointer.aget(config)
-            if checkpoint:
-                logger.info(f"Restored state for task {task_id}")
-                return checkpoint
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Failed to restore from checkpoint: {e}")
+        # Get task
+        task = await self.task_manager.get_task(task_id)
+        if not task:
+            logger.warning("Task %s not found", task_id)
             return None
+        
+        # Load checkpoint
+        config = {
+            "configurable": {
+                "thread_id": task_id
+            }
+        }
+        
+        await self.flush(task_id)
+        checkpoint = await self.checkpointer.aget(config)
+        if checkpoint:
+            logger.info("Restored state for task %s", task_id)
+            return checkpoint
+        
+        return None
     
     async def mark_checkpoint_on_completion(
         self,
@@ -116,6 +206,11 @@ class StateSynchronizer:
     ) -> bool:
         """Mark checkpoint when task completes.
         
+        The final checkpoint carries the completed status and supersedes
+        any queued sync of the task, so completion is a single write.
+        Raises CheckpointError if it cannot be persisted; the task stays
+        completed.
+        
         Args:
             task_id: Task ID
             final_state: Final state data
@@ -123,41 +218,46 @@ class StateSynchronizer:
         Returns:
             Success status
         """
-        try:
-            # Update task status
-            task = await self.task_manager.update_task_status(
-                task_id,
-                TaskStatus.COMPLETED,
-                output_data=final_state
-            )
-            
-            if not task:
-                return False
-            
-            # Save final checkpoint
-            config = {
-                "configurable": {
-                    "thread_id": task_id,
-                    "is_final": True
-                }
+        # Update task status
+        task = await self.task_manager.update_task_status(
+            task_id,
+            TaskStatus.COMPLETED,
+            output_data=final_state
+        )
+        
+        if not task:
+            return False
+        
+        # Save final checkpoint
+        config = {
+            "configurable": {
+                "thread_id": task_id,
+                "is_final": True
             }
-            
+        }
+        
+        # A queued sync of this task is superseded by the final state and
+        # must not land after it. Syncs a running flush already took are
+        # queued once it releases the lock, and the durable write below
+        # persists them first.
+        async with self._flush_lock:
+            self._pending.pop(task_id, None)
+            # Earlier syncs that failed are superseded as well
+            self._sync_errors.pop(task_id, None)
             await self.checkpointer.aput(
                 config,
                 final_state,
                 metadata={
                     "task_id": task_id,
+                    "task_status": task.status.value,
                     "is_final": True,
-                    "completed_at": task.updated_at.isoformat()
-                }
+                    "completed_at": task.updated_at
+                },
+                durable=True
             )
-            
-            logger.info(f"Marked final checkpoint for task {task_id}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to mark checkpoint on completion: {e}")
-            return False
+        
+        logger.info("Marked final checkpoint for task %s", task_id)
+        return True
     
     async def get_task_checkpoints(
         self,
@@ -166,6 +266,8 @@ class StateSynchronizer:
     ) -> list[Dict[str, Any]]:
         """Get all checkpoints for a task.
         
+        Raises CheckpointError if the checkpoints cannot be listed.
+        
         Args:
             task_id: Task ID
             limit: Maximum number to return
@@ -173,24 +275,11 @@ class StateSynchronizer:
         Returns:
             List of checkpoint metadata
         """
-        try:
-            config = {
-                "configurable": {
-                    "thread_id": task_id
-                }
+        config = {
+            "configurable": {
+                "thread_id": task_id
             }
-            
-            checkpoints = await self.checkpointer.alist(config, limit)
-            
-            return [
-                {
-                    "checkpoint_id": cp[0]["configurable"].get("checkpoint_id"),
-                    "metadata": cp[1].get("metadata", {}),
-                    "timestamp": cp[1].get("ts")
-                }
-                for cp in checkpoints
-            ]
-            
-        except Exception as e:
-            logger.error(f"Failed to get task checkpoints: {e}")
-            return []
\ No newline at end of file
+        }
+        
+        await self._flush_pending()
+        return await self.checkpointer.alist_metadata(config, limit)
\ No newline at end of file
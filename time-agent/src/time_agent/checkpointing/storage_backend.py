@@ -1,5 +1,6 @@
 """Abstract storage backend for checkpointing."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
@@ -12,14 +13,16 @@ class StorageBackend(ABC):
         self,
         thread_id: str,
         checkpoint_id: str,
-        data: Dict[str, Any]
+        data: bytes,
+        metadata: Optional[Dict[str, Any]] = None
     ) -> bool:
         """Save a checkpoint.
         
         Args:
             thread_id: Thread/conversation ID
             checkpoint_id: Checkpoint ID
-            data: Checkpoint data
+            data: Serialized checkpoint payload
+            metadata: Checkpoint metadata, kept readable for listings
             
         Returns:
             Success status
@@ -31,7 +34,7 @@ class StorageBackend(ABC):
         self,
         thread_id: str,
         checkpoint_id: Optional[str] = None
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[bytes]:
         """Load a checkpoint.
         
         Args:
@@ -39,10 +42,31 @@ class StorageBackend(ABC):
             checkpoint_id: Optional specific checkpoint ID
             
         Returns:
-            Checkpoint data or None
+            Serialized checkpoint payload or None
         """
         pass
     
+    async def batch_load_checkpoint(
+        self,
+        thread_id: str,
+        checkpoint_ids: List[str]
+    ) -> List[Optional[bytes]]:
+        """Load several checkpoints of a thread at once.
+        
+        The default issues the loads concurrently; backends that can fetch
+        many keys in one round-trip should override this.
+        
+        Args:
+            thread_id: Thread/conversation ID
+            checkpoint_ids: Checkpoint IDs to load
+            
+        Returns:
+            Serialized payload (or None) for each ID, in the same order
+        """
+        return list(await asyncio.gather(
+            *(self.load_checkpoint(thread_id, cp_id) for cp_id in checkpoint_ids)
+        ))
+    
     @abstractmethod
     async def list_checkpoints(
         self,
@@ -60,6 +84,26 @@ class StorageBackend(ABC):
         """
         pass
     
+    @abstractmethod
+    async def list_checkpoints_meta(
+        self,
+        thread_id: str,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """List checkpoints with their metadata, without payloads.
+        
+        Ids and metadata should come back from a single round-trip (one
+        query or pipeline), not one fetch per checkpoint.
+        
+        Args:
+            thread_id: Thread/conversation ID
+            limit: Maximum number to return
+            
+        Returns:
+            List of id/created_at/metadata dicts, newest first
+        """
+        pass
+    
     @abstractmethod
     async def delete_checkpoint(
         self,
@@ -92,4 +136,8 @@ class StorageBackend(ABC):
         Returns:
             Number of checkpoints deleted
         """
+        pass
+    
+    def close(self):
+        """Release resources held by the backend; nothing by default."""
         pass
\ No newline at end of file
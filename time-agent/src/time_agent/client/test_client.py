@@ -2,13 +2,27 @@
 """Test client for the time agent."""
 
 import asyncio
-import json
 import sys
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
+import orjson
 from pydantic import BaseModel
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
+
+# Matches the server's default max_concurrent_tasks
+MAX_CONCURRENT_QUERIES = 10
+
+# Seconds to reuse GET responses; the agent card is static per deployment
+AGENT_INFO_TTL = 300.0
+HEALTH_TTL = 1.0
+
 
 class A2AMessage(BaseModel):
     """A2A protocol message."""
@@ -21,14 +35,32 @@ class A2AMessage(BaseModel):
 class TimeAgentClient:
     """Test client for interacting with the time agent."""
     
-    def __init__(self, base_url: str = "http://localhost:10001"):
+    def __init__(self, base_url: str = "http://localhost:10001", use_sse: bool = True):
         """Initialize client.
         
         Args:
             base_url: Base URL of the time agent server
+            use_sse: Wait for task completion over SSE instead of polling
         """
         self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.use_sse = use_sse
+        # path -> (fetched_at, data)
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            # Pool settings live on the transport; the client ignores them
+            # once a transport is supplied
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=30.0
+                ),
+                retries=2
+            )
+        )
     
     async def send_message(self, content: str) -> Dict[str, Any]:
         """Send a message to the agent.
@@ -51,7 +83,7 @@ class TimeAgentClient:
         )
         
         response = await self.client.post(
-            f"{self.base_url}/message/send",
+            "/message/send",
             json=message.model_dump()
         )
         
@@ -69,7 +101,7 @@ class TimeAgentClient:
             Final task data
         """
         for attempt in range(max_attempts):
-            response = await self.client.get(f"{self.base_url}/tasks/{task_id}")
+            response = await self.client.get(f"/tasks/{task_id}")
             
             if response.status_code == 200:
                 task_data = response.json()
@@ -82,15 +114,48 @@ class TimeAgentClient:
         
         raise TimeoutError(f"Task {task_id} did not complete within timeout")
     
+    async def wait_for_task(self, task_id: str) -> Dict[str, Any]:
+        """Wait for task completion.
+        
+        Subscribes to the task's SSE update stream and returns as soon as a
+        final status arrives. Falls back to polling when SSE is disabled or
+        the server does not offer the stream.
+        
+        Args:
+            task_id: Task ID to wait for
+            
+        Returns:
+            Final task data
+        """
+        if not self.use_sse:
+            return await self.poll_task(task_id)
+        
+        async with self.client.stream(
+            "GET",
+            f"/tasks/{task_id}/events",
+            headers={"Accept": "text/event-stream"}
+        ) as response:
+            if response.status_code != 200:
+                return await self.poll_task(task_id)
+            
+            async for line in response.aiter_lines():
+                event_data = line.removeprefix("data: ")
+                if event_data is line:
+                    continue
+                
+                event = orjson.loads(event_data)
+                if event.get("type") == "status" and event["data"].get("status") in ["completed", "failed"]:
+                    return event["data"]
+        
+        raise TimeoutError(f"Task {task_id} stream ended before completion")
+    
     async def get_health(self) -> Dict[str, Any]:
         """Get server health status.
         
         Returns:
             Health data
         """
-        response = await self.client.get(f"{self.base_url}/health")
-        response.raise_for_status()
-        return response.json()
+        return await self._get_cached("/health", HEALTH_TTL)
     
     async def get_agent_info(self) -> Dict[str, Any]:
         """Get agent discovery information.
@@ -98,15 +163,69 @@ class TimeAgentClient:
         Returns:
             Agent metadata
         """
-        response = await self.client.get(f"{self.base_url}/.well-known/agent.json")
+        return await self._get_cached("/.well-known/agent.json", AGENT_INFO_TTL)
+    
+    async def _get_cached(self, path: str, ttl: float) -> Dict[str, Any]:
+        """GET a JSON resource, reusing a response younger than ttl."""
+        cached = self._cache.get(path)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        
+        response = await self.client.get(path)
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+        self._cache[path] = (time.monotonic(), data)
+        return data
     
     async def close(self):
         """Close the client."""
         await self.client.aclose()
 
 
+async def run_query(
+    client: TimeAgentClient,
+    query: str,
+    semaphore: asyncio.Semaphore
+) -> list[str]:
+    """Send one query and wait for its task to finish.
+    
+    Args:
+        client: Client to send the query through
+        query: Query text
+        semaphore: Limits how many queries are in flight at once
+        
+    Returns:
+        Output lines describing the exchange
+    """
+    lines = [f"=== Query: {query} ==="]
+    
+    async with semaphore:
+        # Send message
+        response = await client.send_message(query)
+        lines.append(f"Initial response: {orjson.dumps(response, option=orjson.OPT_INDENT_2).decode()}")
+        
+        # Extract task ID
+        task_id = response.get("result", {}).get("task", {}).get("id")
+        if not task_id:
+            return lines
+        
+        lines.append(f"Task ID: {task_id}")
+        
+        # Wait for completion
+        final_task = await client.wait_for_task(task_id)
+    
+    lines.append(f"Final status: {final_task.get('status')}")
+    
+    if final_task.get('output_data'):
+        lines.append("Response:")
+        lines.append(final_task['output_data'].get('response', 'No response'))
+    
+    if final_task.get('error'):
+        lines.append(f"Error: {final_task['error']}")
+    
+    return lines
+
+
 async def test_time_queries():
     """Test various time queries."""
     client = TimeAgentClient()
@@ -115,13 +234,13 @@ async def test_time_queries():
         # Test health check
         print("=== Health Check ===")
         health = await client.get_health()
-        print(json.dumps(health, indent=2))
+        print(orjson.dumps(health, option=orjson.OPT_INDENT_2).decode())
         print()
         
         # Test agent info
         print("=== Agent Info ===")
         info = await client.get_agent_info()
-        print(json.dumps(info, indent=2))
+        print(orjson.dumps(info, option=orjson.OPT_INDENT_2).decode())
         print()
         
         # Test queries
@@ -133,35 +252,16 @@ async def test_time_queries():
             "Show me the time difference between Los Angeles and Sydney"
         ]
         
-        for query in queries:
-            print(f"=== Query: {query} ===")
-            
-            # Send message
-            response = await client.send_message(query)
-            print(f"Initial response: {json.dumps(response, indent=2)}")
-            
-            # Extract task ID
-            task_id = response.get("result", {}).get("task", {}).get("id")
-            if task_id:
-                print(f"Task ID: {task_id}")
-                
-                # Poll for completion
-                print("Polling for completion...")
-                final_task = await client.poll_task(task_id)
-                
-                print(f"Final status: {final_task.get('status')}")
-                
-                if final_task.get('output_data'):
-                    print("Response:")
-                    print(final_task['output_data'].get('response', 'No response'))
-                
-                if final_task.get('error'):
-                    print(f"Error: {final_task['error']}")
-            
+        # Queries run concurrently; output is collected per query so it
+        # prints in order once all of them finish
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+        results = await asyncio.gather(
+            *(run_query(client, query, semaphore) for query in queries)
+        )
+        
+        for lines in results:
+            print("\n".join(lines))
             print("\n" + "="*50 + "\n")
-            
-            # Small delay between queries
-            await asyncio.sleep(1)
     
     finally:
         await client.close()
@@ -170,7 +270,7 @@ async def test_time_queries():
 def main():
     """Run the test client."""
     try:
-        asyncio.run(test_time_queries())
+        run(test_time_queries())
     except KeyboardInterrupt:
         print("\nTest interrupted by user")
     except Exception as e:
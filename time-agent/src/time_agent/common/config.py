@@ -1,6 +1,7 @@
 """Configuration management for time agent."""
 
 import os
+from dataclasses import make_dataclass
 from typing import Optional
 
 from pydantic import Field
@@ -64,6 +65,21 @@ class Settings(BaseSettings):
         env="ENABLE_CHECKPOINTING",
         description="Enable state checkpointing"
     )
+    checkpoint_backend: str = Field(
+        default="memory",
+        env="CHECKPOINT_BACKEND",
+        description="Checkpoint storage: 'memory' or 'lmdb'"
+    )
+    checkpoint_path: str = Field(
+        default="./checkpoints",
+        env="CHECKPOINT_PATH",
+        description="Directory of the LMDB checkpoint store"
+    )
+    auth_required: bool = Field(
+        default=False,
+        env="AUTH_REQUIRED",
+        description="Authenticate requests (open access when disabled)"
+    )
     
     # Limits
     max_concurrent_tasks: int = Field(
@@ -83,5 +99,15 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+# Plain frozen snapshot of Settings; validation runs once at import and
+# later reads are slot lookups instead of pydantic attribute access
+FrozenSettings = make_dataclass(
+    "FrozenSettings",
+    [(name, field.annotation) for name, field in Settings.model_fields.items()],
+    frozen=True,
+    slots=True
+)
+
+
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = FrozenSettings(**Settings().model_dump())
\ No newline at end of file
@@ -1,8 +1,12 @@
 """Core agent implementation using LangGraph."""
 
+import hashlib
 import logging
 import os
-from typing import Any, Dict, Optional
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 from langchain_core.messages import SystemMessage
 from langchain_openai import ChatOpenAI
@@ -15,6 +19,71 @@ from .tools import TimeTools
 
 logger = logging.getLogger(__name__)
 
+# Shared by every compiled graph
+_SYSTEM_MSG = SystemMessage(content=SYSTEM_PROMPT)
+
+# Seconds a cached reply stays valid (never past the current minute)
+RESPONSE_CACHE_TTL = 30.0
+
+# Maximum number of cached replies per agent
+RESPONSE_CACHE_SIZE = 256
+
+# Tools whose results go stale with the clock; replies using them are not cached
+UNCACHEABLE_TOOLS = frozenset({"get_current_time"})
+
+
+def _normalize(content: Any) -> str:
+    """Normalize message content for cache keys.
+    
+    Only whitespace is collapsed; case can change the meaning of a
+    timezone or time string, so it is kept.
+    """
+    if isinstance(content, str):
+        return " ".join(content.split())
+    return repr(content)
+
+
+def _tool_inputs(msg: Any) -> str:
+    """Serialize the tool calls a message made, for cache keys."""
+    calls = getattr(msg, "tool_calls", None) or []
+    return repr([(call.get("name"), call.get("args")) for call in calls])
+
+
+def _uses_clock(messages: list) -> bool:
+    """Whether a run called a tool that reads the current time."""
+    return any(
+        call.get("name") in UNCACHEABLE_TOOLS
+        for msg in messages
+        for call in getattr(msg, "tool_calls", None) or []
+    )
+
+
+def _compile_graph(model: ChatOpenAI, tools: list) -> StateGraph:
+    """Build the ReAct graph for a model and tool set."""
+    return create_react_agent(
+        model,
+        tools,
+        prompt=_SYSTEM_MSG
+    )
+
+
+@lru_cache(maxsize=16)
+def _default_agent(local_timezone: str) -> Tuple[ChatOpenAI, TimeTools, list, StateGraph]:
+    """Build the default model, tools and graph once per local timezone.
+    
+    Agents created without an explicit model share these, so repeated
+    construction does not rebuild the graph.
+    """
+    model = ChatOpenAI(
+        model="gpt-4o-mini",
+        temperature=0,
+        streaming=True,
+        api_key=os.environ.get("OPENAI_API_KEY")
+    )
+    time_tools = TimeTools(local_timezone=local_timezone)
+    tools = time_tools.get_langchain_tools()
+    return model, time_tools, tools, _compile_graph(model, tools)
+
 
 class TimeAgent:
     """Time agent using LangGraph for conversational time assistance."""
@@ -30,12 +99,16 @@ class TimeAgent:
             model: Optional ChatOpenAI model instance
             local_timezone: Optional local timezone override
         """
-        self.model = model or ChatOpenAI(
-            model="gpt-4o-mini",
-            temperature=0,
-            streaming=True,
-            api_key=os.environ.get("OPENAI_API_KEY")
-        )
+        self._response_cache: OrderedDict[str, Tuple[float, Dict[str, Any], list]] = OrderedDict()
+        
+        if model is None:
+            # Default model: reuse the prebuilt graph
+            self.model, self.time_tools, self.tools, self.graph = _default_agent(
+                local_timezone or os.environ.get("LOCAL_TIMEZONE", "UTC")
+            )
+            return
+        
+        self.model = model
         
         # Initialize tools
         self.time_tools = TimeTools(local_timezone=local_timezone)
@@ -47,17 +120,7 @@ class TimeAgent:
     def _build_graph(self) -> StateGraph:
         """Build the LangGraph state graph."""
         # Create a ReAct agent with our tools
-        # Update the model with system prompt
-        model_with_system = self.model.bind(
-            system=SYSTEM_PROMPT
-        )
-        
-        agent = create_react_agent(
-            model_with_system,
-            self.tools
-        )
-        
-        return agent
+        return _compile_graph(self.model, self.tools)
     
     async def invoke(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Invoke the agent with the given state.
@@ -68,12 +131,55 @@ class TimeAgent:
         Returns:
             Updated state dictionary
         """
+        messages = state.get("messages") or []
+        # Runs restored from a checkpoint carry history the key cannot see
+        restoring = bool((state.get("configurable") or {}).get("checkpoint_id"))
+        key = self._cache_key(messages) if messages and not restoring else None
+        
+        if key is not None:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                stored_at, extra, new_messages = cached
+                if time.monotonic() - stored_at < RESPONSE_CACHE_TTL:
+                    self._response_cache.move_to_end(key)
+                    return {**extra, "messages": [*messages, *new_messages]}
+                del self._response_cache[key]
+        
         try:
             result = await self.graph.ainvoke(state)
-            return result
         except Exception as e:
-            logger.error(f"Agent invocation failed: {e}")
+            logger.error("Agent invocation failed: %s", e)
             raise
+        
+        if key is not None:
+            # Keep only what this run added; history comes from the caller
+            extra = {k: v for k, v in result.items() if k != "messages"}
+            new_messages = list(result.get("messages", [])[len(messages):])
+            # "What time is it" answers are stale as soon as they are made
+            if not _uses_clock(new_messages):
+                self._response_cache[key] = (time.monotonic(), extra, new_messages)
+                if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+        
+        return result
+    
+    @staticmethod
+    def _cache_key(messages: list) -> str:
+        """Hash the conversation, its tool inputs and the current minute.
+        
+        Including the minute keeps answers relative to "today" from
+        outliving the date they were based on.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(str(int(time.time() // 60)).encode())
+        for msg in messages:
+            h.update(b"\x00")
+            h.update(getattr(msg, "type", "").encode())
+            h.update(b"\x01")
+            h.update(_normalize(getattr(msg, "content", msg)).encode())
+            h.update(b"\x02")
+            h.update(_tool_inputs(msg).encode())
+        return h.hexdigest()
     
     async def stream(self, state: Dict[str, Any]):
         """Stream agent responses.
@@ -88,7 +194,7 @@ class TimeAgent:
             async for chunk in self.graph.astream(state):
                 yield chunk
         except Exception as e:
-            logger.error(f"Agent streaming failed: {e}")
+            logger.error("Agent streaming failed: %s", e)
             raise
     
     async def cleanup(self):
@@ -1,17 +1,25 @@
 """Time-related tools for the agent using MCP."""
 
-import json
 import os
 import asyncio
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, Optional
+from zoneinfo import ZoneInfo
 
+import orjson
 from langchain_core.tools import Tool
 
 # For now, we'll create mock tools since MCP integration requires additional setup
 # In production, this would use the actual MCP Time Server
 
 
+@lru_cache(maxsize=512)
+def _tz(name: str) -> ZoneInfo:
+    """Resolve an IANA timezone name, reusing earlier lookups."""
+    return ZoneInfo(name)
+
+
 class TimeTools:
     """Wrapper for time functionality."""
     
@@ -22,6 +30,7 @@ class TimeTools:
             local_timezone: Optional override for local timezone (IANA format)
         """
         self.local_timezone = local_timezone or os.environ.get("LOCAL_TIMEZONE", "UTC")
+        self._tools = self._build_langchain_tools()
     
     async def get_current_time(self, timezone: str) -> Dict[str, Any]:
         """Get current time in a specific timezone.
@@ -33,11 +42,8 @@ class TimeTools:
             Dict with datetime, timezone, and DST information
         """
         try:
-            import pytz
-            from datetime import datetime
-            
             # Get timezone object
-            tz = pytz.timezone(timezone)
+            tz = _tz(timezone)
             
             # Get current time
             now = datetime.now(tz)
@@ -77,21 +83,16 @@ class TimeTools:
             Dict with conversion details and time difference
         """
         try:
-            import pytz
-            from datetime import datetime, timedelta
-            
             # Parse time
             hour, minute = map(int, time.split(':'))
             
             # Get timezones
-            source_tz = pytz.timezone(source_timezone)
-            target_tz = pytz.timezone(target_timezone)
+            source_tz = _tz(source_timezone)
+            target_tz = _tz(target_timezone)
             
-            # Create datetime in source timezone (using today's date)
-            now = datetime.now()
-            source_dt = source_tz.localize(
-                datetime(now.year, now.month, now.day, hour, minute)
-            )
+            # Create datetime in source timezone (using today's date there)
+            today = datetime.now(source_tz)
+            source_dt = datetime(today.year, today.month, today.day, hour, minute, tzinfo=source_tz)
             
             # Convert to target timezone
             target_dt = source_dt.astimezone(target_tz)
@@ -105,14 +106,14 @@ class TimeTools:
             return {
                 "source": {
                     "timezone": source_timezone,
-                    "time": source_dt.strftime("%H:%M"),
-                    "date": source_dt.strftime("%Y-%m-%d"),
+                    "time": f"{source_dt.hour:02d}:{source_dt.minute:02d}",
+                    "date": source_dt.date().isoformat(),
                     "timezone_abbreviation": source_dt.strftime("%Z")
                 },
                 "target": {
                     "timezone": target_timezone,
-                    "time": target_dt.strftime("%H:%M"),
-                    "date": target_dt.strftime("%Y-%m-%d"),
+                    "time": f"{target_dt.hour:02d}:{target_dt.minute:02d}",
+                    "date": target_dt.date().isoformat(),
                     "timezone_abbreviation": target_dt.strftime("%Z")
                 },
                 "time_difference": {
@@ -140,6 +141,10 @@ class TimeTools:
         Returns:
             List of LangChain Tool objects
         """
+        return self._tools
+    
+    def _build_langchain_tools(self) -> list[Tool]:
+        """Create the LangChain tools bound to this instance."""
         return [
             Tool(
                 name="get_current_time",
@@ -152,8 +157,8 @@ class TimeTools:
             ),
             Tool(
                 name="convert_time",
-                func=lambda args: self.convert_time(**json.loads(args)),
-                coroutine=lambda args: self.convert_time(**json.loads(args)),
+                func=lambda args: self.convert_time(**orjson.loads(args)),
+                coroutine=lambda args: self.convert_time(**orjson.loads(args)),
                 description=(
                     "Convert time between timezones. Input should be a JSON string with: "
                     "{'source_timezone': 'America/New_York', 'time': '14:30', 'target_timezone': 'Asia/Tokyo'}"
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import os
+from importlib.util import find_spec
 
 import click
 import uvicorn
@@ -16,6 +17,10 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Prefer the uvicorn[standard] event loop and HTTP parser when installed
+LOOP = "uvloop" if find_spec("uvloop") else "asyncio"
+HTTP = "httptools" if find_spec("httptools") else "h11"
+
 
 @click.command()
 @click.option(
@@ -43,17 +48,41 @@ logger = logging.getLogger(__name__)
     is_flag=True,
     help="Enable auto-reload for development"
 )
-def main(host: str, port: int, log_level: str, reload: bool):
+@click.option(
+    "--proxy-headers",
+    is_flag=True,
+    help="Trust X-Forwarded-* headers (enable behind a reverse proxy)"
+)
+def main(host: str, port: int, log_level: str, reload: bool, proxy_headers: bool):
     """Run the Time Agent server."""
+    run(host, port, log_level, reload=reload, proxy_headers=proxy_headers)
+
+
+def run(
+    host: str = settings.host,
+    port: int = settings.port,
+    log_level: str = settings.log_level,
+    reload: bool = False,
+    proxy_headers: bool = False
+) -> None:
+    """Run the Time Agent server without going through the CLI.
+    
+    Args:
+        host: Host to bind to
+        port: Port to bind to
+        log_level: Logging level
+        reload: Enable auto-reload for development
+        proxy_headers: Trust X-Forwarded-* headers
+    """
     # Setup logging
     setup_logging(level=log_level)
     
-    logger.info(f"Starting Time Agent v1.0.0")
-    logger.info(f"Host: {host}")
-    logger.info(f"Port: {port}")
-    logger.info(f"Log level: {log_level}")
-    logger.info(f"Model: {settings.model_name}")
-    logger.info(f"Local timezone: {settings.local_timezone}")
+    logger.info("Starting Time Agent v1.0.0")
+    logger.info("Host: %s", host)
+    logger.info("Port: %s", port)
+    logger.info("Log level: %s", log_level)
+    logger.info("Model: %s", settings.model_name)
+    logger.info("Local timezone: %s", settings.local_timezone)
     
     # Create the app directly instead of using string import
     from .server.app import create_app
@@ -65,8 +94,13 @@ def main(host: str, port: int, log_level: str, reload: bool):
         host=host,
         port=port,
         reload=reload,
+        loop=LOOP,
+        http=HTTP,
         log_level=log_level.lower(),
-        access_log=log_level == "DEBUG"
+        access_log=log_level == "DEBUG",
+        proxy_headers=proxy_headers,
+        server_header=False,
+        date_header=False
     )
 
 
@@ -4,7 +4,17 @@ from .agent_card_generator import AgentCardGenerator
 from .message_handler import MessageHandler
 from .models import (
     A2AMessage,
+    A2ARequest,
     A2ATask,
+    CancelTaskRequest,
+    GetTaskRequest,
+    LegacyMessageRequest,
+    MessageParams,
+    MessagePayload,
+    MessageSendParams,
+    SendMessageRequest,
+    StreamMessageRequest,
+    TaskIdParams,
     TaskStatus,
     TaskYieldUpdate,
     TimeRequest,
@@ -19,7 +29,17 @@ __all__ = [
     "TaskManager",
     "ProtocolValidator",
     "A2AMessage",
+    "A2ARequest",
     "A2ATask",
+    "CancelTaskRequest",
+    "GetTaskRequest",
+    "LegacyMessageRequest",
+    "MessageParams",
+    "MessagePayload",
+    "MessageSendParams",
+    "SendMessageRequest",
+    "StreamMessageRequest",
+    "TaskIdParams",
     "TaskStatus",
     "TaskYieldUpdate",
     "TimeRequest",
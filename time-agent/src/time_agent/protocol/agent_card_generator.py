@@ -2,6 +2,63 @@
 
 from typing import Dict, List
 
+import orjson
+
+# The agent card is static, so it is built and serialized once
+_CARD_DICT: Dict[str, any] = {
+    "name": "Time Agent",
+    "version": "1.0.0",
+    "description": "An intelligent time and timezone assistant that provides current time information and timezone conversions",
+    "capabilities": [
+        "current_time",
+        "timezone_conversion",
+        "timezone_information"
+    ],
+    "supported_protocols": ["a2a/0.2"],
+    "endpoints": {
+        "message": "/message/send",
+        "stream": "/message/stream",
+        "tasks": "/tasks",
+        "health": "/health"
+    },
+    "metadata": {
+        "model": "gpt-4o-mini",
+        "framework": "langgraph",
+        "features": [
+            "streaming",
+            "checkpointing",
+            "task_management"
+        ],
+        "timezones": {
+            "supported": "All IANA timezones",
+            "common_aliases": [
+                "EST", "PST", "GMT", "BST", 
+                "JST", "CST", "MST"
+            ]
+        }
+    },
+    "examples": [
+        {
+            "input": "What time is it in Tokyo?",
+            "output": "The current time in Tokyo (JST) is 14:30:45"
+        },
+        {
+            "input": "Convert 3:30 PM EST to London time",
+            "output": "3:30 PM EST is 8:30 PM GMT in London"
+        }
+    ],
+    "rate_limits": {
+        "requests_per_minute": 60,
+        "concurrent_tasks": 10
+    },
+    "authentication": {
+        "required": False,
+        "methods": ["bearer_token"]
+    }
+}
+
+_CARD_JSON = orjson.dumps(_CARD_DICT)
+
 
 class AgentCardGenerator:
     """Generates agent discovery metadata for A2A protocol."""
@@ -11,59 +68,18 @@ class AgentCardGenerator:
         """Generate agent card for discovery.
         
         Returns:
-            Agent metadata dictionary
+            Agent metadata dictionary (shared; do not modify)
         """
-        return {
-            "name": "Time Agent",
-            "version": "1.0.0",
-            "description": "An intelligent time and timezone assistant that provides current time information and timezone conversions",
-            "capabilities": [
-                "current_time",
-                "timezone_conversion",
-                "timezone_information"
-            ],
-            "supported_protocols": ["a2a/0.2"],
-            "endpoints": {
-                "message": "/message/send",
-                "stream": "/message/stream",
-                "tasks": "/tasks",
-                "health": "/health"
-            },
-            "metadata": {
-                "model": "gpt-4o-mini",
-                "framework": "langgraph",
-                "features": [
-                    "streaming",
-                    "checkpointing",
-                    "task_management"
-                ],
-                "timezones": {
-                    "supported": "All IANA timezones",
-                    "common_aliases": [
-                        "EST", "PST", "GMT", "BST", 
-                        "JST", "CST", "MST"
-                    ]
-                }
-            },
-            "examples": [
-                {
-                    "input": "What time is it in Tokyo?",
-                    "output": "The current time in Tokyo (JST) is 14:30:45"
-                },
-                {
-                    "input": "Convert 3:30 PM EST to London time",
-                    "output": "3:30 PM EST is 8:30 PM GMT in London"
-                }
-            ],
-            "rate_limits": {
-                "requests_per_minute": 60,
-                "concurrent_tasks": 10
-            },
-            "authentication": {
-                "required": False,
-                "methods": ["bearer_token"]
-            }
-        }
+        return _CARD_DICT
+    
+    @staticmethod
+    def generate_bytes() -> bytes:
+        """Get the agent card pre-serialized as JSON.
+        
+        Returns:
+            UTF-8 encoded agent card
+        """
+        return _CARD_JSON
     
     @staticmethod
     def generate_health_info() -> Dict[str, any]:
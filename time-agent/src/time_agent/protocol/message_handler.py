@@ -1,15 +1,29 @@
 """Message handling for A2A protocol."""
 
-import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 
-from .models import A2AMessage
-from .validators import ProtocolValidator
+import orjson
+from pydantic import ConfigDict, TypeAdapter, ValidationError, with_config
+from typing_extensions import TypedDict
+
+from .models import A2AMessage, A2ARequest
 
 logger = logging.getLogger(__name__)
 
 
+@with_config(ConfigDict(extra="allow"))
+class _ChatMessage(TypedDict):
+    """A conversation message; validated as a plain dict."""
+    role: Any
+    content: Any
+
+
+# Built once; checks a whole message list in a single pydantic-core call
+_MESSAGES_ADAPTER = TypeAdapter(List[_ChatMessage])
+_MESSAGE_ADAPTER = TypeAdapter(_ChatMessage)
+
+
 class MessageHandler:
     """Handles A2A protocol message processing."""
     
@@ -70,25 +84,43 @@ class MessageHandler:
         return MessageHandler.create_response(message_id, error=error)
     
     @staticmethod
-    def parse_message(raw_message: Dict[str, Any]) -> Optional[A2AMessage]:
+    def parse_message(
+        raw_message: Union[Dict[str, Any], bytes, str]
+    ) -> Optional[A2AMessage]:
         """Parse and validate an A2A message.
         
         Args:
-            raw_message: Raw message dictionary
+            raw_message: Raw message dictionary, or the JSON request body
             
         Returns:
-            Parsed A2AMessage or None if invalid
+            Parsed A2AMessage (the method's request model when it has one)
+            or None if invalid
         """
-        is_valid, error = ProtocolValidator.validate_a2a_message(raw_message)
+        if isinstance(raw_message, (bytes, str)):
+            return MessageHandler.parse_message_json(raw_message)
         
-        if not is_valid:
-            logger.error(f"Invalid message format: {error}")
+        # Validate once; the parsed model is the result
+        try:
+            return A2ARequest.validate_python(raw_message)
+        except ValidationError as e:
+            logger.error("Invalid message format: %s", e)
             return None
+    
+    @staticmethod
+    def parse_message_json(raw: Union[bytes, str]) -> Optional[A2AMessage]:
+        """Parse and validate an A2A message straight from a request body.
         
+        Args:
+            raw: Raw JSON request body
+            
+        Returns:
+            Parsed A2AMessage or None if invalid
+        """
+        # Decodes and validates in one pass without an intermediate dict
         try:
-            return A2AMessage(**raw_message)
-        except Exception as e:
-            logger.error(f"Failed to parse message: {e}")
+            return A2ARequest.validate_json(raw)
+        except ValidationError as e:
+            logger.error("Invalid message format: %s", e)
             return None
     
     @staticmethod
@@ -108,13 +140,19 @@ class MessageHandler:
             logger.warning("Messages is not a list, wrapping in list")
             messages = [messages]
         
-        # Validate message format
+        # Validate message format; all valid is the common case
+        try:
+            return _MESSAGES_ADAPTER.validate_python(messages)
+        except ValidationError:
+            pass
+        
+        # Keep the valid messages and report the rest
         valid_messages = []
         for msg in messages:
-            if isinstance(msg, dict) and "role" in msg and "content" in msg:
-                valid_messages.append(msg)
-            else:
-                logger.warning(f"Invalid message format: {msg}")
+            try:
+                valid_messages.append(_MESSAGE_ADAPTER.validate_python(msg))
+            except ValidationError:
+                logger.warning("Invalid message format: %s", msg)
         
         return valid_messages
     
@@ -141,7 +179,7 @@ class MessageHandler:
         event_type: str,
         data: Any,
         task_id: Optional[str] = None
-    ) -> str:
+    ) -> bytes:
         """Format a streaming event for SSE.
         
         Args:
@@ -150,7 +188,7 @@ class MessageHandler:
             task_id: Optional task ID
             
         Returns:
-            SSE-formatted string
+            SSE-formatted bytes, ready to write to the response
         """
         event = {
             "event": event_type,
@@ -160,4 +198,4 @@ class MessageHandler:
         if task_id:
             event["task_id"] = task_id
         
-        return f"data: {json.dumps(event)}\n\n"
\ No newline at end of file
+        return b"data: " + orjson.dumps(event) + b"\n\n"
@@ -1,10 +1,12 @@
 """A2A Protocol models for type-safe message handling."""
 
+import time
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+import msgspec
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, TypeAdapter
 
 
 class TaskStatus(str, Enum):
@@ -24,6 +26,91 @@ class A2AMessage(BaseModel):
     id: Optional[Union[str, int]] = None
 
 
+class MessageParams(BaseModel):
+    """Params of legacy "message" requests carrying the whole conversation."""
+    model_config = ConfigDict(extra="allow")
+    messages: List[Dict[str, Any]]
+
+
+class MessagePayload(BaseModel):
+    """A single A2A message made of parts."""
+    model_config = ConfigDict(extra="allow")
+    role: str
+    parts: List[Dict[str, Any]]
+
+
+class MessageSendParams(BaseModel):
+    """Params of message/send and message/stream requests."""
+    model_config = ConfigDict(extra="allow")
+    message: MessagePayload
+
+
+class TaskIdParams(BaseModel):
+    """Params of requests addressing a single task."""
+    model_config = ConfigDict(extra="allow")
+    id: str
+
+
+class LegacyMessageRequest(A2AMessage):
+    """Request to send a conversation with the legacy "message" method."""
+    method: Literal["message"]
+    params: MessageParams
+
+
+class SendMessageRequest(A2AMessage):
+    """Request to send a message."""
+    method: Literal["message/send"]
+    params: MessageSendParams
+
+
+class StreamMessageRequest(A2AMessage):
+    """Request to send a message and stream the reply."""
+    method: Literal["message/stream"]
+    params: MessageSendParams
+
+
+class GetTaskRequest(A2AMessage):
+    """Request for a task's state."""
+    method: Literal["tasks/get"]
+    params: TaskIdParams
+
+
+class CancelTaskRequest(A2AMessage):
+    """Request to cancel a task."""
+    method: Literal["tasks/cancel"]
+    params: TaskIdParams
+
+
+# Method -> union tag; methods without a typed model validate as A2AMessage
+_METHOD_TAGS = {
+    "message": "legacy",
+    "message/send": "send",
+    "message/stream": "stream",
+    "tasks/get": "get",
+    "tasks/cancel": "cancel",
+}
+
+
+def _request_tag(value: Any) -> str:
+    """Pick the request model from the message's method."""
+    method = value.get("method") if isinstance(value, dict) else getattr(value, "method", None)
+    return _METHOD_TAGS.get(method, "other")
+
+
+# Validates a request in one pass, selecting the params schema by method
+A2ARequest = TypeAdapter(Annotated[
+    Union[
+        Annotated[LegacyMessageRequest, Tag("legacy")],
+        Annotated[SendMessageRequest, Tag("send")],
+        Annotated[StreamMessageRequest, Tag("stream")],
+        Annotated[GetTaskRequest, Tag("get")],
+        Annotated[CancelTaskRequest, Tag("cancel")],
+        Annotated[A2AMessage, Tag("other")],
+    ],
+    Discriminator(_request_tag)
+])
+
+
 class A2ATask(BaseModel):
     """A2A Task model with complete metadata."""
     task_id: str = Field(..., description="Unique task identifier")
@@ -34,21 +121,18 @@ class A2ATask(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     metadata: Dict[str, Any] = Field(default_factory=dict)
-    
-    def model_dump(self, **kwargs) -> Dict[str, Any]:
-        """Override to handle datetime serialization."""
-        data = super().model_dump(**kwargs)
-        data['created_at'] = self.created_at.isoformat()
-        data['updated_at'] = self.updated_at.isoformat()
-        return data
 
 
-class TaskYieldUpdate(BaseModel):
-    """Streaming update event for A2A tasks."""
+class TaskYieldUpdate(msgspec.Struct, frozen=True):
+    """Streaming update event for A2A tasks.
+    
+    Internal and created once per streamed chunk, so it is a plain struct
+    without validation; timestamp is nanoseconds since the epoch.
+    """
     task_id: str
     event_type: str = "yield"
-    data: Any
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    data: Any = None
+    timestamp: int = msgspec.field(default_factory=time.time_ns)
 
 
 class TimeRequest(BaseModel):
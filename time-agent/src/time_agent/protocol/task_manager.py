@@ -5,7 +5,8 @@ import logging
 import uuid
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .models import A2ATask, TaskStatus, TaskYieldUpdate
 
@@ -18,9 +19,12 @@ class TaskManager:
     def __init__(self):
         """Initialize task manager."""
         self._tasks: Dict[str, A2ATask] = {}
-        self._task_queues: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
+        # Update queues exist only for tasks someone has subscribed to
+        self._task_queues: Dict[str, asyncio.Queue] = {}
         self._task_callbacks: Dict[str, List[Callable]] = defaultdict(list)
-        self._lock = asyncio.Lock()
+        # One lock per task; tasks never wait on each other. Index updates
+        # need no lock since they never span an await.
+        self._task_locks: Dict[str, asyncio.Lock] = {}
     
     async def create_task(
         self,
@@ -38,18 +42,21 @@ class TaskManager:
         """
         task_id = task_id or str(uuid.uuid4())
         
-        async with self._lock:
-            task = A2ATask(
-                task_id=task_id,
-                status=TaskStatus.PENDING,
-                input_data=input_data
-            )
-            self._tasks[task_id] = task
-            
+        task = A2ATask(
+            task_id=task_id,
+            status=TaskStatus.PENDING,
+            input_data=input_data
+        )
+        # _tasks stays in creation order; a reused ID moves to the end
+        self._tasks.pop(task_id, None)
+        self._tasks[task_id] = task
+        lock = self._task_locks.setdefault(task_id, asyncio.Lock())
+        
+        async with lock:
             # Notify callbacks
             await self._notify_callbacks(task_id, "created", task)
             
-            logger.info(f"Created task {task_id}")
+            logger.info("Created task %s", task_id)
             return task
     
     async def update_task_status(
@@ -70,10 +77,15 @@ class TaskManager:
         Returns:
             Updated task or None if not found
         """
-        async with self._lock:
+        lock = self._task_locks.get(task_id)
+        if lock is None:
+            logger.warning("Task %s not found", task_id)
+            return None
+        
+        async with lock:
             task = self._tasks.get(task_id)
             if not task:
-                logger.warning(f"Task {task_id} not found")
+                logger.warning("Task %s not found", task_id)
                 return None
             
             task.status = status
@@ -85,10 +97,19 @@ class TaskManager:
             if error is not None:
                 task.error = error
             
+            # Publish to the task's update stream, if anyone is listening
+            queue = self._task_queues.get(task_id)
+            if queue is not None:
+                queue.put_nowait(TaskYieldUpdate(
+                    task_id=task_id,
+                    event_type="status",
+                    data=task.model_dump(mode="json")
+                ))
+            
             # Notify callbacks
             await self._notify_callbacks(task_id, "status_updated", task)
             
-            logger.info(f"Updated task {task_id} status to {status}")
+            logger.info("Updated task %s status to %s", task_id, status)
             return task
     
     async def yield_task_update(
@@ -108,7 +129,7 @@ class TaskManager:
             True if successful, False if task not found
         """
         if task_id not in self._tasks:
-            logger.warning(f"Task {task_id} not found for yield update")
+            logger.warning("Task %s not found for yield update", task_id)
             return False
         
         update = TaskYieldUpdate(
@@ -117,8 +138,10 @@ class TaskManager:
             data=data
         )
         
-        # Add to task queue
-        await self._task_queues[task_id].put(update)
+        # Add to task queue, if anyone is listening
+        queue = self._task_queues.get(task_id)
+        if queue is not None:
+            queue.put_nowait(update)
         
         # Notify callbacks
         await self._notify_callbacks(task_id, "yield", update)
@@ -139,37 +162,44 @@ class TaskManager:
     async def list_tasks(
         self,
         status: Optional[TaskStatus] = None,
-        limit: int = 100
-    ) -> List[A2ATask]:
-        """List tasks with optional filtering.
+        limit: int = 100,
+        offset: int = 0
+    ) -> Tuple[List[A2ATask], int]:
+        """List tasks with optional filtering, newest first.
         
         Args:
             status: Optional status filter
             limit: Maximum number of tasks to return
+            offset: Number of matching tasks to skip
             
         Returns:
-            List of tasks
+            Tuple of (tasks in the requested window, total matching tasks)
         """
-        tasks = list(self._tasks.values())
+        # _tasks is in creation order, so walking it backwards is newest first
+        tasks = reversed(self._tasks.values())
         
         if status:
-            tasks = [t for t in tasks if t.status == status]
-        
-        # Sort by creation time (newest first)
-        tasks.sort(key=lambda t: t.created_at, reverse=True)
+            matching = [t for t in tasks if t.status == status]
+            return matching[offset:offset + limit], len(matching)
         
-        return tasks[:limit]
+        return list(islice(tasks, offset, offset + limit)), len(self._tasks)
     
     async def get_task_updates(self, task_id: str) -> asyncio.Queue:
         """Get the update queue for a task.
         
+        Updates published before the first call are not queued; callers
+        should read the task's current state after subscribing.
+        
         Args:
             task_id: Task ID
             
         Returns:
             Update queue
         """
-        return self._task_queues[task_id]
+        queue = self._task_queues.get(task_id)
+        if queue is None:
+            queue = self._task_queues[task_id] = asyncio.Queue()
+        return queue
     
     def register_callback(self, task_id: str, callback: Callable):
         """Register a callback for task events.
@@ -188,19 +218,19 @@ class TaskManager:
             event: Event type
             data: Event data
         """
-        # Notify task-specific callbacks
-        for callback in self._task_callbacks.get(task_id, []):
-            try:
-                await callback(task_id, event, data)
-            except Exception as e:
-                logger.error(f"Callback error for task {task_id}: {e}")
-        
-        # Notify global callbacks
-        for callback in self._task_callbacks.get("*", []):
-            try:
-                await callback(task_id, event, data)
-            except Exception as e:
-                logger.error(f"Global callback error: {e}")
+        # Task-specific callbacks first, then global ones
+        callbacks = self._task_callbacks.get(task_id, []) + self._task_callbacks.get("*", [])
+        if not callbacks:
+            return
+        
+        # Run callbacks concurrently; one failing does not affect the others
+        results = await asyncio.gather(
+            *(callback(task_id, event, data) for callback in callbacks),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Callback error for task %s: %s", task_id, result)
     
     async def cleanup_task(self, task_id: str):
         """Clean up task resources.
@@ -208,7 +238,9 @@ class TaskManager:
         Args:
             task_id: Task ID
         """
-        async with self._lock:
+        lock = self._task_locks.pop(task_id, None) or asyncio.Lock()
+        
+        async with lock:
             if task_id in self._tasks:
                 del self._tasks[task_id]
             
@@ -218,4 +250,4 @@ class TaskManager:
             if task_id in self._task_callbacks:
                 del self._task_callbacks[task_id]
             
-            logger.info(f"Cleaned up task {task_id}")
\ No newline at end of file
+            logger.info("Cleaned up task %s", task_id)
\ No newline at end of file
@@ -1,11 +1,12 @@
 """Protocol validation utilities."""
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import ValidationError
 
-from .models import A2AMessage, TimeRequest
+from .models import A2ARequest, TimeRequest
 
 
 class ProtocolValidator:
@@ -26,6 +27,33 @@ class ProtocolValidator:
         'MST': 'America/Denver',
     }
     
+    # Common city to timezone mappings
+    CITY_TIMEZONES = {
+        'tokyo': 'Asia/Tokyo',
+        'new york': 'America/New_York',
+        'london': 'Europe/London',
+        'paris': 'Europe/Paris',
+        'sydney': 'Australia/Sydney',
+        'los angeles': 'America/Los_Angeles',
+        'chicago': 'America/Chicago',
+        'singapore': 'Asia/Singapore',
+        'hong kong': 'Asia/Hong_Kong',
+        'berlin': 'Europe/Berlin',
+    }
+    
+    # Cities and aliases (lowercased), each matched in one scan, longest first;
+    # a city named anywhere in the text wins over an alias
+    _ALIAS_TIMEZONES = {alias.lower(): tz for alias, tz in TIMEZONE_ALIASES.items()}
+    _CITY_RE = re.compile(
+        r"\b(" + "|".join(re.escape(k) for k in sorted(CITY_TIMEZONES, key=len, reverse=True)) + r")\b"
+    )
+    _ALIAS_RE = re.compile(
+        r"\b(" + "|".join(re.escape(k) for k in sorted(_ALIAS_TIMEZONES, key=len, reverse=True)) + r")\b"
+    )
+    
+    # Phrases asking for the current time
+    _CURRENT_TIME_RE = re.compile(r"what time|current time")
+    
     @classmethod
     def validate_a2a_message(cls, message: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         """Validate A2A protocol message format.
@@ -37,24 +65,28 @@ class ProtocolValidator:
             Tuple of (is_valid, error_message)
         """
         try:
-            A2AMessage(**message)
+            A2ARequest.validate_python(message)
             return True, None
         except ValidationError as e:
             return False, str(e)
     
     @classmethod
+    @lru_cache(maxsize=256)
     def validate_timezone(cls, timezone: str) -> Tuple[bool, Optional[str]]:
         """Validate timezone format and convert aliases.
         
+        Results are memoized; the same few zones are validated repeatedly.
+        
         Args:
             timezone: Timezone string
             
         Returns:
             Tuple of (is_valid, normalized_timezone_or_error)
         """
-        # Check for common aliases
-        if timezone.upper() in cls.TIMEZONE_ALIASES:
-            return True, cls.TIMEZONE_ALIASES[timezone.upper()]
+        # Check for common aliases; a hit skips the regex
+        alias = cls.TIMEZONE_ALIASES.get(timezone.upper())
+        if alias is not None:
+            return True, alias
         
         # Validate IANA format
         if cls.TIMEZONE_PATTERN.match(timezone):
@@ -63,6 +95,7 @@ class ProtocolValidator:
         return False, f"Invalid timezone format: {timezone}"
     
     @classmethod
+    @lru_cache(maxsize=256)
     def validate_time_format(cls, time: str) -> Tuple[bool, Optional[str]]:
         """Validate time format (HH:MM).
         
@@ -101,7 +134,7 @@ class ProtocolValidator:
             return None
         
         # Simple pattern matching for time requests
-        if "what time" in last_message or "current time" in last_message:
+        if cls._CURRENT_TIME_RE.search(last_message):
             # Extract timezone if mentioned
             timezone = cls._extract_timezone_from_text(last_message)
             return TimeRequest(
@@ -109,7 +142,7 @@ class ProtocolValidator:
                 timezone=timezone
             )
         
-        elif "convert" in last_message and ("time" in last_message or "timezone" in last_message):
+        elif "convert" in last_message and "time" in last_message:
             # This would need more sophisticated parsing in production
             return TimeRequest(operation="convert_time")
         
@@ -125,31 +158,13 @@ class ProtocolValidator:
         Returns:
             Extracted timezone or None
         """
-        # Look for common patterns like "in Tokyo" or "in New York"
-        import re
-        
-        # Common city to timezone mappings
-        city_timezones = {
-            'tokyo': 'Asia/Tokyo',
-            'new york': 'America/New_York',
-            'london': 'Europe/London',
-            'paris': 'Europe/Paris',
-            'sydney': 'Australia/Sydney',
-            'los angeles': 'America/Los_Angeles',
-            'chicago': 'America/Chicago',
-            'singapore': 'Asia/Singapore',
-            'hong kong': 'Asia/Hong_Kong',
-            'berlin': 'Europe/Berlin',
-        }
+        text = text.lower()
         
         # Try to find city names
-        for city, tz in city_timezones.items():
-            if city in text.lower():
-                return tz
+        match = cls._CITY_RE.search(text)
+        if match:
+            return cls.CITY_TIMEZONES[match.group(1)]
         
         # Try to find timezone abbreviations
-        for abbr, tz in cls.TIMEZONE_ALIASES.items():
-            if abbr.lower() in text.lower():
-                return tz
-        
-        return None
\ No newline at end of file
+        match = cls._ALIAS_RE.search(text)
+        return cls._ALIAS_TIMEZONES[match.group(1)] if match else None
\ No newline at end of file
@@ -2,6 +2,10 @@
 
 import logging
 import os
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Tuple
+
 from dotenv import load_dotenv
 
 import httpx
@@ -28,25 +32,29 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
-def create_app(host: str = '0.0.0.0', port: int = 8002) -> Starlette:
-    """Create and configure the A2A Starlette application.
+@lru_cache(maxsize=1)
+def _build_components() -> Tuple[TimeAgentExecutor, DefaultRequestHandler, httpx.AsyncClient]:
+    """Create the executor and A2A request handler once per process.
     
-    Args:
-        host: Server host
-        port: Server port
-        
-    Returns:
-        Built ASGI app ready for uvicorn
+    create_app runs both at import and from the CLI entry point; sharing
+    these keeps the agent, task store and HTTP client from being built
+    twice.
     """
-    # Setup logging
-    setup_logging()
-    
     # Create executor
     executor = TimeAgentExecutor()
     
     # Create A2A components
     task_store = InMemoryTaskStore()
-    httpx_client = httpx.AsyncClient()
+    # Outbound push notifications reuse pooled HTTP/2 connections
+    httpx_client = httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(10.0, connect=2.0),
+        limits=httpx.Limits(
+            max_connections=200,
+            max_keepalive_connections=100,
+            keepalive_expiry=30.0
+        )
+    )
     push_notifier = InMemoryPushNotifier(httpx_client)
     
     # Create A2A request handler
@@ -56,6 +64,43 @@ def create_app(host: str = '0.0.0.0', port: int = 8002) -> Starlette:
         push_notifier=push_notifier
     )
     
+    return executor, request_handler, httpx_client
+
+
+def create_app(host: str = '0.0.0.0', port: int = 8002) -> Starlette:
+    """Create and configure the A2A Starlette application.
+    
+    The server entry point runs without uvicorn's proxy header handling;
+    pass --proxy-headers when the agent sits behind a reverse proxy so
+    client addresses come from X-Forwarded-For.
+    
+    Args:
+        host: Server host
+        port: Server port
+        
+    Returns:
+        Built ASGI app ready for uvicorn
+    """
+    # Setup logging
+    setup_logging()
+    
+    executor, request_handler, httpx_client = _build_components()
+    
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        """Persist queued checkpoints and close pooled connections on shutdown."""
+        yield
+        try:
+            # Checkpoint writes are queued in the background; drain them
+            # before the process exits
+            await executor.state_synchronizer.flush()
+        except Exception as e:
+            logger.error("Failed to persist checkpoints on shutdown: %s", e)
+        finally:
+            await executor.checkpointer.close()
+            executor.storage_backend.close()
+            await httpx_client.aclose()
+    
     # Create routes handler
     routes_handler = TimeAgentRoutes(request_handler, executor)
     
@@ -71,10 +116,20 @@ def create_app(host: str = '0.0.0.0', port: int = 8002) -> Starlette:
     # Note: A2AStarletteApplication has its own routing and middleware
     # It already includes the necessary endpoints for A2A protocol
     
-    logger.info(f"Time Agent v1.0.0 configured for {host}:{port}")
+    logger.info("Time Agent v1.0.0 configured for %s:%s", host, port)
+    
+    # Build the ASGI app and add task status routes used by clients
+    app = a2a_app.build(lifespan=lifespan)
+    app.router.routes.extend([
+        Route("/tasks/{task_id}", routes_handler.get_task, methods=["GET"]),
+        Route("/tasks/{task_id}/events", routes_handler.stream_task, methods=["GET"]),
+    ])
+    
+    # Open-access deployments skip the authentication pass entirely
+    if settings.auth_required:
+        app.add_middleware(AuthenticationMiddleware, backend=A2AAuthenticationBackend())
     
-    # Return the built ASGI app
-    return a2a_app.build()
+    return app
 
 
 # Create app instance
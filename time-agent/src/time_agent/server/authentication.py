@@ -32,8 +32,8 @@ class A2AAuthenticationBackend(AuthenticationBackend):
         auth_header = conn.headers.get("Authorization")
         
         if not auth_header:
-            # No auth required for now (open access)
-            return AuthCredentials(["unauthenticated"]), SimpleUser("anonymous")
+            # Anonymous request; Starlette marks it unauthenticated
+            return None
         
         try:
             scheme, token = auth_header.split(" ", 1)
@@ -47,7 +47,7 @@ class A2AAuthenticationBackend(AuthenticationBackend):
             return AuthCredentials(["authenticated"]), SimpleUser("a2a_client")
             
         except Exception as e:
-            logger.error(f"Authentication error: {e}")
+            logger.error("Authentication error: %s", e)
             raise AuthenticationError("Invalid authentication credentials")
 
 
@@ -60,6 +60,8 @@ def get_current_user(conn: HTTPConnection) -> Optional[str]:
     Returns:
         Username or None
     """
-    if hasattr(conn, "user") and conn.user.is_authenticated:
-        return conn.user.username
+    # "user" is only in scope when AuthenticationMiddleware is installed
+    user = conn.scope.get("user")
+    if user is not None and user.is_authenticated:
+        return user.username
     return None
\ No newline at end of file
@@ -1,79 +1,120 @@
-"""Middleware stack for the server."""
+"""Middleware stack for the server.
+
+The middlewares are plain ASGI callables rather than BaseHTTPMiddleware
+subclasses, so they add no task group per request and do not buffer
+streaming responses.
+"""
 
 import logging
 import time
-from typing import Callable
+from typing import Any
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+import orjson
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+    
+    def render(self, content: Any) -> bytes:
+        """Serialize the response body."""
+        return orjson.dumps(content)
+
+
+class LoggingMiddleware:
     """Logs requests and responses."""
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and log details.
         
         Args:
-            request: Incoming request
-            call_next: Next middleware/handler
-            
-        Returns:
-            Response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        start_time = time.time()
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # Log request
-        logger.info(
-            f"Request: {request.method} {request.url.path} "
-            f"from {request.client.host if request.client else 'unknown'}"
-        )
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
         
-        try:
-            response = await call_next(request)
+        # Skip the request/response logging work entirely below INFO
+        if not logger.isEnabledFor(logging.INFO):
+            send_wrapper = send
+        else:
+            client = scope.get("client")
             
-            # Log response
-            duration = time.time() - start_time
+            # Log request
             logger.info(
-                f"Response: {response.status_code} for "
-                f"{request.method} {request.url.path} "
-                f"({duration:.3f}s)"
+                "Request: %s %s from %s",
+                method, path, client[0] if client else "unknown"
             )
             
-            return response
-            
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    # Log response
+                    logger.info(
+                        "Response: %s for %s %s (%.3fs)",
+                        message["status"], method, path,
+                        time.perf_counter() - start_time
+                    )
+                await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            duration = time.time() - start_time
             logger.error(
-                f"Error processing {request.method} {request.url.path}: "
-                f"{str(e)} ({duration:.3f}s)"
+                "Error processing %s %s: %s (%.3fs)",
+                method, path, e, time.perf_counter() - start_time
             )
             raise
 
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+class ErrorHandlingMiddleware:
     """Handles errors gracefully."""
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with error handling.
         
         Args:
-            request: Incoming request
-            call_next: Next middleware/handler
-            
-        Returns:
-            Response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            logger.error(f"Unhandled error: {e}", exc_info=True)
+            logger.error("Unhandled error: %s", e, exc_info=True)
+            
+            # Too late for an error response once headers are out
+            if response_started:
+                raise
             
             # Return JSON error response
-            return Response(
+            response = ORJSONResponse(
                 content={
                     "error": {
                         "code": -32603,
@@ -81,53 +122,58 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
                         "data": str(e) if logger.isEnabledFor(logging.DEBUG) else None
                     }
                 },
-                status_code=500,
-                media_type="application/json"
+                status_code=500
             )
+            await response(scope, receive, send)
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
+class MetricsMiddleware:
     """Collects basic metrics."""
     
-    def __init__(self, app):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp):
+        self.app = app
         self.request_count = 0
         self.error_count = 0
         self.total_duration = 0.0
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and collect metrics.
         
         Args:
-            request: Incoming request
-            call_next: Next middleware/handler
-            
-        Returns:
-            Response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        start_time = time.time()
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start_time = time.perf_counter()
         self.request_count += 1
+        request_count = self.request_count
+        
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                if message["status"] >= 400:
+                    self.error_count += 1
+                
+                duration = time.perf_counter() - start_time
+                
+                # Add metrics headers
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-request-count", str(request_count).encode()),
+                    (b"x-response-time", f"{duration:.3f}".encode()),
+                ]
+            await send(message)
         
         try:
-            response = await call_next(request)
-            
-            if response.status_code >= 400:
-                self.error_count += 1
-            
-            duration = time.time() - start_time
-            self.total_duration += duration
-            
-            # Add metrics headers
-            response.headers["X-Request-Count"] = str(self.request_count)
-            response.headers["X-Response-Time"] = f"{duration:.3f}"
-            
-            return response
-            
-        except Exception as e:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
             self.error_count += 1
-            duration = time.time() - start_time
-            self.total_duration += duration
             raise
+        finally:
+            self.total_duration += time.perf_counter() - start_time
     
     def get_metrics(self) -> dict:
         """Get collected metrics.
@@ -150,4 +196,4 @@ class MetricsMiddleware(BaseHTTPMiddleware):
                 else 0
             ),
             "average_duration": avg_duration
-        }
\ No newline at end of file
+        }
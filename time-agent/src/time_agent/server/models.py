@@ -1,55 +1,37 @@
 """Server-specific models for API requests/responses."""
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import List
 
 from a2a.types import (
     AgentCapabilities,
     AgentCard,
     AgentSkill,
 )
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
-
-class MessageRequest(BaseModel):
-    """A2A message request model."""
-    jsonrpc: str = "2.0"
-    method: str = "message"
-    params: Dict[str, Any] = Field(default_factory=dict)
-    id: Optional[str] = None
-
-
-class TaskResponse(BaseModel):
-    """Task creation response."""
-    task: Dict[str, Any]
+from ..protocol.models import A2ATask
 
 
 class TaskListResponse(BaseModel):
-    """Task list response."""
-    tasks: List[Dict[str, Any]]
+    """Task list response.
+    
+    Stays a Pydantic model so the nested A2ATask models serialize with it
+    in a single model_dump_json() pass.
+    """
+    tasks: List[A2ATask]
     total: int
     page: int = 1
     limit: int = 10
 
 
-class HealthResponse(BaseModel):
-    """Health check response."""
-    status: str
-    version: str
-    timestamp: datetime
-    services: Dict[str, str]
-    metrics: Optional[Dict[str, Any]] = None
-
-
-class ErrorResponse(BaseModel):
-    """Error response model."""
-    error: Dict[str, Any]
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
-
-
+@lru_cache(maxsize=8)
 def create_agent_card(host: str, port: int) -> AgentCard:
     """Create the A2A agent card for the time agent.
     
+    Cards are cached per (host, port); callers share the returned
+    instance and must not modify it.
+    
     Args:
         host: Server host address
         port: Server port number
@@ -3,19 +3,31 @@
 import logging
 from typing import Optional
 
+import orjson
 from a2a.server.request_handlers import DefaultRequestHandler
 from starlette.requests import Request
-from starlette.responses import JSONResponse, StreamingResponse
+from starlette.responses import JSONResponse, Response, StreamingResponse
 
 from ..adapters.a2a_executor import TimeAgentExecutor
 from ..common.config import settings
 from ..protocol.agent_card_generator import AgentCardGenerator
 from ..protocol.models import TaskStatus
-from ..streaming.sse_handler import SSEHandler
-from .models import ErrorResponse, HealthResponse, TaskListResponse
+from ..streaming.sse_handler import SSE_HEADERS, SSEHandler
+from .models import TaskListResponse
 
 logger = logging.getLogger(__name__)
 
+# Task statuses after which no further updates are streamed
+TERMINAL_STATUSES = {
+    TaskStatus.COMPLETED.value,
+    TaskStatus.FAILED.value,
+    TaskStatus.CANCELLED.value,
+}
+
+# Limits for coalescing queued task updates into one response chunk
+STREAM_BATCH_EVENTS = 16
+STREAM_BATCH_BYTES = 32 * 1024
+
 
 class TimeAgentRoutes:
     """Manages routes for the time agent server."""
@@ -31,8 +43,16 @@ class TimeAgentRoutes:
         self.executor = executor
         self.sse_handler = SSEHandler(executor.stream_event_queue)
         self.agent_card_generator = AgentCardGenerator()
+        
+        # Static part of the health response; probes only add the dynamic fields
+        health_info = self.agent_card_generator.generate_health_info()
+        self._healthy_template = {
+            "status": "healthy",
+            "version": "1.0.0",
+            "services": health_info.get("services", {}),
+        }
     
-    async def health(self, request: Request) -> JSONResponse:
+    async def health(self, request: Request) -> Response:
         """Health check endpoint.
         
         Args:
@@ -47,30 +67,25 @@ class TimeAgentRoutes:
             if hasattr(request.app.state, "metrics_middleware"):
                 metrics = request.app.state.metrics_middleware.get_metrics()
             
-            health_info = self.agent_card_generator.generate_health_info()
-            
-            # Add runtime metrics
-            if metrics:
-                health_info["metrics"] = metrics
+            response = {
+                **self._healthy_template,
+                "timestamp": datetime.utcnow(),
+                "metrics": metrics or None
+            }
             
-            response = HealthResponse(
-                status="healthy",
-                version="1.0.0",
-                timestamp=datetime.utcnow(),
-                services=health_info.get("services", {}),
-                metrics=health_info.get("metrics")
+            return Response(
+                content=orjson.dumps(response),
+                media_type="application/json"
             )
             
-            return JSONResponse(content=response.model_dump())
-            
         except Exception as e:
-            logger.error(f"Health check error: {e}")
+            logger.error("Health check error: %s", e)
             return JSONResponse(
                 content={"status": "unhealthy", "error": str(e)},
                 status_code=503
             )
     
-    async def agent_info(self, request: Request) -> JSONResponse:
+    async def agent_info(self, request: Request) -> Response:
         """Agent discovery endpoint (.well-known/agent.json).
         
         Args:
@@ -79,10 +94,12 @@ class TimeAgentRoutes:
         Returns:
             Agent metadata response
         """
-        agent_card = self.agent_card_generator.generate()
-        return JSONResponse(content=agent_card)
+        return Response(
+            content=self.agent_card_generator.generate_bytes(),
+            media_type="application/json"
+        )
     
-    async def list_tasks(self, request: Request) -> JSONResponse:
+    async def list_tasks(self, request: Request) -> Response:
         """List tasks endpoint.
         
         Args:
@@ -108,37 +125,34 @@ class TimeAgentRoutes:
                         status_code=400
                     )
             
-            # Get tasks from task manager
-            all_tasks = await self.executor.task_manager.list_tasks(
+            # Get the requested page from task manager
+            tasks, total = await self.executor.task_manager.list_tasks(
                 status=task_status,
-                limit=limit * page  # Get enough for pagination
+                limit=limit,
+                offset=(page - 1) * limit
             )
             
-            # Paginate
-            start_idx = (page - 1) * limit
-            end_idx = start_idx + limit
-            tasks = all_tasks[start_idx:end_idx]
-            
-            # Convert to response format
-            task_dicts = [task.model_dump() for task in tasks]
-            
+            # Tasks are serialized along with the response in one pass
             response = TaskListResponse(
-                tasks=task_dicts,
-                total=len(all_tasks),
+                tasks=tasks,
+                total=total,
                 page=page,
                 limit=limit
             )
             
-            return JSONResponse(content=response.model_dump())
+            return Response(
+                content=response.model_dump_json(),
+                media_type="application/json"
+            )
             
         except Exception as e:
-            logger.error(f"Error listing tasks: {e}")
+            logger.error("Error listing tasks: %s", e)
             return JSONResponse(
                 content={"error": str(e)},
                 status_code=500
             )
     
-    async def get_task(self, request: Request) -> JSONResponse:
+    async def get_task(self, request: Request) -> Response:
         """Get specific task details.
         
         Args:
@@ -164,10 +178,13 @@ class TimeAgentRoutes:
                     status_code=404
                 )
             
-            return JSONResponse(content=task.model_dump())
+            return Response(
+                content=task.model_dump_json(),
+                media_type="application/json"
+            )
             
         except Exception as e:
-            logger.error(f"Error getting task {task_id}: {e}")
+            logger.error("Error getting task %s: %s", task_id, e)
             return JSONResponse(
                 content={"error": str(e)},
                 status_code=500
@@ -186,7 +203,7 @@ class TimeAgentRoutes:
         client_id = request.headers.get("X-Client-ID")
         last_event_id = request.headers.get("Last-Event-ID")
         
-        logger.info(f"Starting SSE stream for client {client_id}")
+        logger.info("Starting SSE stream for client %s", client_id)
         
         return self.sse_handler.create_response(
             client_id=client_id,
@@ -210,21 +227,66 @@ class TimeAgentRoutes:
                 status_code=400
             )
         
+        task = await self.executor.task_manager.get_task(task_id)
+        if not task:
+            return JSONResponse(
+                content={"error": f"Task {task_id} not found"},
+                status_code=404
+            )
+        
         # Create task-specific SSE stream
         async def task_event_stream():
             """Stream events for specific task."""
             queue = await self.executor.task_manager.get_task_updates(task_id)
             
+            # Current state first, so a task that already finished ends the
+            # stream at once instead of waiting for an update
+            yield self.sse_handler.formatter.format_task_event(
+                task_id=task_id,
+                event_type="status",
+                data=task.model_dump(mode="json")
+            )
+            if task.status.value in TERMINAL_STATUSES:
+                return
+            
+            format_task_event = self.sse_handler.formatter.format_task_event
+            
             while True:
                 try:
+                    # Wait for one update, then coalesce whatever backlog is
+                    # already queued into a single chunk
                     update = await queue.get()
-                    yield self.sse_handler.formatter.format_task_event(
-                        task_id=task_id,
-                        event_type=update.event_type,
-                        data=update.data
-                    )
+                    frames = []
+                    size = 0
+                    
+                    while True:
+                        frame = format_task_event(
+                            task_id=task_id,
+                            event_type=update.event_type,
+                            data=update.data
+                        )
+                        frames.append(frame)
+                        size += len(frame)
+                        
+                        finished = (
+                            update.event_type == "status"
+                            and update.data["status"] in TERMINAL_STATUSES
+                        )
+                        if (
+                            finished
+                            or queue.empty()
+                            or len(frames) >= STREAM_BATCH_EVENTS
+                            or size >= STREAM_BATCH_BYTES
+                        ):
+                            break
+                        update = queue.get_nowait()
+                    
+                    yield b"".join(frames)
+                    
+                    if finished:
+                        break
                 except Exception as e:
-                    logger.error(f"Error streaming task {task_id}: {e}")
+                    logger.error("Error streaming task %s: %s", task_id, e)
                     yield self.sse_handler.formatter.format_event(
                         data={"error": str(e)},
                         event="error"
@@ -234,10 +296,7 @@ class TimeAgentRoutes:
         return StreamingResponse(
             task_event_stream(),
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-            }
+            headers=SSE_HEADERS
         )
 
 
@@ -1,13 +1,15 @@
 """Streaming subsystem for SSE support."""
 
-from .event_queue import EventQueue
+from .event_queue import EventQueue, TaskEvent
 from .formatters import SSEFormatter
 from .sse_handler import SSEHandler
-from .stream_converter import StreamConverter
+from .stream_converter import StreamConverter, StreamEvent
 
 __all__ = [
     "EventQueue",
     "SSEFormatter",
     "SSEHandler",
     "StreamConverter",
+    "StreamEvent",
+    "TaskEvent",
 ]
\ No newline at end of file
@@ -2,15 +2,36 @@
 
 import asyncio
 import logging
+import weakref
 from collections import deque
-from datetime import datetime
+from itertools import count
 from typing import Any, Deque, Optional
 
+import msgspec
+
+from .formatters import SSEFormatter
+
 logger = logging.getLogger(__name__)
 
 
+class TaskEvent(msgspec.Struct, frozen=True):
+    """Task-scoped event published to the queue.
+    
+    Anything else put on the queue is streamed as a generic event.
+    """
+    task_id: str
+    type: str
+    data: Any
+
+
 class EventQueue:
-    """Manages event queuing with history for reconnection support."""
+    """Manages event queuing with history for reconnection support.
+    
+    Events are formatted into SSE frames once, when published; subscribers
+    and the history share the same bytes. Each frame carries a sequence
+    number as its SSE id, which reconnecting clients send back as
+    Last-Event-ID.
+    """
     
     def __init__(self, max_history: int = 100):
         """Initialize event queue.
@@ -18,10 +39,28 @@ class EventQueue:
         Args:
             max_history: Maximum number of events to keep in history
         """
-        self._queue: asyncio.Queue = asyncio.Queue()
-        self._history: Deque[tuple[datetime, Any]] = deque(maxlen=max_history)
-        self._subscribers: list[asyncio.Queue] = []
-        self._lock = asyncio.Lock()
+        # (event id, SSE frame) pairs
+        self._history: Deque[tuple[int, bytes]] = deque(maxlen=max_history)
+        self._event_ids = count(1)
+        # Held weakly: a stream that dies without unsubscribing stops
+        # receiving events once its queue is collected
+        self._subscribers: weakref.WeakSet[asyncio.Queue] = weakref.WeakSet()
+    
+    def _frame(self, event: Any) -> tuple[int, bytes]:
+        """Assign the next event ID and format the event as an SSE frame."""
+        event_id = next(self._event_ids)
+        
+        if type(event) is TaskEvent:
+            frame = SSEFormatter.format_task_event(
+                task_id=event.task_id,
+                event_type=event.type,
+                data=event.data,
+                id=str(event_id)
+            )
+        else:
+            frame = SSEFormatter.format_event(data=event, id=str(event_id))
+        
+        return event_id, frame
     
     async def put(self, event: Any):
         """Add an event to the queue.
@@ -29,40 +68,48 @@ class EventQueue:
         Args:
             event: Event to add
         """
-        timestamp = datetime.utcnow()
+        entry = self._frame(event)
         
-        async with self._lock:
-            # Add to history
-            self._history.append((timestamp, event))
-            
-            # Add to main queue
-            await self._queue.put(event)
-            
-            # Notify all subscribers
-            for subscriber in self._subscribers:
-                try:
-                    await subscriber.put(event)
-                except asyncio.QueueFull:
-                    logger.warning("Subscriber queue full, dropping event")
+        # No lock: nothing below awaits, so the subscriber set cannot
+        # change while we fan out on the event loop
+        self._history.append(entry)
+        
+        # Notify all subscribers without letting a slow one stall publishers
+        for subscriber in self._subscribers:
+            try:
+                subscriber.put_nowait(entry[1])
+            except asyncio.QueueFull:
+                logger.warning("Subscriber queue full, dropping event")
     
-    async def get(self) -> Any:
-        """Get the next event from the queue.
+    async def put_many(self, events: list[Any]):
+        """Add several events to the queue in one pass.
         
-        Returns:
-            Next event
+        Args:
+            events: Events to add, in order
         """
-        return await self._queue.get()
+        entries = [self._frame(event) for event in events]
+        
+        self._history.extend(entries)
+        
+        # Notify all subscribers
+        for subscriber in self._subscribers:
+            for _, frame in entries:
+                try:
+                    subscriber.put_nowait(frame)
+                except asyncio.QueueFull:
+                    logger.warning("Subscriber queue full, dropping event")
     
     async def subscribe(self) -> asyncio.Queue:
-        """Create a new subscriber queue.
+        """Create a new subscriber queue of SSE frames.
+        
+        The queue is held weakly, so callers keep their own reference for
+        as long as they consume it.
         
         Returns:
             Subscriber queue
         """
         subscriber_queue = asyncio.Queue(maxsize=50)
-        
-        async with self._lock:
-            self._subscribers.append(subscriber_queue)
+        self._subscribers.add(subscriber_queue)
         
         return subscriber_queue
     
@@ -72,36 +119,34 @@ class EventQueue:
         Args:
             queue: Queue to remove
         """
-        async with self._lock:
-            if queue in self._subscribers:
-                self._subscribers.remove(queue)
+        self._subscribers.discard(queue)
     
     def get_history(
         self,
-        since: Optional[datetime] = None,
+        since_id: Optional[int] = None,
         limit: Optional[int] = None
-    ) -> list[Any]:
+    ) -> list[bytes]:
         """Get event history.
         
         Args:
-            since: Optional timestamp to get events after
+            since_id: Optional event ID to get events after
             limit: Optional maximum number of events
             
         Returns:
-            List of historical events
+            List of historical SSE frames, oldest first
         """
-        events = []
+        frames = []
         
-        for timestamp, event in self._history:
-            if since and timestamp <= since:
+        for event_id, frame in self._history:
+            if since_id is not None and event_id <= since_id:
                 continue
             
-            events.append(event)
+            frames.append(frame)
             
-            if limit and len(events) >= limit:
+            if limit and len(frames) >= limit:
                 break
         
-        return events
+        return frames
     
     def clear_history(self):
         """Clear event history."""
@@ -1,8 +1,12 @@
 """SSE formatting utilities."""
 
-import json
 from typing import Any, Dict, Optional
 
+import orjson
+
+# Naive datetimes in event data are UTC; emit them with a "Z" suffix
+_JSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
 
 class SSEFormatter:
     """Formats data for Server-Sent Events."""
@@ -13,7 +17,7 @@ class SSEFormatter:
         event: Optional[str] = None,
         id: Optional[str] = None,
         retry: Optional[int] = None
-    ) -> str:
+    ) -> bytes:
         """Format data as SSE event.
         
         Args:
@@ -23,56 +27,59 @@ class SSEFormatter:
             retry: Optional retry interval in milliseconds
             
         Returns:
-            SSE-formatted string
+            SSE-formatted bytes, ready to write to the response
         """
         lines = []
         
         if id:
-            lines.append(f"id: {id}")
+            lines.append(b"id: " + id.encode())
         
         if event:
-            lines.append(f"event: {event}")
+            lines.append(b"event: " + event.encode())
         
         if retry is not None:
-            lines.append(f"retry: {retry}")
+            lines.append(b"retry: %d" % retry)
         
         # Format data
         if isinstance(data, str):
-            lines.append(f"data: {data}")
+            lines.append(b"data: " + data.encode())
         else:
-            # JSON serialize non-string data
-            lines.append(f"data: {json.dumps(data)}")
+            # JSON serialize non-string data; objects without a JSON form
+            # (e.g. LangChain messages in agent updates) become strings
+            lines.append(b"data: " + orjson.dumps(data, default=str, option=_JSON_OPTIONS))
         
         # SSE requires double newline at end
-        return "\n".join(lines) + "\n\n"
+        return b"\n".join(lines) + b"\n\n"
     
     @staticmethod
-    def format_comment(comment: str) -> str:
+    def format_comment(comment: str) -> bytes:
         """Format a comment (keep-alive).
         
         Args:
             comment: Comment text
             
         Returns:
-            SSE comment string
+            SSE comment bytes
         """
-        return f": {comment}\n\n"
+        return b": " + comment.encode() + b"\n\n"
     
     @staticmethod
     def format_task_event(
         task_id: str,
         event_type: str,
-        data: Dict[str, Any]
-    ) -> str:
+        data: Dict[str, Any],
+        id: Optional[str] = None
+    ) -> bytes:
         """Format a task-specific event.
         
         Args:
             task_id: Task ID
             event_type: Event type
             data: Event data
+            id: Optional event ID (defaults to the task ID)
             
         Returns:
-            SSE-formatted string
+            SSE-formatted bytes
         """
         event_data = {
             "task_id": task_id,
@@ -83,5 +90,5 @@ class SSEFormatter:
         return SSEFormatter.format_event(
             data=event_data,
             event="task_update",
-            id=task_id
+            id=id or task_id
         )
\ No newline at end of file
@@ -2,16 +2,26 @@
 
 import asyncio
 import logging
-from datetime import datetime
 from typing import Any, AsyncGenerator, Optional
 
 from starlette.responses import StreamingResponse
 
-from .event_queue import EventQueue
+from .event_queue import EventQueue, TaskEvent
 from .formatters import SSEFormatter
 
 logger = logging.getLogger(__name__)
 
+# Fixed comment frames, shared by every stream
+CONNECTED_FRAME = b": connected\n\n"
+KEEPALIVE_FRAME = b": keep-alive\n\n"
+
+# Response headers for every SSE stream; Starlette copies them per response
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # Disable nginx buffering
+}
+
 
 class SSEHandler:
     """Handles Server-Sent Events streaming."""
@@ -29,7 +39,7 @@ class SSEHandler:
         self,
         client_id: Optional[str] = None,
         last_event_id: Optional[str] = None
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[bytes, None]:
         """Stream events to a client.
         
         Args:
@@ -37,47 +47,45 @@ class SSEHandler:
             last_event_id: Optional last received event ID for reconnection
             
         Yields:
-            SSE-formatted events
+            SSE-formatted events as bytes
         """
-        logger.info(f"Starting SSE stream for client {client_id}")
+        logger.info("Starting SSE stream for client %s", client_id)
         
         # Send initial comment to establish connection
-        yield self.formatter.format_comment("connected")
-        
-        # If reconnecting, send missed events from history
-        if last_event_id:
-            # In a real implementation, you'd parse the last_event_id
-            # to determine which events to replay
-            logger.info(f"Client {client_id} reconnecting from event {last_event_id}")
+        yield CONNECTED_FRAME
         
         # Subscribe to events
         subscriber_queue = await self.event_queue.subscribe()
         
         try:
+            # If reconnecting, replay missed events from history. Nothing
+            # awaits between subscribing and the snapshot, so no event is
+            # both replayed and queued.
+            if last_event_id:
+                logger.info("Client %s reconnecting from event %s", client_id, last_event_id)
+                try:
+                    since_id = int(last_event_id)
+                except ValueError:
+                    since_id = None
+                
+                if since_id is not None:
+                    for frame in self.event_queue.get_history(since_id=since_id):
+                        yield frame
+            
             while True:
                 try:
-                    # Wait for events with timeout for keep-alive
-                    event = await asyncio.wait_for(
+                    # Wait for pre-formatted frames with timeout for keep-alive
+                    yield await asyncio.wait_for(
                         subscriber_queue.get(),
                         timeout=30.0
                     )
                     
-                    # Format and yield event
-                    if isinstance(event, dict) and "task_id" in event:
-                        yield self.formatter.format_task_event(
-                            task_id=event["task_id"],
-                            event_type=event.get("type", "update"),
-                            data=event.get("data", {})
-                        )
-                    else:
-                        yield self.formatter.format_event(data=event)
-                    
                 except asyncio.TimeoutError:
                     # Send keep-alive comment
-                    yield self.formatter.format_comment("keep-alive")
+                    yield KEEPALIVE_FRAME
                     
                 except Exception as e:
-                    logger.error(f"Error streaming event: {e}")
+                    logger.error("Error streaming event: %s", e)
                     yield self.formatter.format_event(
                         data={"error": str(e)},
                         event="error"
@@ -86,7 +94,7 @@ class SSEHandler:
         finally:
             # Unsubscribe when done
             await self.event_queue.unsubscribe(subscriber_queue)
-            logger.info(f"Ended SSE stream for client {client_id}")
+            logger.info("Ended SSE stream for client %s", client_id)
     
     def create_response(
         self,
@@ -105,11 +113,7 @@ class SSEHandler:
         return StreamingResponse(
             self.stream_events(client_id, last_event_id),
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",  # Disable nginx buffering
-            }
+            headers=SSE_HEADERS
         )
     
     async def broadcast_event(self, event: Any):
@@ -133,11 +137,4 @@ class SSEHandler:
             event_type: Type of update
             data: Update data
         """
-        event = {
-            "task_id": task_id,
-            "type": event_type,
-            "data": data,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        
-        await self.broadcast_event(event)
\ No newline at end of file
+        await self.broadcast_event(TaskEvent(task_id, event_type, data))
\ No newline at end of file
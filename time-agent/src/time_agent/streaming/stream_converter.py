@@ -1,148 +1,255 @@
 """Stream conversion utilities for LangGraph to SSE."""
 
-import json
+import asyncio
 import logging
-from typing import Any, AsyncGenerator, Dict
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Callable, Dict, Optional
 
+import msgspec
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
 logger = logging.getLogger(__name__)
 
 
+class StreamEvent(msgspec.Struct, frozen=True, gc=False):
+    """Event converted from one agent stream chunk.
+    
+    One is created per streamed chunk, so it is a small untracked struct
+    rather than a dict; it never takes part in reference cycles.
+    """
+    type: str
+    data: Any
+
+
+def _as_human(message: HumanMessage) -> StreamEvent:
+    """Convert a human message to an event."""
+    return StreamEvent("human_message", {
+        "content": message.content,
+        "role": "user"
+    })
+
+
+def _as_ai(message: AIMessage) -> StreamEvent:
+    """Convert an AI message to an event."""
+    event_data = {
+        "content": message.content,
+        "role": "assistant"
+    }
+    
+    # Include tool calls if present; AIMessage validates each one into a
+    # ToolCall, which always has name and args
+    if message.tool_calls:
+        event_data["tool_calls"] = [
+            {
+                "name": tc["name"],
+                "args": tc["args"]
+            }
+            for tc in message.tool_calls
+        ]
+    
+    return StreamEvent("ai_message", event_data)
+
+
+def _as_system(message: SystemMessage) -> StreamEvent:
+    """Convert a system message to an event."""
+    return StreamEvent("system_message", {
+        "content": message.content,
+        "role": "system"
+    })
+
+
+def _as_generic(message: Any) -> StreamEvent:
+    """Convert any other message to a generic event."""
+    return StreamEvent("message", {
+        "content": str(message),
+        "role": "unknown"
+    })
+
+
+# Known message classes and their converters, checked in order on a miss
+_BASE_HANDLERS = (
+    (HumanMessage, _as_human),
+    (AIMessage, _as_ai),
+    (SystemMessage, _as_system),
+)
+
+# Exact message class -> converter; subclasses are added on first sight
+_MSG_HANDLERS: Dict[type, Callable[[Any], StreamEvent]] = dict(_BASE_HANDLERS)
+
+
+def _resolve_handler(message_type: type) -> Callable[[Any], StreamEvent]:
+    """Find and cache the converter for a message class missing from _MSG_HANDLERS."""
+    for base, handler in _BASE_HANDLERS:
+        if issubclass(message_type, base):
+            break
+    else:
+        handler = _as_generic
+    
+    _MSG_HANDLERS[message_type] = handler
+    return handler
+
+
+# Recognized LangGraph chunk keys, by priority when several are present
+_CHUNK_KEY_RANK = {"messages": 0, "agent": 1, "tools": 2}
+
+# Chunk key -> event type for chunks forwarded as a single event
+_CHUNK_EVENT_TYPES = {
+    "agent": "agent_update",
+    "tools": "tool_call",
+}
+
+# Batched streams group up to STREAM_BATCH_SIZE events, or fewer once no
+# new event has arrived for STREAM_BATCH_LINGER seconds
+STREAM_BATCH_SIZE = 8
+STREAM_BATCH_LINGER = 0.005
+
+
+async def _batched(
+    source: AsyncGenerator[Any, None],
+    size: int,
+    linger: float
+) -> AsyncGenerator[list, None]:
+    """Group items from an async iterator into lists without delaying the first one."""
+    items = source.__aiter__()
+    pending: Optional[asyncio.Future] = None
+    batch: list = []
+    
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(items.__anext__())
+            
+            # With items batched, only wait up to the linger time for more;
+            # the pending fetch is kept, not cancelled, on timeout
+            if batch:
+                done, _ = await asyncio.wait({pending}, timeout=linger)
+                if not done:
+                    yield batch
+                    batch = []
+                    continue
+            
+            try:
+                item = await pending
+            except StopAsyncIteration:
+                break
+            finally:
+                pending = None
+            
+            batch.append(item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        
+        if batch:
+            yield batch
+    
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
 class StreamConverter:
     """Converts LangGraph streaming output to SSE format."""
     
     @staticmethod
     async def convert_agent_stream(
         agent_stream: AsyncGenerator[Any, None]
-    ) -> AsyncGenerator[Dict[str, Any], None]:
+    ) -> AsyncGenerator[StreamEvent, None]:
         """Convert LangGraph agent stream to structured events.
         
         Args:
             agent_stream: Raw agent stream
             
         Yields:
-            Structured event dictionaries
+            Structured events
         """
         try:
             async for chunk in agent_stream:
                 # Handle different chunk types from LangGraph
                 if isinstance(chunk, dict):
-                    # Check for specific LangGraph event types
-                    if "messages" in chunk:
+                    # Pick the known key by priority in one C-level set
+                    # intersection instead of a chain of membership tests
+                    matched = chunk.keys() & _CHUNK_KEY_RANK.keys()
+                    key = min(matched, key=_CHUNK_KEY_RANK.__getitem__) if matched else None
+                    
+                    if key == "messages":
                         # Extract and yield message updates
                         for message in chunk["messages"]:
                             yield StreamConverter._convert_message(message)
                     
-                    elif "agent" in chunk:
-                        # Agent state update
-                        yield {
-                            "type": "agent_update",
-                            "data": chunk["agent"]
-                        }
-                    
-                    elif "tools" in chunk:
-                        # Tool invocation
-                        yield {
-                            "type": "tool_call",
-                            "data": chunk["tools"]
-                        }
+                    elif key is not None:
+                        # Agent state update or tool invocation
+                        yield StreamEvent(_CHUNK_EVENT_TYPES[key], chunk[key])
                     
                     else:
                         # Generic update
-                        yield {
-                            "type": "update",
-                            "data": chunk
-                        }
+                        yield StreamEvent("update", chunk)
                 
                 else:
                     # Handle other types (strings, etc.)
-                    yield {
-                        "type": "content",
-                        "data": str(chunk)
-                    }
+                    yield StreamEvent("content", str(chunk))
         
         except Exception as e:
-            logger.error(f"Error converting stream: {e}")
-            yield {
-                "type": "error",
-                "data": {"error": str(e)}
-            }
+            logger.error("Error converting stream: %s", e)
+            yield StreamEvent("error", {"error": str(e)})
+    
+    @staticmethod
+    async def convert_agent_stream_batched(
+        agent_stream: AsyncGenerator[Any, None],
+        max_batch: int = STREAM_BATCH_SIZE,
+        linger: float = STREAM_BATCH_LINGER
+    ) -> AsyncGenerator[StreamEvent, None]:
+        """Convert LangGraph agent stream to batches of structured events.
+        
+        Consumers resume once per batch rather than once per event, which
+        pays off when the agent emits many small chunks in quick succession.
+        
+        Args:
+            agent_stream: Raw agent stream
+            max_batch: Maximum number of events per batch
+            linger: Seconds to wait for another event before sending a batch
+            
+        Yields:
+            "batch" events whose data is a list of structured events
+        """
+        events = StreamConverter.convert_agent_stream(agent_stream)
+        # Closing this stream early also cancels the batcher's pending fetch
+        async with aclosing(_batched(events, max_batch, linger)) as batches:
+            async for batch in batches:
+                yield StreamEvent("batch", batch)
     
     @staticmethod
-    def _convert_message(message: Any) -> Dict[str, Any]:
+    def _convert_message(message: Any) -> StreamEvent:
         """Convert a LangChain message to event format.
         
         Args:
             message: LangChain message
             
         Returns:
-            Event dictionary
+            Stream event
         """
-        if isinstance(message, HumanMessage):
-            return {
-                "type": "human_message",
-                "data": {
-                    "content": message.content,
-                    "role": "user"
-                }
-            }
-        
-        elif isinstance(message, AIMessage):
-            event_data = {
-                "content": message.content,
-                "role": "assistant"
-            }
-            
-            # Include tool calls if present
-            if hasattr(message, "tool_calls") and message.tool_calls:
-                event_data["tool_calls"] = [
-                    {
-                        "name": tc.get("name"),
-                        "args": tc.get("args", {})
-                    }
-                    for tc in message.tool_calls
-                ]
-            
-            return {
-                "type": "ai_message",
-                "data": event_data
-            }
-        
-        elif isinstance(message, SystemMessage):
-            return {
-                "type": "system_message",
-                "data": {
-                    "content": message.content,
-                    "role": "system"
-                }
-            }
-        
-        else:
-            # Generic message
-            return {
-                "type": "message",
-                "data": {
-                    "content": str(message),
-                    "role": "unknown"
-                }
-            }
+        handler = _MSG_HANDLERS.get(type(message))
+        if handler is None:
+            handler = _resolve_handler(type(message))
+        return handler(message)
     
     @staticmethod
-    def format_final_response(messages: list) -> Dict[str, Any]:
+    def format_final_response(messages: list, start: int = 0) -> Dict[str, Any]:
         """Format the final response from a conversation.
         
         Args:
             messages: List of messages
+            start: Index of the first message produced by the run; earlier
+                history is not scanned
             
         Returns:
             Final response dictionary
         """
-        # Find the last AI message
+        # Find the last AI message among the run's own messages
         last_ai_message = None
-        for message in reversed(messages):
-            if isinstance(message, AIMessage):
-                last_ai_message = message
+        for i in range(len(messages) - 1, start - 1, -1):
+            if isinstance(messages[i], AIMessage):
+                last_ai_message = messages[i]
                 break
         
         if last_ai_message:
@@ -150,7 +257,7 @@ class StreamConverter:
                 "type": "final_response",
                 "data": {
                     "content": last_ai_message.content,
-                    "tool_calls": getattr(last_ai_message, "tool_calls", [])
+                    "tool_calls": last_ai_message.tool_calls
                 }
             }
         
@@ -1,36 +1,35 @@
 #!/usr/bin/env python3
 """Test time agent response format."""
-import httpx
 import json
 import time
 
+import orjson
+
+from _http import client
+
+# A2A message/send request, serialized once at import
+SEND_BODY = orjson.dumps({
+    "jsonrpc": "2.0",
+    "method": "message/send",
+    "params": {
+        "message": {
+            "messageId": "test-001",
+            "role": "user",
+            "parts": [{"text": "What time is it in Seoul?"}],
+            "contextId": "test"
+        }
+    },
+    "id": 1
+})
+
 def test_time_agent():
     """Test time agent A2A response format."""
     print("Time Agent Response Format Test")
     print("="*50)
     
     # Send A2A message
-    data = {
-        "jsonrpc": "2.0",
-        "method": "message/send",
-        "params": {
-            "message": {
-                "messageId": "test-001",
-                "role": "user",
-                "parts": [{"text": "What time is it in Seoul?"}],
-                "contextId": "test"
-            }
-        },
-        "id": 1
-    }
-    
     print("Sending request...")
-    response = httpx.post(
-        "http://localhost:10001/",
-        json=data,
-        headers={"Content-Type": "application/json"},
-        timeout=30.0
-    )
+    response = client().post("/", content=SEND_BODY)
     
     print(f"Status: {response.status_code}")
     result = response.json()
@@ -45,15 +44,16 @@ def test_time_agent():
         "params": {"id": task_id},
         "id": 2
     }
+    # The poll request never changes; serialize it once
+    poll_body = orjson.dumps(poll_data)
     
-    for i in range(10):
-        time.sleep(1)
-        poll_response = httpx.post(
-            "http://localhost:10001/",
-            json=poll_data,
-            headers={"Content-Type": "application/json"},
-            timeout=30.0
-        )
+    # Back off from 50ms up to 1s between polls, for at most 10s
+    delay = 0.05
+    deadline = time.monotonic() + 10.0
+    while time.monotonic() < deadline:
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+        poll_response = client().post("/", content=poll_body)
         
         if poll_response.status_code == 200:
             poll_result = poll_response.json()
@@ -1,15 +1,16 @@
 #!/usr/bin/env python
 """Test the time agent server."""
 
-import httpx
 import json
 import time
 
+from _http import TOKYO_QUERY, client
+
 
 def test_health():
     """Test health endpoint."""
     try:
-        response = httpx.get("http://localhost:10001/health")
+        response = client().get("/health")
         print(f"Health check: {response.status_code}")
         if response.status_code == 200:
             print(f"Response: {response.json()}")
@@ -20,7 +21,7 @@ def test_health():
 def test_agent_discovery():
     """Test agent discovery endpoint."""
     try:
-        response = httpx.get("http://localhost:10001/.well-known/agent.json")
+        response = client().get("/.well-known/agent.json")
         print(f"\nAgent discovery: {response.status_code}")
         if response.status_code == 200:
             print(f"Agent info: {json.dumps(response.json(), indent=2)}")
@@ -30,20 +31,9 @@ def test_agent_discovery():
 
 def test_a2a_message():
     """Test A2A message endpoint."""
-    message = {
-        "jsonrpc": "2.0",
-        "method": "message",
-        "params": {
-            "messages": [
-                {"role": "user", "content": "What time is it in Tokyo?"}
-            ]
-        },
-        "id": "test-1"
-    }
-    
     try:
         # Send message
-        response = httpx.post("http://localhost:10001/message", json=message, timeout=30.0)
+        response = client().post("/message", content=TOKYO_QUERY)
         print(f"\nA2A message: {response.status_code}")
         result = response.json()
         print(f"Response: {json.dumps(result, indent=2)}")
@@ -54,9 +44,13 @@ def test_a2a_message():
             print(f"\nPolling task {task_id}...")
             
             # Poll for completion
-            for i in range(10):
-                time.sleep(2)
-                task_response = httpx.get(f"http://localhost:10001/tasks/{task_id}")
+            # Back off from 50ms up to 2s between polls, for at most 20s
+            delay = 0.05
+            deadline = time.monotonic() + 20.0
+            while time.monotonic() < deadline:
+                time.sleep(delay)
+                delay = min(delay * 2, 2.0)
+                task_response = client().get(f"/tasks/{task_id}")
                 if task_response.status_code == 200:
                     task_data = task_response.json()
                     print(f"Task status: {task_data.get('status')}")
@@ -2,20 +2,43 @@
 """Test server health endpoint."""
 
 import httpx
-import asyncio
+import pytest
+import pytest_asyncio
 
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
 
-async def test_health():
+BASE_URL = "http://localhost:8002"
+
+# Every test shares the session's event loop, and with it the client below
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Shared HTTP/2 client; requests multiplex over one connection."""
+    async with httpx.AsyncClient(base_url=BASE_URL, http2=True) as client:
+        yield client
+
+
+async def test_health(client: httpx.AsyncClient):
     """Test the health endpoint."""
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get("http://localhost:8002/health")
-            print(f"Status: {response.status_code}")
-            print(f"Response: {response.json()}")
-        except Exception as e:
-            print(f"Error: {e}")
-            print("Make sure the server is running!")
+    try:
+        response = await client.get("/health")
+        print(f"Status: {response.status_code}")
+        print(f"Response: {response.json()}")
+    except Exception as e:
+        print(f"Error: {e}")
+        print("Make sure the server is running!")
+
+
+async def main():
+    """Run the checks outside pytest with a client of our own."""
+    async with httpx.AsyncClient(base_url=BASE_URL, http2=True) as client:
+        await test_health(client)
 
 
 if __name__ == "__main__":
-    asyncio.run(test_health())
\ No newline at end of file
+    run(main())
@@ -1,29 +1,31 @@
 #!/usr/bin/env python
 """Simple test for time agent."""
 
-import httpx
 import json
 
+import orjson
+
+from _http import client
+
+# Request body, serialized once at import
+TOKYO_QUERY = orjson.dumps({
+    "jsonrpc": "2.0",
+    "method": "message",
+    "params": {
+        "messages": [
+            {"role": "user", "content": "What time is it in Tokyo?"}
+        ]
+    },
+    "id": "test-tokyo-1"
+})
+
 
 def test_time_query():
     """Test a simple time query."""
-    url = "http://localhost:10001/message"
-    
-    message = {
-        "jsonrpc": "2.0",
-        "method": "message",
-        "params": {
-            "messages": [
-                {"role": "user", "content": "What time is it in Tokyo?"}
-            ]
-        },
-        "id": "test-tokyo-1"
-    }
-    
     print("Sending query: What time is it in Tokyo?")
     
     try:
-        response = httpx.post(url, json=message, timeout=30.0)
+        response = client().post("/message", content=TOKYO_QUERY)
         print(f"\nStatus: {response.status_code}")
         print(f"Response: {json.dumps(response.json(), indent=2)}")
     except Exception as e:
@@ -0,0 +1,83 @@
+"""Tests for the TimeAgent reply cache."""
+
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_openai import ChatOpenAI
+
+from src.time_agent.core import agent as agent_module
+from src.time_agent.core.agent import TimeAgent
+
+
+class _FakeGraph:
+    """Graph stand-in that answers with a fixed set of new messages."""
+    
+    def __init__(self, *new_messages):
+        self.new_messages = list(new_messages)
+        self.calls = 0
+    
+    async def ainvoke(self, state):
+        self.calls += 1
+        return {"messages": [*state["messages"], *self.new_messages]}
+
+
+def _agent(graph: _FakeGraph) -> TimeAgent:
+    agent = TimeAgent(model=ChatOpenAI(api_key="test"))
+    agent.graph = graph
+    return agent
+
+
+def _tool_call(name: str, **args) -> AIMessage:
+    return AIMessage(content="", tool_calls=[{"name": name, "args": args, "id": "call-1"}])
+
+
+@pytest.mark.asyncio
+async def test_repeat_served_from_cache_within_ttl(monkeypatch):
+    clock = [100.0]
+    # A fixed wall clock keeps the run inside one minute
+    monkeypatch.setattr(
+        agent_module, "time", SimpleNamespace(monotonic=lambda: clock[0], time=lambda: 600.0)
+    )
+    graph = _FakeGraph(
+        _tool_call("convert_time", source_timezone="UTC", time="12:00",
+                   target_timezone="Asia/Tokyo"),
+        ToolMessage(content="21:00", tool_call_id="call-1"),
+        AIMessage(content="It is 21:00 in Tokyo."),
+    )
+    agent = _agent(graph)
+    state = {"messages": [HumanMessage(content="Convert 12:00 UTC to Tokyo")]}
+    
+    first = await agent.invoke(state)
+    second = await agent.invoke({"messages": [HumanMessage(content="Convert  12:00 UTC to Tokyo")]})
+    assert graph.calls == 1
+    assert second["messages"][1:] == first["messages"][1:]
+    
+    clock[0] += agent_module.RESPONSE_CACHE_TTL
+    await agent.invoke(state)
+    assert graph.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_current_time_replies_are_not_cached():
+    graph = _FakeGraph(
+        _tool_call("get_current_time", timezone="UTC"),
+        ToolMessage(content="12:00", tool_call_id="call-1"),
+        AIMessage(content="It is 12:00 UTC."),
+    )
+    agent = _agent(graph)
+    state = {"messages": [HumanMessage(content="What time is it?")]}
+    
+    await agent.invoke(state)
+    await agent.invoke(state)
+    assert graph.calls == 2
+
+
+def test_key_keeps_case_and_tool_inputs():
+    key = TimeAgent._cache_key
+    
+    assert key([HumanMessage(content="time in  CET")]) == key([HumanMessage(content="time in CET")])
+    assert key([HumanMessage(content="time in CET")]) != key([HumanMessage(content="time in cet")])
+    assert key([_tool_call("convert_time", time="10:00")]) != key(
+        [_tool_call("convert_time", time="11:00")]
+    )
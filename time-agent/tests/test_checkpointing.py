@@ -0,0 +1,230 @@
+"""Tests for checkpoint persistence and task state syncing."""
+
+import asyncio
+
+import pytest
+
+from src.time_agent.checkpointing import (
+    A2ACheckpointer,
+    MemoryBackend,
+    StateSynchronizer,
+    state_synchronizer,
+)
+from src.time_agent.common.exceptions import CheckpointError
+from src.time_agent.protocol.task_manager import TaskManager
+
+
+def _config(thread_id: str) -> dict:
+    """Checkpointer config addressing a thread's latest checkpoint."""
+    return {"configurable": {"thread_id": thread_id}}
+
+
+@pytest.fixture
+def synchronizer() -> StateSynchronizer:
+    return StateSynchronizer(TaskManager(), A2ACheckpointer(MemoryBackend()))
+
+
+@pytest.mark.asyncio
+async def test_final_checkpoint_not_overtaken_by_running_flush(synchronizer):
+    task = await synchronizer.task_manager.create_task({}, task_id="task-1")
+    await synchronizer.sync_task_to_checkpoint(task, {"id": "cp-sync"})
+    
+    # Let a flush take the queued sync and start handing it to the checkpointer
+    flush = asyncio.create_task(synchronizer._flush_pending())
+    await asyncio.sleep(0)
+    
+    await synchronizer.mark_checkpoint_on_completion("task-1", {"id": "cp-final"})
+    await flush
+    await synchronizer.flush()
+    
+    latest = await synchronizer.checkpointer.aget(_config("task-1"))
+    assert latest["id"] == "cp-final"
+
+
+class _FailingBackend(MemoryBackend):
+    """Memory backend that refuses every save."""
+    
+    async def save_checkpoint(self, thread_id, checkpoint_id, data, metadata=None):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_queued_write_visible_after_flush():
+    checkpointer = A2ACheckpointer(MemoryBackend())
+    
+    await checkpointer.aput(_config("thread-1"), {"id": "cp-1", "v": 1})
+    await checkpointer.flush()
+    
+    assert await checkpointer.storage.load_checkpoint("thread-1", "cp-1") is not None
+    assert (await checkpointer.aget(_config("thread-1")))["v"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_queued_write_raised_once_by_flush():
+    checkpointer = A2ACheckpointer(_FailingBackend())
+    
+    await checkpointer.aput(_config("thread-1"), {"id": "cp-1"})
+    
+    with pytest.raises(CheckpointError, match="cp-1"):
+        await checkpointer.flush()
+    await checkpointer.flush()
+
+
+@pytest.mark.asyncio
+async def test_failed_queued_write_raised_by_aget():
+    checkpointer = A2ACheckpointer(_FailingBackend())
+    
+    await checkpointer.aput(_config("thread-1"), {"id": "cp-1"})
+    
+    with pytest.raises(CheckpointError):
+        await checkpointer.aget(_config("thread-1"))
+
+
+class _ThreadFailingBackend(MemoryBackend):
+    """Memory backend that refuses saves for one thread."""
+    
+    async def save_checkpoint(self, thread_id, checkpoint_id, data, metadata=None):
+        if thread_id == "broken":
+            return False
+        return await super().save_checkpoint(thread_id, checkpoint_id, data, metadata)
+
+
+@pytest.mark.asyncio
+async def test_failed_write_reported_only_to_its_thread():
+    checkpointer = A2ACheckpointer(_ThreadFailingBackend())
+    
+    await checkpointer.aput(_config("broken"), {"id": "cp-1"})
+    await checkpointer.aput(_config("thread-1"), {"id": "cp-2"})
+    
+    assert (await checkpointer.aget(_config("thread-1")))["id"] == "cp-2"
+    with pytest.raises(CheckpointError, match="broken"):
+        await checkpointer.aget(_config("broken"))
+    await checkpointer.flush()
+
+
+@pytest.mark.asyncio
+async def test_positional_new_versions_do_not_make_write_durable():
+    checkpointer = A2ACheckpointer(MemoryBackend())
+    
+    await checkpointer.aput(_config("thread-1"), {"id": "cp-1"}, {}, {"messages": 1})
+    
+    # Queued, not yet written through
+    assert await checkpointer.storage.load_checkpoint("thread-1") is None
+    await checkpointer.flush()
+    assert await checkpointer.storage.load_checkpoint("thread-1") is not None
+
+
+@pytest.mark.asyncio
+async def test_close_stops_writer():
+    checkpointer = A2ACheckpointer(MemoryBackend())
+    await checkpointer.aput(_config("thread-1"), {"id": "cp-1"})
+    writer = checkpointer._writer_task
+    
+    await checkpointer.flush()
+    await checkpointer.close()
+    
+    assert writer.cancelled()
+    assert checkpointer._writer_task is None
+
+
+class _RejectingCheckpointer(A2ACheckpointer):
+    """Checkpointer that fails every save."""
+    
+    async def aput(self, config, checkpoint, metadata=None, new_versions=None, *, durable=False):
+        raise ValueError("storage unavailable")
+
+
+@pytest.mark.asyncio
+async def test_syncs_of_a_task_coalesce(synchronizer):
+    task = await synchronizer.task_manager.create_task({}, task_id="task-1")
+    
+    assert await synchronizer.sync_task_to_checkpoint(task, {"id": "cp-a"})
+    assert await synchronizer.sync_task_to_checkpoint(task, {"id": "cp-b"})
+    assert list(synchronizer._pending) == ["task-1"]
+    
+    await synchronizer.flush()
+    
+    checkpoints = await synchronizer.checkpointer.alist_metadata(_config("task-1"))
+    assert [cp["checkpoint_id"] for cp in checkpoints] == ["cp-b"]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_before_interval(synchronizer, monkeypatch):
+    monkeypatch.setattr(state_synchronizer, "SYNC_BATCH_SIZE", 2)
+    monkeypatch.setattr(state_synchronizer, "SYNC_FLUSH_INTERVAL", 60.0)
+    
+    for task_id in ("task-1", "task-2"):
+        task = await synchronizer.task_manager.create_task({}, task_id=task_id)
+        await synchronizer.sync_task_to_checkpoint(task, {"id": f"cp-{task_id}"})
+    
+    await asyncio.sleep(0.05)
+    assert synchronizer._pending == {}
+    
+    await synchronizer.checkpointer.flush()
+    for task_id in ("task-1", "task-2"):
+        assert await synchronizer.checkpointer.storage.load_checkpoint(task_id) is not None
+
+
+@pytest.mark.asyncio
+async def test_failed_sync_raised_by_flush():
+    synchronizer = StateSynchronizer(TaskManager(), _RejectingCheckpointer(MemoryBackend()))
+    task = await synchronizer.task_manager.create_task({}, task_id="task-1")
+    
+    assert await synchronizer.sync_task_to_checkpoint(task, {"id": "cp-1"})
+    
+    with pytest.raises(CheckpointError, match="task-1"):
+        await synchronizer.flush()
+    await synchronizer.flush()
+
+
+@pytest.mark.asyncio
+async def test_failed_final_checkpoint_raises_and_keeps_completion():
+    synchronizer = StateSynchronizer(TaskManager(), A2ACheckpointer(_FailingBackend()))
+    await synchronizer.task_manager.create_task({}, task_id="task-1")
+    
+    with pytest.raises(CheckpointError, match="task-1"):
+        await synchronizer.mark_checkpoint_on_completion("task-1", {"id": "cp-final"})
+    
+    task = await synchronizer.task_manager.get_task("task-1")
+    assert task.status.value == "completed"
+
+
+class _UnreadableBackend(MemoryBackend):
+    """Memory backend whose reads always fail."""
+    
+    async def load_checkpoint(self, thread_id, checkpoint_id=None):
+        raise OSError("disk unavailable")
+
+
+@pytest.mark.asyncio
+async def test_unreadable_checkpoint_raised_by_restore():
+    synchronizer = StateSynchronizer(TaskManager(), A2ACheckpointer(_UnreadableBackend()))
+    await synchronizer.task_manager.create_task({}, task_id="task-1")
+    
+    with pytest.raises(CheckpointError, match="disk unavailable"):
+        await synchronizer.restore_from_checkpoint("task-1")
+
+
+class _TaskFailingCheckpointer(A2ACheckpointer):
+    """Checkpointer that fails every save of one task."""
+    
+    async def aput(self, config, checkpoint, metadata=None, new_versions=None, *, durable=False):
+        if config["configurable"]["thread_id"] == "task-a":
+            raise ValueError("storage unavailable")
+        return await super().aput(config, checkpoint, metadata, new_versions, durable=durable)
+
+
+@pytest.mark.asyncio
+async def test_failed_sync_reported_only_to_its_task():
+    synchronizer = StateSynchronizer(TaskManager(), _TaskFailingCheckpointer(MemoryBackend()))
+    for task_id in ("task-a", "task-b"):
+        task = await synchronizer.task_manager.create_task({}, task_id=task_id)
+        await synchronizer.sync_task_to_checkpoint(task, {"id": f"cp-{task_id}"})
+    await synchronizer._flush_pending()
+    
+    restored = await synchronizer.restore_from_checkpoint("task-b")
+    assert restored["id"] == "cp-task-b"
+    
+    with pytest.raises(CheckpointError, match="task-a"):
+        await synchronizer.flush("task-a")
+    await synchronizer.flush()
@@ -0,0 +1,89 @@
+"""Tests for event publishing through EventQueue."""
+
+import orjson
+import pytest
+from langchain_core.messages import AIMessage
+
+from src.time_agent.adapters import stream_converter
+from src.time_agent.adapters.stream_converter import StreamConverterAdapter
+from src.time_agent.streaming.event_queue import EventQueue, TaskEvent
+
+
+def _payload(frame: bytes) -> dict:
+    """Decode the JSON data line of an SSE frame."""
+    data = next(line for line in frame.split(b"\n") if line.startswith(b"data: "))
+    return orjson.loads(data[len(b"data: "):])
+
+
+async def _agent_stream(*chunks):
+    """Yield the given chunks as an agent stream."""
+    for chunk in chunks:
+        yield chunk
+
+
+class _RecordingQueue(EventQueue):
+    """Event queue that records the size of each batch publish."""
+    
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+    
+    async def put_many(self, events):
+        self.batches.append(len(events))
+        await super().put_many(events)
+
+
+class _FailingQueue(EventQueue):
+    """Event queue whose batch publish always fails."""
+    
+    async def put_many(self, events):
+        raise TypeError("cannot publish")
+
+
+@pytest.mark.asyncio
+async def test_put_many_serializes_langchain_messages():
+    queue = EventQueue()
+    message = AIMessage(content="It is noon in Tokyo")
+    
+    await queue.put_many([TaskEvent("task-1", "agent_update", {"messages": [message]})])
+    
+    [frame] = queue.get_history()
+    assert frame.startswith(b"id: 1\n")
+    assert _payload(frame)["data"] == {"messages": [str(message)]}
+
+
+@pytest.mark.asyncio
+async def test_convert_and_queue_publishes_agent_updates():
+    queue = EventQueue()
+    adapter = StreamConverterAdapter(queue)
+    stream = _agent_stream({"agent": {"messages": [AIMessage(content="noon")]}})
+    
+    await adapter.convert_and_queue(stream, "task-1")
+    
+    [frame] = queue.get_history()
+    assert _payload(frame)["type"] == "agent_update"
+
+
+@pytest.mark.asyncio
+async def test_convert_and_queue_publishes_only_error_on_failure():
+    queue = _FailingQueue()
+    adapter = StreamConverterAdapter(queue)
+    
+    await adapter.convert_and_queue(_agent_stream("a", "b"), "task-1")
+    
+    [frame] = queue.get_history()
+    payload = _payload(frame)
+    assert payload["type"] == "error"
+    assert payload["data"] == {"error": "cannot publish"}
+
+
+@pytest.mark.asyncio
+async def test_convert_and_queue_publishes_ready_events_as_one_batch(monkeypatch):
+    monkeypatch.setattr(stream_converter, "QUEUE_BATCH_SIZE", 2)
+    queue = _RecordingQueue()
+    adapter = StreamConverterAdapter(queue)
+    
+    await adapter.convert_and_queue(_agent_stream("a", "b", "c"), "task-1")
+    
+    assert queue.batches == [2, 1]
+    assert [_payload(frame)["data"] for frame in queue.get_history()] == ["a", "b", "c"]
@@ -0,0 +1,22 @@
+"""Tests for LangGraphWrapper state creation."""
+
+from langgraph.graph.message import add_messages
+
+from src.time_agent.adapters.langgraph_wrapper import LangGraphWrapper
+
+
+def test_cached_history_is_not_shared_between_runs():
+    wrapper = LangGraphWrapper(agent=None)
+    history = [{"role": "user", "content": "What time is it in Tokyo?"}]
+    
+    first = wrapper._create_state(history, "thread-1")["messages"]
+    # The graph's reducer assigns ids to the messages it is given
+    add_messages([], first)
+    assert first[0].id is not None
+    
+    followup = [*history, {"role": "assistant", "content": "It is 21:00."}]
+    second = wrapper._create_state(followup, "thread-1")["messages"]
+    
+    assert [msg.content for msg in second] == [msg["content"] for msg in followup]
+    assert second[0] is not first[0]
+    assert second[0].id is None
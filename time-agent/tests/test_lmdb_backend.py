@@ -0,0 +1,143 @@
+"""Tests for the LMDB checkpoint storage backend."""
+
+import dataclasses
+import os
+from datetime import datetime
+
+import pytest
+
+from src.time_agent.adapters import a2a_executor
+from src.time_agent.checkpointing import LMDBBackend, MemoryBackend, lmdb_backend
+from src.time_agent.common.exceptions import ConfigurationError
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = LMDBBackend(str(tmp_path), compress_threshold=64, offload_threshold=128)
+    yield backend
+    backend.close()
+
+
+def _blobs(tmp_path) -> list:
+    """Blob files currently on disk."""
+    return os.listdir(tmp_path / "blobs")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("data", [
+    b"small",
+    b"compressible " * 100,
+    os.urandom(4096),
+], ids=["raw", "zstd", "blob"])
+async def test_round_trip(backend, data):
+    assert await backend.save_checkpoint("thread-1", "cp-1", data, {"step": 1})
+    
+    assert await backend.load_checkpoint("thread-1", "cp-1") == data
+    assert await backend.load_checkpoint("thread-1") == data
+    assert await backend.batch_load_checkpoint("thread-1", ["cp-1", "missing"]) == [data, None]
+
+
+@pytest.mark.asyncio
+async def test_latest_and_listing_order(backend):
+    for n in range(3):
+        await backend.save_checkpoint("thread-1", f"cp-{n}", b"%d" % n, {"step": n})
+    await backend.save_checkpoint("thread-2", "other", b"x")
+    
+    assert await backend.load_checkpoint("thread-1") == b"2"
+    listed = await backend.list_checkpoints_meta("thread-1", limit=2)
+    assert [(cp["id"], cp["metadata"]) for cp in listed] == [
+        ("cp-2", {"step": 2}),
+        ("cp-1", {"step": 1}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_overwrite_bumps_version_and_becomes_latest(backend, tmp_path):
+    await backend.save_checkpoint("thread-1", "cp-1", os.urandom(4096))
+    await backend.save_checkpoint("thread-1", "cp-2", b"second")
+    await backend.save_checkpoint("thread-1", "cp-1", b"replaced")
+    
+    assert await backend.load_checkpoint("thread-1") == b"replaced"
+    listed = await backend.list_checkpoints("thread-1")
+    assert [(cp["id"], cp["version"]) for cp in listed] == [("cp-1", 2), ("cp-2", 1)]
+    # The offloaded payload it replaced is gone
+    assert _blobs(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_order_survives_clock_stepping_back(backend, monkeypatch):
+    clock = iter([2_000_000_000_000_000_000, 1_000_000_000_000_000_000, 500_000_000_000_000_000])
+    monkeypatch.setattr(lmdb_backend.time, "time_ns", lambda: next(clock))
+    
+    for n in range(3):
+        await backend.save_checkpoint("thread-1", f"cp-{n}", b"%d" % n)
+    
+    assert await backend.load_checkpoint("thread-1") == b"2"
+    listed = await backend.list_checkpoints("thread-1")
+    assert [cp["id"] for cp in listed] == ["cp-2", "cp-1", "cp-0"]
+
+
+@pytest.mark.asyncio
+async def test_cleanup_keeps_newest(backend, tmp_path):
+    for n in range(4):
+        await backend.save_checkpoint("thread-1", f"cp-{n}", os.urandom(4096))
+    
+    assert await backend.cleanup_old_checkpoints("thread-1", keep_count=1) == 3
+    
+    assert [cp["id"] for cp in await backend.list_checkpoints("thread-1")] == ["cp-3"]
+    assert await backend.load_checkpoint("thread-1", "cp-0") is None
+    assert len(_blobs(tmp_path)) == 1
+
+
+@pytest.mark.asyncio
+async def test_delete(backend):
+    await backend.save_checkpoint("thread-1", "cp-1", b"data")
+    
+    assert await backend.delete_checkpoint("thread-1", "cp-1")
+    assert not await backend.delete_checkpoint("thread-1", "cp-1")
+    assert await backend.load_checkpoint("thread-1") is None
+
+
+@pytest.mark.asyncio
+async def test_metadata_without_json_form(backend):
+    class Step:
+        def __str__(self):
+            return "step-1"
+    
+    completed_at = datetime(2025, 1, 1, 12, 0)
+    await backend.save_checkpoint(
+        "thread-1", "cp-1", b"data", {"completed_at": completed_at, "step": Step()}
+    )
+    
+    [cp] = await backend.list_checkpoints_meta("thread-1")
+    assert cp["metadata"] == {"completed_at": "2025-01-01T12:00:00Z", "step": "step-1"}
+
+
+def test_backend_selected_by_settings(tmp_path, monkeypatch):
+    def select(**overrides):
+        monkeypatch.setattr(
+            a2a_executor, "settings", dataclasses.replace(a2a_executor.settings, **overrides)
+        )
+        return a2a_executor.TimeAgentExecutor._create_storage_backend()
+    
+    assert isinstance(select(checkpoint_backend="memory"), MemoryBackend)
+    
+    backend = select(checkpoint_backend="lmdb", checkpoint_path=str(tmp_path))
+    assert isinstance(backend, LMDBBackend)
+    backend.close()
+    
+    with pytest.raises(ConfigurationError):
+        select(checkpoint_backend="redis")
+
+
+@pytest.mark.asyncio
+async def test_failed_resave_keeps_committed_blob(backend, tmp_path):
+    original = os.urandom(4096)
+    await backend.save_checkpoint("thread-1", "cp-1", original)
+    
+    # Non-string metadata keys make the write transaction fail
+    with pytest.raises(TypeError):
+        await backend.save_checkpoint("thread-1", "cp-1", os.urandom(4096), {1: "bad"})
+    
+    assert await backend.load_checkpoint("thread-1", "cp-1") == original
+    assert len(_blobs(tmp_path)) == 1
@@ -0,0 +1,50 @@
+"""Tests for the in-memory checkpoint storage backend."""
+
+import os
+
+import pytest
+import zstandard as zstd
+
+from src.time_agent.checkpointing import MemoryBackend, memory_backend
+
+
+def _payload(turns: int) -> bytes:
+    """A checkpoint payload repeating the transcript of earlier turns."""
+    message = b'{"role": "user", "content": "time in zone %d?", "id": "%s"}'
+    return b"".join(
+        message % (n, os.urandom(4).hex().encode()) for n in range(turns)
+    ) * 40
+
+
+@pytest.mark.asyncio
+async def test_dictionaries_are_trained_and_bounded(monkeypatch):
+    trained = []
+    train = zstd.train_dictionary
+    
+    def spy(size, samples):
+        trained.append(train(size, samples))
+        return trained[-1]
+    
+    monkeypatch.setattr(memory_backend.zstd, "train_dictionary", spy)
+    backend = MemoryBackend()
+    payloads = [_payload(turns) for turns in range(1, 3 * memory_backend.ZSTD_DICT_INTERVAL + 1)]
+    
+    for n, data in enumerate(payloads):
+        await backend.save_checkpoint("thread-1", f"cp-{n}", data)
+    
+    assert len(trained) == 3
+    assert all(len(zdict.as_bytes()) <= memory_backend.ZSTD_DICT_SIZE for zdict in trained)
+    ids = [f"cp-{n}" for n in range(len(payloads))]
+    assert await backend.batch_load_checkpoint("thread-1", ids) == payloads
+
+
+@pytest.mark.asyncio
+async def test_records_share_their_dictionary_codec():
+    backend = MemoryBackend()
+    for n in range(memory_backend.ZSTD_DICT_INTERVAL + 2):
+        await backend.save_checkpoint("thread-1", f"cp-{n}", _payload(n + 1))
+    
+    records = list(backend._storage["thread-1"].values())
+    assert records[0].codec is None
+    # Saves after training reuse the thread's one compressor/decompressor pair
+    assert records[-1].codec is records[-2].codec is backend._zdicts["thread-1"]
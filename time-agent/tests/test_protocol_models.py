@@ -0,0 +1,107 @@
+"""Tests for A2A request validation."""
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from src.time_agent.protocol.message_handler import MessageHandler
+from src.time_agent.protocol.models import (
+    A2AMessage,
+    A2ARequest,
+    GetTaskRequest,
+    LegacyMessageRequest,
+    SendMessageRequest,
+    StreamMessageRequest,
+)
+from src.time_agent.protocol.validators import ProtocolValidator
+
+
+def _send_body(method: str = "message/send") -> dict:
+    """A message/send body as sent by A2A clients."""
+    return {
+        "jsonrpc": "2.0",
+        "method": method,
+        "params": {
+            "message": {
+                "messageId": "msg-1",
+                "role": "user",
+                "parts": [{"kind": "text", "text": "What time is it in Seoul?"}],
+                "contextId": "ctx-1"
+            }
+        },
+        "id": 1
+    }
+
+
+def test_message_send_validates():
+    request = A2ARequest.validate_python(_send_body())
+    
+    assert isinstance(request, SendMessageRequest)
+    assert request.params.message.role == "user"
+    assert request.params.message.parts[0]["text"] == "What time is it in Seoul?"
+    # Unmodelled fields are kept
+    assert request.params.message.messageId == "msg-1"
+
+
+def test_message_stream_validates():
+    request = A2ARequest.validate_python(_send_body("message/stream"))
+    
+    assert isinstance(request, StreamMessageRequest)
+
+
+def test_message_send_accepted_by_validator_and_handler():
+    assert ProtocolValidator.validate_a2a_message(_send_body()) == (True, None)
+    assert isinstance(MessageHandler.parse_message(_send_body()), SendMessageRequest)
+
+
+def test_message_send_requires_message():
+    body = _send_body()
+    body["params"] = {"messages": [{"role": "user", "content": "hi"}]}
+    
+    with pytest.raises(ValidationError):
+        A2ARequest.validate_python(body)
+
+
+def test_legacy_message_validates():
+    request = A2ARequest.validate_python({
+        "jsonrpc": "2.0",
+        "method": "message",
+        "params": {"messages": [{"role": "user", "content": "What time is it?"}]},
+        "id": "test-1"
+    })
+    
+    assert isinstance(request, LegacyMessageRequest)
+    assert request.params.messages[0]["content"] == "What time is it?"
+
+
+def test_task_and_unknown_methods():
+    get = A2ARequest.validate_python({"method": "tasks/get", "params": {"id": "t1"}})
+    other = A2ARequest.validate_python({"method": "agent/info", "params": {}})
+    
+    assert isinstance(get, GetTaskRequest)
+    assert type(other) is A2AMessage
+
+
+def test_parse_message_accepts_raw_body():
+    body = orjson.dumps(_send_body())
+    
+    assert isinstance(MessageHandler.parse_message(body), SendMessageRequest)
+    assert isinstance(MessageHandler.parse_message(body.decode()), SendMessageRequest)
+    assert MessageHandler.parse_message(b'{"jsonrpc": "2.0", "method": "message/send"') is None
+
+
+def test_streaming_event_is_an_sse_frame():
+    frame = MessageHandler.format_streaming_event("status", {"state": "working"}, "task-1")
+    
+    assert frame.startswith(b"data: ") and frame.endswith(b"\n\n")
+    assert orjson.loads(frame[6:]) == {
+        "event": "status",
+        "data": {"state": "working"},
+        "task_id": "task-1"
+    }
+
+
+def test_city_takes_priority_over_alias():
+    text = "what time is it in est for someone in tokyo"
+    assert ProtocolValidator._extract_timezone_from_text(text) == "Asia/Tokyo"
+    assert ProtocolValidator._extract_timezone_from_text("what time is it in pst") == "America/Los_Angeles"
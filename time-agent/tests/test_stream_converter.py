@@ -0,0 +1,30 @@
+"""Tests for LangGraph stream conversion."""
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.time_agent.streaming.stream_converter import StreamConverter
+
+
+def test_final_response_is_last_ai_message():
+    messages = [
+        HumanMessage(content="What time is it in Tokyo?"),
+        AIMessage(content="It is noon in Tokyo."),
+        HumanMessage(content="Thanks"),
+    ]
+    
+    response = StreamConverter.format_final_response(messages)
+    
+    assert response["data"] == {"content": "It is noon in Tokyo.", "tool_calls": []}
+
+
+def test_final_response_scans_from_start():
+    messages = [
+        AIMessage(content="Earlier answer"),
+        HumanMessage(content="What time is it in Paris?"),
+    ]
+    
+    assert StreamConverter.format_final_response(messages)["data"]["content"] == "Earlier answer"
+    assert StreamConverter.format_final_response(messages, start=1)["data"] == {
+        "content": "No response generated",
+        "tool_calls": []
+    }